@@ -74,14 +74,10 @@ class ScreenshotCapture:
                 table_region=table_region,
             )
 
-            # Capture screenshot of the specific region
+            # Capture screenshot of the specific region; the coords dict
+            # already has exactly the clip keys, so pass it through
             screenshot_bytes = await self.browser_manager.page.screenshot(
-                clip={
-                    "x": screenshot_coords["x"],
-                    "y": screenshot_coords["y"],
-                    "width": screenshot_coords["width"],
-                    "height": screenshot_coords["height"],
-                },
+                clip=screenshot_coords,
                 type="png",
             )
 
@@ -2,17 +2,99 @@
 Thread-safe JSON file writing using portalocker.
 
 Ensures safe concurrent writes from multiple table threads.
+
+Rounds are appended to a per-table JSON Lines journal next to the table
+file (table_1.json -> table_1.rounds.jsonl) instead of rewriting the whole
+rounds list each time. The journal append is the commit point for a round:
+read() merges the journal back in, and update() / compact() fold it into the
+table file. Statistics are derived from the merged rounds whenever the
+journal is folded, so they can never disagree with it.
 """
 
 import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 import portalocker
 
 from ..utils.logger import get_logger
 
 logger = get_logger("json_writer")
 
+# Prefer orjson when installed; files are read and written as UTF-8 bytes
+try:
+    import orjson
+
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    def _dumps_line(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+    def _dumps_line(data: Any) -> bytes:
+        return (json.dumps(data, ensure_ascii=False) + "\n").encode("utf-8")
+
+    _loads = json.loads
+
+
+def journal_path(filepath: Path) -> Path:
+    """Get the rounds journal path for a table JSON file."""
+    filepath = Path(filepath)
+    return filepath.with_name(f"{filepath.stem}.rounds.jsonl")
+
+
+def _read_journal(path: Path) -> List[Dict[str, Any]]:
+    """Read journaled rounds, ignoring a torn trailing line."""
+    try:
+        with open(path, "rb") as f:
+            lines = f.read().split(b"\n")
+    except FileNotFoundError:
+        return []
+    # The last element is empty after a complete final line
+    return [_loads(line) for line in lines[:-1] if line]
+
+
+def _fold_journal(filepath: Path, data: Dict[str, Any]) -> bool:
+    """
+    Merge journaled rounds into data and recompute its statistics.
+
+    Returns:
+        True if the journal held any rounds
+    """
+    journaled = _read_journal(journal_path(filepath))
+    if not journaled:
+        return False
+    rounds = data.setdefault("rounds", [])
+    rounds.extend(journaled)
+
+    stats = data.setdefault("statistics", {})
+    correct = sum(1 for r in rounds if r.get("result") == "correct")
+    total_decisions = sum(1 for r in rounds if r.get("decision_made") is not None)
+    stats["total_rounds"] = len(rounds)
+    stats["correct_decisions"] = correct
+    stats["accuracy"] = (
+        round(correct / total_decisions * 100, 2)
+        if total_decisions > 0 else 0.0
+    )
+    return True
+
+
+def _rewrite(fd: int, payload: bytes) -> None:
+    """Replace the contents of an open file descriptor with payload."""
+    os.lseek(fd, 0, os.SEEK_SET)
+    os.ftruncate(fd, 0)
+    view = memoryview(payload)
+    while view:
+        view = view[os.write(fd, view):]
+
 
 class JSONWriter:
     """
@@ -33,6 +115,48 @@ class JSONWriter:
             timeout: Lock acquisition timeout in seconds
         """
         self.timeout = timeout
+        # Parent directories already created by this writer. Set membership
+        # is atomic under the GIL; a race only costs a redundant mkdir.
+        self._known_dirs = set()
+        # In-process lock per file path, taken before the file lock so
+        # threads sharing this writer queue here instead of in the kernel
+        self._path_locks: Dict[str, threading.Lock] = {}
+        self._locks_mutex = threading.Lock()
+
+    def _path_lock(self, filepath: Path) -> threading.Lock:
+        """Get the in-process lock guarding filepath."""
+        key = str(filepath)
+        lock = self._path_locks.get(key)
+        if lock is None:
+            with self._locks_mutex:
+                lock = self._path_locks.setdefault(key, threading.Lock())
+        return lock
+
+    @contextmanager
+    def _locked(self, filepath: Path, mode: str, flags, **open_kwargs):
+        """
+        Open and lock filepath, retrying if write() replaced it meanwhile.
+
+        write() swaps in a new file with os.replace, so a lock obtained on
+        the previous file would guard a file nobody reads any more.
+        """
+        while True:
+            lock = portalocker.Lock(
+                str(filepath), mode=mode, timeout=self.timeout, flags=flags, **open_kwargs
+            )
+            f = lock.acquire()
+            try:
+                current = os.path.samestat(os.fstat(f.fileno()), os.stat(filepath))
+            except FileNotFoundError:
+                current = False
+            if current:
+                break
+            lock.release()
+
+        try:
+            yield f
+        finally:
+            lock.release()
 
     def write(
         self,
@@ -41,7 +165,12 @@ class JSONWriter:
         table_id: Optional[int] = None,
     ) -> bool:
         """
-        Write data to JSON file with file locking.
+        Write data to JSON file atomically.
+
+        The document is written to a temp file in the same directory and
+        moved into place with os.replace, so readers see either the old or
+        the new file and a crash never leaves a truncated one. No fsync
+        is issued; the OS flushes in its own time.
 
         Args:
             filepath: Path to JSON file
@@ -52,19 +181,37 @@ class JSONWriter:
             True if write successful, False otherwise
         """
         filepath = Path(filepath)
+        parent = filepath.parent
 
         try:
-            # Ensure parent directory exists
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-
-            # Open file with exclusive lock
-            with portalocker.Lock(
-                str(filepath),
-                mode="w",
-                timeout=self.timeout,
-                flags=portalocker.LOCK_EX,
-            ) as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Ensure parent directory exists (once per directory)
+            if parent not in self._known_dirs:
+                parent.mkdir(parents=True, exist_ok=True)
+                self._known_dirs.add(parent)
+
+            payload = _dumps(data)
+            with self._path_lock(filepath):
+                fd, tmp_name = tempfile.mkstemp(
+                    prefix=f".{filepath.name}.", suffix=".tmp", dir=str(parent)
+                )
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(payload)
+                    os.replace(tmp_name, filepath)
+                except PermissionError:
+                    # Windows refuses to replace a file another handle has open;
+                    # fall back to an in-place write under the exclusive lock
+                    os.unlink(tmp_name)
+                    with self._locked(filepath, "ab", portalocker.LOCK_EX) as f:
+                        f.truncate(0)
+                        f.write(payload)
+                        f.flush()
+                except BaseException:
+                    os.unlink(tmp_name)
+                    raise
+
+                # data is the whole document now, so any journal is stale
+                journal_path(filepath).unlink(missing_ok=True)
 
             logger.debug(
                 f"Wrote JSON to {filepath}",
@@ -80,6 +227,8 @@ class JSONWriter:
             return False
 
         except Exception as e:
+            # The directory may have been removed since it was cached
+            self._known_dirs.discard(parent)
             logger.error(
                 f"Failed to write JSON to {filepath}: {e}",
                 extra={"table_id": table_id} if table_id else {},
@@ -112,13 +261,9 @@ class JSONWriter:
 
         try:
             # Open file with shared lock (multiple readers allowed)
-            with portalocker.Lock(
-                str(filepath),
-                mode="r",
-                timeout=self.timeout,
-                flags=portalocker.LOCK_SH,
-            ) as f:
-                data = json.load(f)
+            with self._locked(filepath, "rb", portalocker.LOCK_SH) as f:
+                data = _loads(f.read())
+                _fold_journal(filepath, data)
 
             return data
 
@@ -164,24 +309,21 @@ class JSONWriter:
 
         try:
             # Open file with exclusive lock for read-modify-write
-            with portalocker.Lock(
-                str(filepath),
-                mode="r+",
-                timeout=self.timeout,
-                flags=portalocker.LOCK_EX,
-            ) as f:
-                # Read current data
-                data = json.load(f)
+            # Unbuffered handle: one read of the whole file and raw writes
+            # on the same descriptor, nothing left to flush before unlock
+            with self._path_lock(filepath), \
+                    self._locked(filepath, "r+b", portalocker.LOCK_EX, buffering=0) as f:
+                # Read current data, folding in any journaled rounds
+                data = _loads(f.readall())
+                folded = _fold_journal(filepath, data)
 
                 # Apply update function
                 updated_data = update_func(data)
 
-                # Seek to beginning and truncate
-                f.seek(0)
-                f.truncate()
-
-                # Write updated data
-                json.dump(updated_data, f, indent=2, ensure_ascii=False)
+                # Truncate and write updated data in place
+                _rewrite(f.fileno(), _dumps(updated_data))
+                if folded:
+                    journal_path(filepath).unlink(missing_ok=True)
 
             logger.debug(
                 f"Updated JSON at {filepath}",
@@ -227,36 +369,53 @@ class JSONWriter:
         Returns:
             True if append successful, False otherwise
         """
-        def update_func(data: Dict[str, Any]) -> Dict[str, Any]:
-            if "rounds" not in data:
-                data["rounds"] = []
-            data["rounds"].append(round_data)
+        filepath = Path(filepath)
+        journal = journal_path(filepath)
+        log_extra = {"table_id": table_id} if table_id else {}
 
-            # Update statistics
-            if "statistics" not in data:
-                data["statistics"] = {}
+        try:
+            # The table file lock also guards the journal, so compaction in
+            # update() can never drop a round appended concurrently. The
+            # appended line is the only write; statistics are derived from
+            # the rounds when the journal is read or folded.
+            with self._path_lock(filepath), \
+                    self._locked(filepath, "r+b", portalocker.LOCK_EX, buffering=0):
+                with open(journal, "ab") as j:
+                    j.write(_dumps_line(round_data))
+
+            logger.debug(f"Appended round to {journal}", extra=log_extra)
+            return True
 
-            data["statistics"]["total_rounds"] = len(data["rounds"])
+        except FileNotFoundError:
+            logger.warning(f"JSON file not found for update: {filepath}", extra=log_extra)
+            return False
 
-            # Count correct decisions
-            correct = sum(
-                1 for r in data["rounds"]
-                if r.get("result") == "correct"
-            )
-            total_decisions = sum(
-                1 for r in data["rounds"]
-                if r.get("decision_made") is not None
-            )
+        except portalocker.LockException as e:
+            logger.error(f"Failed to acquire lock for update {filepath}: {e}", extra=log_extra)
+            return False
 
-            data["statistics"]["correct_decisions"] = correct
-            data["statistics"]["accuracy"] = (
-                round(correct / total_decisions * 100, 2)
-                if total_decisions > 0 else 0.0
-            )
+        except Exception as e:
+            logger.error(f"Failed to append round to {filepath}: {e}", extra=log_extra)
+            return False
 
-            return data
+    def compact(
+        self,
+        filepath: Path,
+        table_id: Optional[int] = None,
+    ) -> bool:
+        """
+        Fold a table's rounds journal back into its JSON file.
 
-        return self.update(filepath, update_func, table_id)
+        Args:
+            filepath: Path to table JSON file
+            table_id: Table ID for logging
+
+        Returns:
+            True if compaction successful (or nothing to compact)
+        """
+        if not journal_path(filepath).exists():
+            return True
+        return self.update(filepath, lambda data: data, table_id)
 
     def update_patterns(
         self,
@@ -12,9 +12,16 @@ from typing import Optional, Dict, Any, List
 import json
 
 from ..utils.logger import get_logger, TIMESTAMP_FORMAT
+from .json_writer import JSONWriter
 
 logger = get_logger("session_manager")
 
+# Fixed settings recorded in every session_config.json (read-only)
+_SESSION_SETTINGS = {
+    "screenshot_interval_fast": 100,
+    "screenshot_interval_normal": 200,
+}
+
 
 class SessionManager:
     """
@@ -46,7 +53,8 @@ class SessionManager:
 
         self._current_session_path: Optional[Path] = None
         self._session_start: Optional[str] = None
-        self._active_tables: List[int] = []
+        # Bit i set = table i registered
+        self._active_mask: int = 0
 
     @property
     def session_path(self) -> Optional[Path]:
@@ -58,6 +66,17 @@ class SessionManager:
         """Get session start timestamp."""
         return self._session_start
 
+    @property
+    def active_tables(self) -> List[int]:
+        """Get registered table IDs in ascending order."""
+        mask = self._active_mask
+        return [i for i in range(mask.bit_length()) if mask >> i & 1]
+
+    def is_table_active(self, table_id: int) -> bool:
+        """Check whether a table is registered in the current session."""
+        # A negative shift count raises; no table has a negative ID
+        return table_id >= 0 and bool(self._active_mask >> table_id & 1)
+
     def create_session(self) -> Path:
         """
         Create a new session folder.
@@ -74,7 +93,7 @@ class SessionManager:
         session_folder.mkdir(parents=True, exist_ok=True)
 
         self._current_session_path = session_folder
-        self._active_tables = []
+        self._active_mask = 0
 
         logger.info(f"Created session: {session_folder}")
 
@@ -91,12 +110,9 @@ class SessionManager:
         config = {
             "session_start": self._session_start,
             "session_end": None,
-            "tables_active": self._active_tables,
+            "tables_active": self.active_tables,
             "max_tables": self.max_tables,
-            "settings": {
-                "screenshot_interval_fast": 100,
-                "screenshot_interval_normal": 200,
-            },
+            "settings": _SESSION_SETTINGS,
         }
 
         config_path = self._current_session_path / self.SESSION_CONFIG_FILE
@@ -137,8 +153,8 @@ class SessionManager:
         if not self._current_session_path:
             raise RuntimeError("No active session. Call create_session() first.")
 
-        if table_id not in self._active_tables:
-            self._active_tables.append(table_id)
+        if not self.is_table_active(table_id):
+            self._active_mask |= 1 << table_id
             self._write_session_config()
 
         table_path = self.get_table_file_path(table_id)
@@ -171,8 +187,8 @@ class SessionManager:
         Args:
             table_id: Table ID to unregister
         """
-        if table_id in self._active_tables:
-            self._active_tables.remove(table_id)
+        if self.is_table_active(table_id):
+            self._active_mask &= ~(1 << table_id)
             self._write_session_config()
             logger.info(f"Unregistered table {table_id}")
 
@@ -180,11 +196,17 @@ class SessionManager:
         """
         End the current session.
 
-        Updates session_config.json with end timestamp.
+        Folds per-table round journals into the table files and
+        updates session_config.json with end timestamp.
         """
         if not self._current_session_path:
             return
 
+        writer = JSONWriter()
+        for journal in self._current_session_path.glob("*.rounds.jsonl"):
+            table_path = journal.with_name(journal.name[: -len(".rounds.jsonl")] + ".json")
+            writer.compact(table_path)
+
         # Update session config with end time
         config_path = self._current_session_path / self.SESSION_CONFIG_FILE
 
@@ -204,7 +226,7 @@ class SessionManager:
 
         self._current_session_path = None
         self._session_start = None
-        self._active_tables = []
+        self._active_mask = 0
 
     def list_sessions(self) -> List[Dict[str, Any]]:
         """
@@ -267,7 +289,9 @@ class SessionManager:
 
             self._current_session_path = session_dir
             self._session_start = config.get("session_start")
-            self._active_tables = config.get("tables_active", [])
+            self._active_mask = 0
+            for table_id in config.get("tables_active", []):
+                self._active_mask |= 1 << table_id
 
             logger.info(f"Loaded session: {session_path}")
             return True
@@ -289,7 +313,7 @@ class SessionManager:
         return {
             "path": str(self._current_session_path),
             "session_start": self._session_start,
-            "active_tables": self._active_tables.copy(),
+            "active_tables": self.active_tables,
             "max_tables": self.max_tables,
         }
 
@@ -6,6 +6,7 @@ handling state management, screenshot capture, and click execution.
 """
 
 import asyncio
+import json
 import threading
 import queue
 from typing import Dict, List, Optional, Any, Callable
@@ -86,13 +87,16 @@ class MultiTableManager:
         # Table trackers
         self._tables: Dict[int, TableTracker] = {}
         self._table_configs: Dict[int, Dict[str, Any]] = {}
+        # Table IDs reserved by add_table() while their tracker is built
+        self._pending_tables: set = set()
 
-        # Per-table locks
+        # Per-table locks guarding tracker updates, handed out from a pool
+        # sized for MAX_TABLES and returned on removal
         self._table_locks: Dict[int, threading.Lock] = {}
+        self._free_locks: List[threading.Lock] = [threading.Lock() for _ in range(MAX_TABLES)]
 
-        # Worker threads
-        self._worker_threads: Dict[int, threading.Thread] = {}
-        self._stop_events: Dict[int, threading.Event] = {}
+        # Last get_all_table_statuses_json() result and the snapshots it encoded
+        self._status_json_cache: Optional[tuple] = None
 
         # UI communication queue
         self.ui_queue: queue.Queue = queue.Queue()
@@ -128,17 +132,22 @@ class MultiTableManager:
         Returns:
             True if added successfully, False otherwise
         """
+        # Reserve the table ID under the global lock, then build the
+        # tracker and cache outside it so disjoint additions don't serialize
         with self._global_lock:
-            # Check table limit
-            if len(self._tables) >= MAX_TABLES:
+            # Check table limit (reserved IDs count towards it)
+            if len(self._tables) + len(self._pending_tables) >= MAX_TABLES:
                 logger.error(f"Maximum tables ({MAX_TABLES}) reached, cannot add table {table_id}")
                 return False
 
-            # Check if table already exists
-            if table_id in self._tables:
+            # Check if table already exists or is being added
+            if table_id in self._tables or table_id in self._pending_tables:
                 logger.warning(f"Table {table_id} already exists")
                 return False
 
+            self._pending_tables.add(table_id)
+
+        try:
             # Create table tracker
             tracker = TableTracker(
                 table_id=table_id,
@@ -147,7 +156,7 @@ class MultiTableManager:
             )
 
             # Store configuration
-            self._table_configs[table_id] = {
+            config = {
                 "table_region": table_region,
                 "button_coords": button_coords,
                 "timer_region": timer_region,
@@ -155,18 +164,21 @@ class MultiTableManager:
                 "red_score_region": red_score_region,
             }
 
-            # Create per-table lock
-            self._table_locks[table_id] = threading.Lock()
-
-            # Store tracker
-            self._tables[table_id] = tracker
-
             # Initialize cache
             self.cache_manager.initialize_table(table_id)
 
-            logger.info(f"Added table {table_id}", extra={"table_id": table_id})
+            # Publish the table together with its per-table lock
+            with self._global_lock:
+                self._table_configs[table_id] = config
+                self._table_locks[table_id] = self._free_locks.pop()
+                self._tables[table_id] = tracker
+        finally:
+            with self._global_lock:
+                self._pending_tables.discard(table_id)
 
-            return True
+        logger.info(f"Added table {table_id}", extra={"table_id": table_id})
+
+        return True
 
     def remove_table(self, table_id: int) -> bool:
         """
@@ -188,7 +200,7 @@ class MultiTableManager:
             # Remove from collections
             del self._tables[table_id]
             del self._table_configs[table_id]
-            del self._table_locks[table_id]
+            self._free_locks.append(self._table_locks.pop(table_id))
 
             # Remove from cache
             self.cache_manager.remove_table(table_id)
@@ -318,26 +330,31 @@ class MultiTableManager:
                 )
 
                 # Check for decision
+                click_team = None
                 if tracker.should_make_decision():
                     decision = tracker.get_decision()
-
                     if decision and tracker.is_timer_clickable():
-                        # Get canvas box for click execution (with lazy retry)
-                        canvas_box = await self.browser_manager.get_canvas_box_with_retry(timeout_ms=2000)
-                        if canvas_box:
-                            await self.click_executor.execute_two_phase_click(
-                                table_id=table_id,
-                                team=decision,
-                                canvas_box=canvas_box,
-                                table_region=config["table_region"],
-                                button_coords=config["button_coords"],
-                                confirm=True,
-                            )
-                        else:
-                            logger.warning(
-                                f"Canvas not available for click on table {table_id}, skipping click",
-                                extra={"table_id": table_id},
-                            )
+                        click_team = decision
+
+            # Click outside the table lock: it is a blocking lock and must
+            # not be held across awaits
+            if click_team:
+                # Get canvas box for click execution (with lazy retry)
+                canvas_box = await self.browser_manager.get_canvas_box_with_retry(timeout_ms=2000)
+                if canvas_box:
+                    await self.click_executor.execute_two_phase_click(
+                        table_id=table_id,
+                        team=click_team,
+                        canvas_box=canvas_box,
+                        table_region=config["table_region"],
+                        button_coords=config["button_coords"],
+                        confirm=True,
+                    )
+                else:
+                    logger.warning(
+                        f"Canvas not available for click on table {table_id}, skipping click",
+                        extra={"table_id": table_id},
+                    )
 
             # Send status update to UI
             self._send_status_update(table_id, tracker)
@@ -364,20 +381,20 @@ class MultiTableManager:
             list(self._tables.values())
         )
 
-        # Process in parallel using asyncio
-        results = {}
-        tasks = []
-
-        for tracker in tables_to_process:
-            task = asyncio.create_task(self.process_table(tracker.table_id))
-            tasks.append((tracker.table_id, task))
+        # All tables share the event loop's thread; process them concurrently
+        table_ids = [tracker.table_id for tracker in tables_to_process]
+        outcomes = await asyncio.gather(
+            *(self.process_table(table_id) for table_id in table_ids),
+            return_exceptions=True,
+        )
 
-        for table_id, task in tasks:
-            try:
-                results[table_id] = await task
-            except Exception as e:
-                logger.error(f"Task failed for table {table_id}: {e}")
+        results = {}
+        for table_id, outcome in zip(table_ids, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Task failed for table {table_id}: {outcome}")
                 results[table_id] = False
+            else:
+                results[table_id] = outcome
 
         return results
 
@@ -554,7 +571,64 @@ class MultiTableManager:
         if not tracker:
             return False
 
-        if tracker.set_patterns(patterns):
-            self.cache_manager.update_patterns(table_id, patterns)
-            return True
-        return False
+        # Called from the UI thread; taking the table lock here would
+        # stall the UI behind an in-progress process_table()
+        if not tracker.set_patterns(patterns):
+            return False
+
+        self.cache_manager.update_patterns(table_id, patterns)
+        return True
+
+    def get_table_status(self, table_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a status snapshot for a table.
+
+        Reads the tracker's status snapshot without taking its lock;
+        the returned dict is shared and must not be modified.
+
+        Args:
+            table_id: Table ID
+
+        Returns:
+            Status dictionary or None if table not found
+        """
+        tracker = self._tables.get(table_id)
+        if not tracker:
+            return None
+        return tracker.get_status_snapshot()
+
+    def get_all_table_statuses(self) -> Dict[int, Dict[str, Any]]:
+        """Get status snapshots for all tables (lock-free)."""
+        return {
+            table_id: tracker.get_status_snapshot()
+            for table_id, tracker in list(self._tables.items())
+        }
+
+    def get_all_table_statuses_json(self) -> bytes:
+        """
+        Get all table statuses encoded as UTF-8 JSON.
+
+        Trackers keep returning the same snapshot until their state changes,
+        so the encoded bytes are reused while every snapshot is the same object.
+
+        Returns:
+            JSON object mapping table ID to status
+        """
+        items = list(self._tables.items())
+        snapshots = tuple(tracker.get_status_snapshot() for _, tracker in items)
+        ids = tuple(table_id for table_id, _ in items)
+
+        cached = self._status_json_cache
+        if (
+            cached is not None
+            and cached[0] == ids
+            and len(cached[1]) == len(snapshots)
+            and all(a is b for a, b in zip(cached[1], snapshots))
+        ):
+            return cached[2]
+
+        payload = json.dumps(
+            dict(zip(ids, snapshots)), separators=(",", ":")
+        ).encode("utf-8")
+        self._status_json_cache = (ids, snapshots, payload)
+        return payload
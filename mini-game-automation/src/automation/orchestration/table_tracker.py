@@ -5,8 +5,8 @@ Tracks table state including round history, learning phase,
 scores, and decision-making state.
 """
 
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any, Tuple
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
 
@@ -15,6 +15,13 @@ from ..utils.logger import get_logger, TIMESTAMP_FORMAT
 
 logger = get_logger("table_tracker")
 
+# Winner indexed by (blue_increased << 1) | red_increased; blue takes
+# precedence if both scores rose, as before
+_WINNER_BY_SCORE_CHANGE = (None, "B", "P", "P")
+
+# Accepted round winners mapped to their canonical form
+_WINNER_CODES = {"B": "B", "P": "P", "b": "B", "p": "P"}
+
 
 class TableStatus(Enum):
     """Table status enumeration."""
@@ -41,6 +48,23 @@ class RoundResult:
     result: Optional[str]  # "correct", "incorrect", or None
 
 
+def _slotted(cls):
+    """
+    Rebuild a dataclass with __slots__ in place of a per-instance __dict__.
+
+    Backport of dataclass(slots=True), which needs Python 3.10. Field
+    defaults live in the generated __init__, so the class attributes that
+    would clash with the slot descriptors can be dropped.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = {k: v for k, v in cls.__dict__.items() if k not in names}
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_slotted
 @dataclass
 class TableState:
     """Complete state for a single table."""
@@ -112,6 +136,15 @@ class TableTracker:
 
         # Initialize state
         self.state = TableState(table_id=table_id)
+        # Joined round history, rebuilt once per round instead of per query
+        self._last_3_rounds: Optional[str] = None
+        # Status snapshot built on first read after a change and replaced
+        # wholesale, so readers on other threads can take it without locking.
+        # Writers only bump the version; the cache holds (version, snapshot).
+        self._status_version = 0
+        self._status_cache: Tuple[int, Dict[str, Any]] = (-1, {})
+        # get_state_dict() result, dropped whenever state changes
+        self._state_dict: Optional[Dict[str, Any]] = None
 
         # Pattern matcher
         self.pattern_matcher = PatternMatcher()
@@ -133,6 +166,7 @@ class TableTracker:
         try:
             self.pattern_matcher.set_patterns(patterns)
             self.state.patterns = patterns
+            self._state_dict = None
             logger.info(
                 f"Patterns set: {patterns}",
                 extra={"table_id": self.table_id},
@@ -166,21 +200,19 @@ class TableTracker:
         Returns:
             Winner ("B" or "P") if detected, None otherwise
         """
-        # Store previous scores
-        prev_blue = self.state.blue_score
-        prev_red = self.state.red_score
-
-        # Update current scores
-        self.state.blue_score = blue_score
-        self.state.red_score = red_score
+        # Shift current scores to previous and store the new ones in one go
+        state = self.state
+        prev_blue, prev_red = state.blue_score, state.red_score
+        (
+            state.previous_blue_score, state.previous_red_score,
+            state.blue_score, state.red_score,
+        ) = prev_blue, prev_red, blue_score, red_score
         self._update_timestamp()
 
-        # Detect winner by score change
-        winner = None
-        if blue_score > prev_blue:
-            winner = "P"  # Blue (Player) won
-        elif red_score > prev_red:
-            winner = "B"  # Red (Banker) won
+        # Detect winner by score change: "P" = Blue (Player), "B" = Red (Banker)
+        winner = _WINNER_BY_SCORE_CHANGE[
+            ((blue_score > prev_blue) << 1) | (red_score > prev_red)
+        ]
 
         if winner:
             logger.debug(
@@ -188,12 +220,49 @@ class TableTracker:
                 extra={"table_id": self.table_id},
             )
 
-        # Update previous scores for next comparison
-        self.state.previous_blue_score = blue_score
-        self.state.previous_red_score = red_score
-
         return winner
 
+    def add_round(self, winner: str) -> str:
+        """
+        Add a round winner to the history.
+
+        Keeps the last 3 rounds and ends the learning phase once
+        enough rounds have been watched.
+
+        Args:
+            winner: Round winner ("B" or "P", case-insensitive)
+
+        Returns:
+            The winner normalized to uppercase
+
+        Raises:
+            ValueError: If winner is not B or P
+        """
+        code = _WINNER_CODES.get(winner)
+        if code is None:
+            raise ValueError(f"Invalid round winner: {winner!r}")
+
+        self.state.rounds_watched += 1
+
+        # Keep only the last 3 in place
+        history = self.state.round_history
+        if len(history) >= 3:
+            del history[0]
+        history.append(code)
+        self._last_3_rounds = "".join(history) if len(history) == 3 else None
+
+        # Check learning phase completion
+        if self.state.learning_phase and self.state.rounds_watched >= self.LEARNING_ROUNDS_REQUIRED:
+            self.state.learning_phase = False
+            self.state.status = TableStatus.ACTIVE
+            logger.info(
+                f"Learning phase complete, now active",
+                extra={"table_id": self.table_id},
+            )
+
+        self._update_timestamp()
+        return code
+
     def record_round_result(
         self,
         winner: str,
@@ -211,22 +280,8 @@ class TableTracker:
         """
         # Increment round number
         self.state.current_round_number += 1
-        self.state.rounds_watched += 1
 
-        # Add to round history
-        self.state.round_history.append(winner)
-        # Keep only last 3
-        if len(self.state.round_history) > 3:
-            self.state.round_history = self.state.round_history[-3:]
-
-        # Check learning phase completion
-        if self.state.learning_phase and self.state.rounds_watched >= self.LEARNING_ROUNDS_REQUIRED:
-            self.state.learning_phase = False
-            self.state.status = TableStatus.ACTIVE
-            logger.info(
-                f"Learning phase complete, now active",
-                extra={"table_id": self.table_id},
-            )
+        winner = self.add_round(winner)
 
         # Determine if decision was correct
         result = None
@@ -274,9 +329,7 @@ class TableTracker:
         Returns:
             String like "BBP" or None if not enough rounds
         """
-        if len(self.state.round_history) < 3:
-            return None
-        return "".join(self.state.round_history[-3:])
+        return self._last_3_rounds
 
     def should_make_decision(self) -> bool:
         """
@@ -303,6 +356,26 @@ class TableTracker:
 
         return True
 
+    def make_decision(self) -> Optional[str]:
+        """
+        Match the round history against patterns.
+
+        Unlike get_decision(), ignores the timer and pending-decision
+        state and records nothing.
+
+        Returns:
+            "blue", "red", or None during learning or without a match
+        """
+        # Checked first: no history string or matcher call while learning
+        if self.state.learning_phase:
+            return None
+
+        last_3 = self._last_3_rounds
+        if last_3 is None:
+            return None
+
+        return self.pattern_matcher.match(last_3).decision
+
     def get_decision(self) -> Optional[str]:
         """
         Get click decision based on pattern match.
@@ -322,6 +395,7 @@ class TableTracker:
         if decision:
             self.state.last_decision = decision
             self.state.decision_pending = True
+            self._invalidate_status()
             logger.info(
                 f"Decision made: {decision} (history: {last_3})",
                 extra={"table_id": self.table_id},
@@ -370,6 +444,7 @@ class TableTracker:
     def pause(self) -> None:
         """Pause table tracking."""
         self.state.status = TableStatus.PAUSED
+        self._invalidate_status()
         logger.info(f"Table paused", extra={"table_id": self.table_id})
 
     def resume(self) -> None:
@@ -378,16 +453,19 @@ class TableTracker:
             self.state.status = TableStatus.LEARNING
         else:
             self.state.status = TableStatus.ACTIVE
+        self._invalidate_status()
         logger.info(f"Table resumed", extra={"table_id": self.table_id})
 
     def mark_stuck(self) -> None:
         """Mark table as stuck (3 consecutive failures)."""
         self.state.status = TableStatus.STUCK
+        self._invalidate_status()
         logger.warning(f"Table marked as stuck", extra={"table_id": self.table_id})
 
     def stop(self) -> None:
         """Stop table tracking."""
         self.state.status = TableStatus.STOPPED
+        self._invalidate_status()
         logger.info(f"Table stopped", extra={"table_id": self.table_id})
 
     def is_active(self) -> bool:
@@ -420,13 +498,50 @@ class TableTracker:
             "last_3_rounds": self.get_last_3_rounds(),
         }
 
+    def get_status_snapshot(self) -> Dict[str, Any]:
+        """
+        Get the current status.
+
+        The snapshot is rebuilt only when state changed since the last
+        call; the returned dict is shared and must not be modified.
+
+        Returns:
+            Status dictionary
+        """
+        version = self._status_version
+        cached_version, snapshot = self._status_cache
+        if cached_version == version:
+            return snapshot
+
+        snapshot = {
+            "table_id": self.table_id,
+            "status": self.state.status.value,
+            "timer": self.state.current_timer,
+            "last_3_rounds": self._last_3_rounds,
+            "decision": self.state.last_decision,
+            "statistics": self.get_statistics(),
+        }
+        # Tagged with the version read before building, so a change made
+        # meanwhile forces another rebuild on the next call
+        self._status_cache = (version, snapshot)
+        return snapshot
+
     def get_state_dict(self) -> Dict[str, Any]:
         """
         Get complete state as dictionary for JSON serialization.
 
+        The dict is cached until the next state change and is shared
+        between callers, so it must not be modified.
+
         Returns:
             Dictionary representation of state
         """
+        if self._state_dict is None:
+            self._state_dict = self._build_state_dict()
+        return self._state_dict
+
+    def _build_state_dict(self) -> Dict[str, Any]:
+        """Build the full state dictionary."""
         return {
             "table_id": self.table_id,
             "session_start": self.state.session_start,
@@ -448,6 +563,12 @@ class TableTracker:
             "statistics": self.get_statistics(),
         }
 
+    def _invalidate_status(self) -> None:
+        """Mark the status snapshot stale and drop the cached state dict."""
+        self._state_dict = None
+        self._status_version += 1
+
     def _update_timestamp(self) -> None:
-        """Update last_update timestamp."""
+        """Update last_update timestamp and mark the status stale."""
         self.state.last_update = datetime.now().strftime(TIMESTAMP_FORMAT)
+        self._invalidate_status()
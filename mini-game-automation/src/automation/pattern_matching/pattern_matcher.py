@@ -6,7 +6,7 @@ and returns the decision from the first matching pattern.
 """
 
 from typing import Optional, List, Dict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from .pattern_validator import PatternValidator
 from ..utils.logger import get_logger
@@ -14,12 +14,26 @@ from ..utils.logger import get_logger
 logger = get_logger("pattern_matcher")
 
 
-@dataclass
+@dataclass(frozen=True)
 class Pattern:
     """A single pattern with history and decision."""
 
     history: str  # e.g., "BBP"
     decision: str  # "B" for Red, "P" for Blue
+    # Team to click for this decision, resolved once at construction
+    team: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # B = Red (Banker), P = Blue (Player)
+        object.__setattr__(self, "team", "red" if self.decision == "B" else "blue")
+
+
+# The grammar admits only 8 histories x 2 decisions, so every valid
+# pattern is built once here and shared by all matchers
+_ALL_PATTERNS: Dict[str, Pattern] = {
+    f"{h0}{h1}{h2}-{d}": Pattern(history=f"{h0}{h1}{h2}", decision=d)
+    for h0 in "BP" for h1 in "BP" for h2 in "BP" for d in "BP"
+}
 
 
 @dataclass
@@ -57,6 +71,10 @@ class PatternMatcher:
         """
         self.validator = validator or PatternValidator()
         self._patterns: List[Pattern] = []
+        # History -> first pattern with that history (priority order)
+        self._by_history: Dict[str, Pattern] = {}
+        # String the current patterns were loaded from, None once edited
+        self._source: Optional[str] = None
 
         if patterns_string:
             self.set_patterns(patterns_string)
@@ -75,24 +93,42 @@ class PatternMatcher:
             ValueError: If pattern string is invalid
         """
         # Validate pattern format
+        # Same string as currently loaded: already validated and parsed
+        if patterns_string is not None and patterns_string == self._source:
+            return True
+
         is_valid, error = self.validator.validate(patterns_string)
         if not is_valid:
             logger.error(f"Invalid pattern string: {error}")
             raise ValueError(error)
 
-        # Parse patterns
+        # Parse patterns, normalizing case once here rather than per match
         self._patterns = []
-        for pattern_str in patterns_string.strip().split(";"):
+        for pattern_str in patterns_string.strip().upper().split(";"):
+            pattern = _ALL_PATTERNS.get(pattern_str)
+            if pattern is not None:
+                self._patterns.append(pattern)
+                continue
+
+            # Only reachable with a custom validator grammar
             parts = pattern_str.split("-")
             if len(parts) == 2:
                 self._patterns.append(Pattern(
                     history=parts[0],
                     decision=parts[1],
                 ))
+        self._rebuild_index()
+        self._source = patterns_string
 
         logger.info(f"Loaded {len(self._patterns)} patterns")
         return True
 
+    def _rebuild_index(self) -> None:
+        """Rebuild the history lookup, keeping the first pattern per history."""
+        self._by_history = {}
+        for pattern in self._patterns:
+            self._by_history.setdefault(pattern.history, pattern)
+
     def get_patterns(self) -> List[Pattern]:
         """
         Get current patterns.
@@ -127,25 +163,28 @@ class PatternMatcher:
             logger.debug(f"Invalid round history: '{last_3_rounds}'")
             return MatchResult(matched=False, pattern=None, decision=None)
 
-        # Normalize to uppercase
-        last_3_rounds = last_3_rounds.upper()
+        # Index holds the first pattern per history (first match wins).
+        # History from TableTracker is already uppercase; only uppercase
+        # the input when the direct lookup misses.
+        pattern = self._by_history.get(last_3_rounds)
+        if pattern is None:
+            normalized = last_3_rounds.upper()
+            if normalized != last_3_rounds:
+                last_3_rounds = normalized
+                pattern = self._by_history.get(last_3_rounds)
 
-        # Check each pattern in order (first match wins)
-        for pattern in self._patterns:
-            if pattern.history == last_3_rounds:
-                # Convert decision to team name
-                # B = Red (Banker), P = Blue (Player)
-                decision = "red" if pattern.decision == "B" else "blue"
+        if pattern is not None:
+            decision = pattern.team
 
-                logger.debug(
-                    f"Pattern matched: {pattern.history}-{pattern.decision} -> {decision}"
-                )
+            logger.debug(
+                f"Pattern matched: {pattern.history}-{pattern.decision} -> {decision}"
+            )
 
-                return MatchResult(
-                    matched=True,
-                    pattern=pattern,
-                    decision=decision,
-                )
+            return MatchResult(
+                matched=True,
+                pattern=pattern,
+                decision=decision,
+            )
 
         logger.debug(f"No pattern matched for: {last_3_rounds}")
         return MatchResult(matched=False, pattern=None, decision=None)
@@ -194,13 +233,18 @@ class PatternMatcher:
             True if added successfully, False otherwise
         """
         # Validate
+        history = history.upper()
+        decision = decision.upper()
         pattern_str = f"{history}-{decision}"
         is_valid, error = self.validator.validate(pattern_str)
         if not is_valid:
             logger.error(f"Invalid pattern: {error}")
             return False
 
-        self._patterns.append(Pattern(history=history, decision=decision))
+        pattern = _ALL_PATTERNS.get(pattern_str) or Pattern(history=history, decision=decision)
+        self._patterns.append(pattern)
+        self._by_history.setdefault(history, pattern)
+        self._source = None
         logger.info(f"Added pattern: {pattern_str}")
         return True
 
@@ -214,9 +258,12 @@ class PatternMatcher:
         Returns:
             True if removed, False if not found
         """
+        history = history.upper()
         for i, pattern in enumerate(self._patterns):
             if pattern.history == history:
                 self._patterns.pop(i)
+                self._rebuild_index()
+                self._source = None
                 logger.info(f"Removed pattern: {pattern.history}-{pattern.decision}")
                 return True
 
@@ -225,6 +272,8 @@ class PatternMatcher:
     def clear_patterns(self) -> None:
         """Clear all patterns."""
         self._patterns.clear()
+        self._by_history.clear()
+        self._source = None
         logger.info("All patterns cleared")
 
     def has_patterns(self) -> bool:
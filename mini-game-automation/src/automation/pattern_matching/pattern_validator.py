@@ -9,6 +9,7 @@ import re
 from typing import Tuple, Optional, List
 
 from ..utils.logger import get_logger
+from ..utils.validators import _parse_cached
 
 logger = get_logger("pattern_validator")
 
@@ -16,6 +17,10 @@ logger = get_logger("pattern_validator")
 # Pattern validation regex from architecture specification
 PATTERN_REGEX = r"^[BP]{3}-[BP](;[BP]{3}-[BP])*$"
 
+# Shared compiled form of the default regex; case-insensitive so is_valid()
+# needn't build an uppercased copy of its input
+_PATTERN_RE = re.compile(PATTERN_REGEX, re.IGNORECASE)
+
 
 class PatternValidator:
     """
@@ -36,7 +41,12 @@ class PatternValidator:
             regex_pattern: Regex for valid pattern format
         """
         self.regex_pattern = regex_pattern
-        self._compiled_regex = re.compile(regex_pattern)
+        if regex_pattern == PATTERN_REGEX:
+            self._compiled_regex = _PATTERN_RE
+        else:
+            self._compiled_regex = re.compile(regex_pattern)
+        # Custom regexes see uppercased input, as they always have
+        self._needs_upper = self._compiled_regex is not _PATTERN_RE
 
     def is_valid(self, pattern_string: str) -> bool:
         """
@@ -51,7 +61,10 @@ class PatternValidator:
         if not pattern_string or not isinstance(pattern_string, str):
             return False
 
-        return bool(self._compiled_regex.match(pattern_string.strip().upper()))
+        pattern_string = pattern_string.strip()
+        if self._needs_upper:
+            pattern_string = pattern_string.upper()
+        return self._compiled_regex.match(pattern_string) is not None
 
     def validate(self, pattern_string: str) -> Tuple[bool, Optional[str]]:
         """
@@ -154,15 +167,14 @@ class PatternValidator:
         if not is_valid:
             raise ValueError(error)
 
-        patterns = []
-        for pattern in pattern_string.strip().upper().split(";"):
-            history, decision = pattern.split("-")
-            patterns.append({
-                "history": history,
-                "decision": decision,
-            })
-
-        return patterns
+        # Splitting is memoized in the cache shared with utils.validators;
+        # fresh dicts each call so callers may mutate
+        return [
+            {"history": history, "decision": decision}
+            for history, decision in _parse_cached(
+                pattern_string.strip().upper(), self.regex_pattern
+            )
+        ]
 
     def format_pattern(self, history: str, decision: str) -> str:
         """
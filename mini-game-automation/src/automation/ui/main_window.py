@@ -6,12 +6,20 @@ and real-time status monitoring.
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-from typing import Optional, Dict, Any, Callable
+from tkinter import ttk, messagebox, scrolledtext, font
+from typing import Optional, Dict, Any, Callable, List
 import threading
 import queue
 import asyncio
+import functools
+import concurrent.futures
+import time
+from array import array
+from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
+
+import yaml
 
 from ..utils.logger import get_logger
 from ..utils.env_manager import EnvManager
@@ -19,6 +27,188 @@ from .coordinate_picker import CoordinatePicker
 
 logger = get_logger("ui.main_window")
 
+MAX_STATUS_TABLES = 6
+
+STATUS_LABELS = {
+    "active": "🟢 Active",
+    "learning": "🟡 Learning",
+    "paused": "🔴 Paused",
+    "stuck": "⚪ Stuck",
+    "stopped": "⚪ Stopped",
+}
+
+
+# Coordinate form fields, in the order they are stored in the int buffer
+COORD_FIELDS = (
+    "x", "y", "width", "height",
+    "blue_x", "blue_y", "red_x", "red_y",
+    "confirm_x", "confirm_y", "cancel_x", "cancel_y",
+    "timer_x", "timer_y", "timer_w", "timer_h",
+    "blue_score_x", "blue_score_y", "blue_score_w", "blue_score_h",
+    "red_score_x", "red_score_y", "red_score_w", "red_score_h",
+)
+_COORD_INDEX = {name: i for i, name in enumerate(COORD_FIELDS)}
+
+# Grid options shared by every coordinate label/entry pair
+_LABEL_GRID = {"sticky": tk.W, "padx": (0, 5)}
+_ENTRY_GRID = {"sticky": tk.W, "padx": (0, 10)}
+_LAST_ENTRY_GRID = {"sticky": tk.W}
+
+# Form field -> key path inside a table entry of table_regions.yaml
+CONFIG_FIELD_MAP = (
+    ("x", ("x",)),
+    ("y", ("y",)),
+    ("width", ("width",)),
+    ("height", ("height",)),
+    ("blue_x", ("buttons", "blue", "x")),
+    ("blue_y", ("buttons", "blue", "y")),
+    ("red_x", ("buttons", "red", "x")),
+    ("red_y", ("buttons", "red", "y")),
+    ("confirm_x", ("buttons", "confirm", "x")),
+    ("confirm_y", ("buttons", "confirm", "y")),
+    ("cancel_x", ("buttons", "cancel", "x")),
+    ("cancel_y", ("buttons", "cancel", "y")),
+    ("timer_x", ("timer", "x")),
+    ("timer_y", ("timer", "y")),
+    ("timer_w", ("timer", "width")),
+    ("timer_h", ("timer", "height")),
+    ("blue_score_x", ("blue_score", "x")),
+    ("blue_score_y", ("blue_score", "y")),
+    ("blue_score_w", ("blue_score", "width")),
+    ("blue_score_h", ("blue_score", "height")),
+    ("red_score_x", ("red_score", "x")),
+    ("red_score_y", ("red_score", "y")),
+    ("red_score_w", ("red_score", "width")),
+    ("red_score_h", ("red_score", "height")),
+)
+
+
+# (key path, buffer index) pairs used to build the saved coordinates dict
+_SAVE_TEMPLATE = tuple((path, _COORD_INDEX[name]) for name, path in CONFIG_FIELD_MAP)
+
+
+def _scatter_coords(values) -> Dict[str, Any]:
+    """
+    Build the nested coordinates dict from a flat buffer of field values.
+
+    Args:
+        values: Sequence indexed like COORD_FIELDS
+
+    Returns:
+        Dict shaped like a table entry of table_regions.yaml
+    """
+    coords: Dict[str, Any] = {}
+    for path, index in _SAVE_TEMPLATE:
+        node = coords
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = values[index]
+    return coords
+
+
+@functools.lru_cache(maxsize=4)
+def _load_yaml_cached(path_str: str, mtime_ns: int) -> Any:
+    """
+    Parse a YAML file, memoized on (path, mtime).
+
+    The mtime is part of the key so edits to the file are picked up.
+    The returned object is shared between calls and must not be mutated.
+    """
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path_str, "r") as f:
+        return yaml.load(f, Loader=loader)
+
+
+@dataclass
+class _TableSlots:
+    """Status variables for one table plus the last text written to each."""
+    status: tk.StringVar
+    timer: tk.StringVar
+    rounds: tk.StringVar
+    pattern: tk.StringVar
+    decision: tk.StringVar
+    last_status: str = ""
+    last_timer: str = ""
+    last_rounds: str = ""
+    last_pattern: str = ""
+    last_decision: str = ""
+
+_GUIDE_CONTENT = """
+TABLE COORDINATES CONFIGURATION GUIDE
+=====================================
+
+This guide will help you configure table region coordinates for screenshot capture.
+
+IMPORTANT: Browser must be opened first!
+Use the "Open Browser" button in the main window before configuring tables.
+
+STEP 1: Browser is Already Open
+---------------------------------
+✓ Browser should be open and showing your game
+✓ Browser window is set to 1920x1080 resolution
+✓ Game page is loaded with all tables visible
+
+STEP 2: Use Visual Coordinate Picker (EASIEST METHOD!)
+------------------------------------------------------
+🎯 NO NEED TO USE DEVTOOLS! Just click the "Pick" buttons!
+
+For Table Region:
+1. Click "📐 Pick Table Region" button
+2. A visual overlay will appear on the browser
+3. Drag your mouse to select the entire table area
+4. Release mouse - coordinates are automatically captured!
+
+For Button Positions:
+1. Click the button picker (e.g., "🔵 Pick Blue")
+2. Click directly on the button in the browser
+3. A red marker appears - coordinates are captured!
+
+For Timer/Score Regions:
+1. Click the region picker (e.g., "⏱️ Pick Timer")
+2. Drag to select the timer/score display area
+3. Release mouse - coordinates are captured!
+
+STEP 3: Review and Adjust
+---------------------------
+1. Check the captured coordinates in the form fields
+2. Adjust manually if needed
+3. Click "Validate" to check for errors
+4. Click "Save" to save configuration
+
+STEP 4: Repeat for All Tables
+-------------------------------
+1. Select next table from dropdown
+2. Use picker buttons to capture coordinates
+3. Save each table configuration
+
+MANUAL ENTRY (Alternative Method):
+-----------------------------------
+If you prefer manual entry or need to adjust:
+- Enter x, y, width, height values directly
+- Coordinates are relative to canvas (#layaCanvas)
+- Button coordinates are relative to table region
+- Canvas has a 17px horizontal offset (automatically handled)
+
+IMPORTANT NOTES:
+- All coordinates are relative to the canvas element (#layaCanvas)
+- Button coordinates are relative to the table region
+- Canvas has a 17px horizontal offset (automatically handled)
+- Make sure coordinates don't overlap between tables
+- Test with one table first before configuring all 6
+
+TROUBLESHOOTING:
+- If picker doesn't appear: Make sure browser is opened first
+- If coordinates seem wrong: Try picking again or adjust manually
+- If screenshots are wrong: Check table region coordinates
+- If clicks miss: Check button coordinates
+- If timer/score extraction fails: Check region coordinates
+- Make sure browser is at 1920x1080 resolution
+
+TIP: Use the visual picker - it's much easier than DevTools!
+
+For more help, see INSTALLATION_GUIDE.md
+""".strip()
+
 
 class MainWindow:
     """
@@ -55,6 +245,12 @@ class MainWindow:
         self.root.geometry("1200x800")
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+        # Named fonts, created once and shared by all labels
+        self._font_small = font.Font(name="AppSmall", family="TkDefaultFont", size=8)
+        self._font_help = font.Font(name="AppHelp", family="TkDefaultFont", size=9)
+        self._font_normal = font.Font(name="AppNormal", family="TkDefaultFont", size=10)
+        self._font_bold = font.Font(name="AppBold", family="TkDefaultFont", size=10, weight="bold")
+
         # Callbacks
         self.on_open_browser = on_open_browser
         self.on_start = on_start
@@ -66,7 +262,7 @@ class MainWindow:
         self.is_running = False
         self.browser_opened = False
         self.ui_queue = queue.Queue()
-        self.table_status_vars: Dict[int, Dict[str, tk.StringVar]] = {}
+        self.table_slots: List[Optional[_TableSlots]] = [None] * MAX_STATUS_TABLES
 
         # Create UI components
         self._create_widgets()
@@ -107,7 +303,7 @@ class MainWindow:
         ttk.Label(
             config_frame,
             textvariable=self.browser_status_var,
-            font=("TkDefaultFont", 9),
+            font=self._font_help,
             foreground="gray",
         ).grid(row=0, column=3, padx=(5, 0))
 
@@ -118,7 +314,7 @@ class MainWindow:
         ttk.Label(
             control_frame,
             text="Step 2: Configure →",
-            font=("TkDefaultFont", 9),
+            font=self._font_help,
         ).grid(row=0, column=0, padx=(0, 5))
 
         self.configure_tables_button = ttk.Button(
@@ -132,7 +328,7 @@ class MainWindow:
         ttk.Label(
             control_frame,
             text="Step 3: Start →",
-            font=("TkDefaultFont", 9),
+            font=self._font_help,
         ).grid(row=0, column=2, padx=(10, 5))
 
         self.start_button = ttk.Button(
@@ -179,7 +375,7 @@ class MainWindow:
         pattern_help = ttk.Label(
             pattern_frame,
             text="Format: BBP-P;BPB-B (B=Red, P=Blue)",
-            font=("TkDefaultFont", 8),
+            font=self._font_small,
             foreground="gray",
         )
         pattern_help.grid(row=1, column=1, sticky=tk.W, padx=(5, 0))
@@ -220,7 +416,7 @@ class MainWindow:
             pattern_frame,
             textvariable=self.pattern_status_var,
             foreground="green",
-            font=("TkDefaultFont", 9),
+            font=self._font_help,
         ).grid(row=4, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
 
         # Table Status Display
@@ -233,10 +429,9 @@ class MainWindow:
         self.status_scrollbar = ttk.Scrollbar(status_frame, orient="vertical", command=self.status_canvas.yview)
         self.status_scrollable_frame = ttk.Frame(self.status_canvas)
 
-        self.status_scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.status_canvas.configure(scrollregion=self.status_canvas.bbox("all"))
-        )
+        # Scroll region updates are coalesced into one idle callback per burst
+        self._scroll_pending = False
+        self.status_scrollable_frame.bind("<Configure>", self._on_status_frame_configure)
 
         self.status_canvas.create_window((0, 0), window=self.status_scrollable_frame, anchor="nw")
         self.status_canvas.configure(yscrollcommand=self.status_scrollbar.set)
@@ -263,8 +458,8 @@ class MainWindow:
 
         self.cpu_var = tk.StringVar(value="CPU: --")
         self.memory_var = tk.StringVar(value="Memory: --")
-        ttk.Label(resource_frame, textvariable=self.cpu_var, font=("TkDefaultFont", 10)).grid(row=0, column=0, sticky=tk.W)
-        ttk.Label(resource_frame, textvariable=self.memory_var, font=("TkDefaultFont", 10)).grid(row=1, column=0, sticky=tk.W)
+        ttk.Label(resource_frame, textvariable=self.cpu_var, font=self._font_normal).grid(row=0, column=0, sticky=tk.W)
+        ttk.Label(resource_frame, textvariable=self.memory_var, font=self._font_normal).grid(row=1, column=0, sticky=tk.W)
 
         # Logs
         log_frame = ttk.LabelFrame(right_panel, text="Application Logs", padding="10")
@@ -286,9 +481,21 @@ class MainWindow:
         main_frame.columnconfigure(1, weight=1)
         main_frame.rowconfigure(1, weight=1)
 
+    def _on_status_frame_configure(self, event=None):
+        """Schedule a scroll region update unless one is already pending."""
+        if self._scroll_pending:
+            return
+        self._scroll_pending = True
+        self.status_canvas.after_idle(self._apply_status_scrollregion)
+
+    def _apply_status_scrollregion(self):
+        """Recompute the status canvas scroll region."""
+        self._scroll_pending = False
+        self.status_canvas.configure(scrollregion=self.status_canvas.bbox("all"))
+
     def _create_table_status_widgets(self):
         """Create status display widgets for each table."""
-        for table_id in range(1, 7):
+        for table_id in range(1, MAX_STATUS_TABLES + 1):
             table_frame = ttk.LabelFrame(
                 self.status_scrollable_frame,
                 text=f"Table {table_id}",
@@ -298,43 +505,49 @@ class MainWindow:
             table_frame.columnconfigure(1, weight=1)
 
             # Status variables
-            self.table_status_vars[table_id] = {
-                "status": tk.StringVar(value="⚪ Stopped"),
-                "timer": tk.StringVar(value="Timer: --"),
-                "rounds": tk.StringVar(value="Last 3: ---"),
-                "pattern": tk.StringVar(value="Pattern: --"),
-                "decision": tk.StringVar(value="Decision: --"),
-            }
+            slots = _TableSlots(
+                status=tk.StringVar(value="⚪ Stopped"),
+                timer=tk.StringVar(value="Timer: --"),
+                rounds=tk.StringVar(value="Last 3: ---"),
+                pattern=tk.StringVar(value="Pattern: --"),
+                decision=tk.StringVar(value="Decision: --"),
+                last_status="⚪ Stopped",
+                last_timer="Timer: --",
+                last_rounds="Last 3: ---",
+                last_pattern="Pattern: --",
+                last_decision="Decision: --",
+            )
+            self.table_slots[table_id - 1] = slots
 
             # Status label
             ttk.Label(
                 table_frame,
-                textvariable=self.table_status_vars[table_id]["status"],
-                font=("TkDefaultFont", 10, "bold"),
+                textvariable=slots.status,
+                font=self._font_bold,
             ).grid(row=0, column=0, columnspan=2, sticky=tk.W)
 
             # Timer
             ttk.Label(
                 table_frame,
-                textvariable=self.table_status_vars[table_id]["timer"],
+                textvariable=slots.timer,
             ).grid(row=1, column=0, sticky=tk.W, padx=(0, 10))
 
             # Rounds
             ttk.Label(
                 table_frame,
-                textvariable=self.table_status_vars[table_id]["rounds"],
+                textvariable=slots.rounds,
             ).grid(row=1, column=1, sticky=tk.W)
 
             # Pattern match
             ttk.Label(
                 table_frame,
-                textvariable=self.table_status_vars[table_id]["pattern"],
+                textvariable=slots.pattern,
             ).grid(row=2, column=0, sticky=tk.W, padx=(0, 10))
 
             # Decision
             ttk.Label(
                 table_frame,
-                textvariable=self.table_status_vars[table_id]["decision"],
+                textvariable=slots.decision,
             ).grid(row=2, column=1, sticky=tk.W)
 
             # Control buttons
@@ -402,7 +615,7 @@ class MainWindow:
         self.configure_tables_button.config(state=tk.NORMAL)
         self.start_button.config(state=tk.NORMAL)  # Enable start button after browser opens
         self.log("Browser opened successfully.")
-        messagebox.showinfo(
+        self._notify(
             "Browser Opened",
             "Browser opened successfully!\n\n"
             "IMPORTANT - Manual Setup Required:\n"
@@ -439,30 +652,46 @@ class MainWindow:
             )
             return
 
-        # Confirm user has completed manual setup
-        response = messagebox.askyesno(
+        # Confirm user has completed manual setup (non-blocking, UI loop keeps running).
+        # Start stays disabled while asking so a second click cannot open another dialog.
+        self.start_button.config(state=tk.DISABLED)
+        self._confirm(
             "Ready to Start Automation?",
             "Before starting, please confirm:\n\n"
             "✓ You have navigated to the game page\n"
             "✓ You have logged in (if required)\n"
             "✓ The game page is fully loaded\n"
             "✓ Tables are visible on the page\n\n"
-            "Have you completed the manual setup?"
+            "Have you completed the manual setup?",
+            on_yes=self._on_start_setup_confirmed,
+            on_no=self._on_start_cancelled,
         )
-        if not response:
-            return
 
+    def _on_start_cancelled(self):
+        """Re-enable start after the user declined a start confirmation."""
+        if not self.is_running:
+            self.start_button.config(state=tk.NORMAL)
+
+    def _on_start_setup_confirmed(self):
+        """Continue start after the user confirmed manual setup."""
         # Check if tables are configured
         if not self._check_tables_configured():
-            response = messagebox.askyesno(
+            self._confirm(
                 "No Tables Configured",
                 "No tables are configured yet.\n\n"
                 "Do you want to start anyway?\n"
-                "(You can add tables later)"
+                "(You can add tables later)",
+                on_yes=self._start_automation,
+                on_no=self._on_start_cancelled,
             )
-            if not response:
-                return
+            return
+
+        self._start_automation()
 
+    def _start_automation(self):
+        """Switch UI to running state and invoke start callback."""
+        if self.is_running:
+            return
         self.is_running = True
         self.start_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.NORMAL)
@@ -473,6 +702,55 @@ class MainWindow:
         if self.on_start:
             self.on_start()
 
+    def _confirm(
+        self,
+        title: str,
+        message: str,
+        on_yes: Callable,
+        on_no: Optional[Callable] = None,
+    ):
+        """
+        Show a non-modal Yes/No dialog.
+
+        Unlike messagebox.askyesno this does not nest a Tk event loop, so
+        status updates and logs keep flowing while the dialog is open.
+
+        Args:
+            title: Dialog title
+            message: Dialog message
+            on_yes: Called after the dialog closes with "Yes"
+            on_no: Optional callback after the dialog closes with "No"
+        """
+        dialog = self._create_dialog(title, message)
+
+        def answer(callback: Optional[Callable]):
+            dialog.destroy()
+            if callback:
+                callback()
+
+        buttons = ttk.Frame(dialog, padding=(10, 0, 10, 10))
+        buttons.pack(fill=tk.X)
+        ttk.Button(buttons, text="Yes", command=lambda: answer(on_yes)).pack(side=tk.RIGHT)
+        ttk.Button(buttons, text="No", command=lambda: answer(on_no)).pack(side=tk.RIGHT, padx=(0, 5))
+        dialog.protocol("WM_DELETE_WINDOW", lambda: answer(on_no))
+
+    def _notify(self, title: str, message: str):
+        """Show a non-modal information dialog with an OK button."""
+        dialog = self._create_dialog(title, message)
+
+        buttons = ttk.Frame(dialog, padding=(10, 0, 10, 10))
+        buttons.pack(fill=tk.X)
+        ttk.Button(buttons, text="OK", command=dialog.destroy).pack(side=tk.RIGHT)
+
+    def _create_dialog(self, title: str, message: str) -> tk.Toplevel:
+        """Create a transient dialog window showing a message."""
+        dialog = tk.Toplevel(self.root)
+        dialog.title(title)
+        dialog.transient(self.root)
+        dialog.resizable(False, False)
+        ttk.Label(dialog, text=message, justify=tk.LEFT, padding=10).pack(fill=tk.BOTH, expand=True)
+        return dialog
+
     def _check_tables_configured(self) -> bool:
         """Check if any tables are configured."""
         # This would check with the main app if tables exist
@@ -599,38 +877,46 @@ Patterns are matched in order (first match wins).
         # Callback would be implemented by main application
 
     def update_table_status(self, table_id: int, status_data: Dict[str, Any]):
-        """Update status display for a table."""
-        if table_id not in self.table_status_vars:
+        """Update status display for a table, skipping unchanged fields."""
+        if not 1 <= table_id <= MAX_STATUS_TABLES:
+            return
+        slots = self.table_slots[table_id - 1]
+        if slots is None:
             return
-
-        vars = self.table_status_vars[table_id]
 
         # Status
-        status_map = {
-            "active": "🟢 Active",
-            "learning": "🟡 Learning",
-            "paused": "🔴 Paused",
-            "stuck": "⚪ Stuck",
-            "stopped": "⚪ Stopped",
-        }
-        status = status_data.get("status", "stopped")
-        vars["status"].set(status_map.get(status, "⚪ Unknown"))
+        status = STATUS_LABELS.get(status_data.get("status", "stopped"), "⚪ Unknown")
+        if status != slots.last_status:
+            slots.status.set(status)
+            slots.last_status = status
 
         # Timer
         timer = status_data.get("timer")
-        vars["timer"].set(f"Timer: {timer if timer is not None else '--'}")
+        timer = f"Timer: {timer if timer is not None else '--'}"
+        if timer != slots.last_timer:
+            slots.timer.set(timer)
+            slots.last_timer = timer
 
         # Last 3 rounds
         rounds = status_data.get("last_3_rounds")
-        vars["rounds"].set(f"Last 3: {rounds if rounds else '---'}")
+        rounds = f"Last 3: {rounds if rounds else '---'}"
+        if rounds != slots.last_rounds:
+            slots.rounds.set(rounds)
+            slots.last_rounds = rounds
 
         # Pattern match
         pattern = status_data.get("pattern_match")
-        vars["pattern"].set(f"Pattern: {pattern if pattern else '--'}")
+        pattern = f"Pattern: {pattern if pattern else '--'}"
+        if pattern != slots.last_pattern:
+            slots.pattern.set(pattern)
+            slots.last_pattern = pattern
 
         # Decision
         decision = status_data.get("decision")
-        vars["decision"].set(f"Decision: {decision if decision else '--'}")
+        decision = f"Decision: {decision if decision else '--'}"
+        if decision != slots.last_decision:
+            slots.decision.set(decision)
+            slots.last_decision = decision
 
     def update_resources(self, cpu_percent: float, memory_percent: float):
         """Update resource monitor display."""
@@ -685,6 +971,41 @@ Patterns are matched in order (first match wins).
 class TableConfigWindow:
     """Window for configuring table coordinates with guide."""
 
+    CONFIG_PATH = Path("config/table_regions.yaml")
+
+    # Seconds to wait for the user to finish a pick, and how often to check for close
+    PICK_TIMEOUT = 60.0
+    PICK_POLL_INTERVAL = 0.05
+
+    # Button type -> (x field, y field)
+    BUTTON_KEYS = {
+        "blue": ("blue_x", "blue_y"),
+        "red": ("red_x", "red_y"),
+        "confirm": ("confirm_x", "confirm_y"),
+        "cancel": ("cancel_x", "cancel_y"),
+    }
+
+    # Region type -> (x, y, w, h fields)
+    REGION_KEYS = {
+        "timer": ("timer_x", "timer_y", "timer_w", "timer_h"),
+        "blue_score": ("blue_score_x", "blue_score_y", "blue_score_w", "blue_score_h"),
+        "red_score": ("red_score_x", "red_score_y", "red_score_w", "red_score_h"),
+    }
+
+    # Region type -> display name used in status messages
+    REGION_TITLES = {
+        "timer": "Timer",
+        "blue_score": "Blue Score",
+        "red_score": "Red Score",
+    }
+
+    # Region type -> picker mode
+    REGION_MODES = {
+        "timer": "timer",
+        "blue_score": "score",
+        "red_score": "score",
+    }
+
     def __init__(
         self,
         parent,
@@ -710,9 +1031,22 @@ class TableConfigWindow:
         self.browser_opened = browser_opened
         self.browser_page = browser_page
         self.get_browser_event_loop = get_browser_event_loop
+        self._browser_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._picker: Optional[CoordinatePicker] = None
+
+        # One long-lived worker runs all picks, one at a time
+        self._pick_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="picker")
+        self._closing = threading.Event()
+        self.window.protocol("WM_DELETE_WINDOW", self._on_close)
 
         self._create_widgets()
 
+    def _on_close(self):
+        """Cancel any running pick, release the picker worker and close the window."""
+        self._closing.set()
+        self._pick_pool.shutdown(wait=False)
+        self.window.destroy()
+
     def _create_widgets(self):
         """Create configuration widgets."""
         # Notebook for tabs
@@ -726,105 +1060,56 @@ class TableConfigWindow:
         guide_text = scrolledtext.ScrolledText(guide_frame, wrap=tk.WORD, height=25)
         guide_text.pack(fill=tk.BOTH, expand=True)
 
-        guide_content = """
-TABLE COORDINATES CONFIGURATION GUIDE
-=====================================
-
-This guide will help you configure table region coordinates for screenshot capture.
-
-IMPORTANT: Browser must be opened first!
-Use the "Open Browser" button in the main window before configuring tables.
-
-STEP 1: Browser is Already Open
----------------------------------
-✓ Browser should be open and showing your game
-✓ Browser window is set to 1920x1080 resolution
-✓ Game page is loaded with all tables visible
-
-STEP 2: Use Visual Coordinate Picker (EASIEST METHOD!)
-------------------------------------------------------
-🎯 NO NEED TO USE DEVTOOLS! Just click the "Pick" buttons!
-
-For Table Region:
-1. Click "📐 Pick Table Region" button
-2. A visual overlay will appear on the browser
-3. Drag your mouse to select the entire table area
-4. Release mouse - coordinates are automatically captured!
-
-For Button Positions:
-1. Click the button picker (e.g., "🔵 Pick Blue")
-2. Click directly on the button in the browser
-3. A red marker appears - coordinates are captured!
-
-For Timer/Score Regions:
-1. Click the region picker (e.g., "⏱️ Pick Timer")
-2. Drag to select the timer/score display area
-3. Release mouse - coordinates are captured!
-
-STEP 3: Review and Adjust
----------------------------
-1. Check the captured coordinates in the form fields
-2. Adjust manually if needed
-3. Click "Validate" to check for errors
-4. Click "Save" to save configuration
-
-STEP 4: Repeat for All Tables
--------------------------------
-1. Select next table from dropdown
-2. Use picker buttons to capture coordinates
-3. Save each table configuration
-
-MANUAL ENTRY (Alternative Method):
------------------------------------
-If you prefer manual entry or need to adjust:
-- Enter x, y, width, height values directly
-- Coordinates are relative to canvas (#layaCanvas)
-- Button coordinates are relative to table region
-- Canvas has a 17px horizontal offset (automatically handled)
-
-IMPORTANT NOTES:
-- All coordinates are relative to the canvas element (#layaCanvas)
-- Button coordinates are relative to the table region
-- Canvas has a 17px horizontal offset (automatically handled)
-- Make sure coordinates don't overlap between tables
-- Test with one table first before configuring all 6
-
-TROUBLESHOOTING:
-- If picker doesn't appear: Make sure browser is opened first
-- If coordinates seem wrong: Try picking again or adjust manually
-- If screenshots are wrong: Check table region coordinates
-- If clicks miss: Check button coordinates
-- If timer/score extraction fails: Check region coordinates
-- Make sure browser is at 1920x1080 resolution
+        # Tab 2: Configuration Editor (built on first selection, see _build_config_tab)
+        config_frame = ttk.Frame(notebook)
+        notebook.add(config_frame, text="Configuration")
 
-TIP: Use the visual picker - it's much easier than DevTools!
+        # Initialize coordinate variables BEFORE creating inputs.
+        # Each StringVar mirrors its parsed value into _coord_buf on write,
+        # so saving reads ints directly instead of re-parsing every field.
+        self.coord_vars = {}
+        self._coord_buf = array("i", [0] * len(COORD_FIELDS))
+        self._coord_invalid = set()
+
+        # Both tabs fill in their contents the first time they are shown
+        self._notebook = notebook
+        self._guide_frame = guide_frame
+        self._guide_text = guide_text
+        self._guide_loaded = False
+        self._config_frame = config_frame
+        self._config_built = False
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, event=None):
+        """Lazily populate whichever tab was just selected."""
+        self._maybe_load_guide()
+        self._maybe_build_config_tab()
+        if self._guide_loaded and self._config_built:
+            self._notebook.unbind("<<NotebookTabChanged>>")
+
+    def _maybe_build_config_tab(self):
+        """Build the Configuration tab the first time it is shown."""
+        if self._config_built:
+            return
+        if self._notebook.select() != str(self._config_frame):
+            return
 
-For more help, see INSTALLATION_GUIDE.md
-        """
-        guide_text.insert("1.0", guide_content.strip())
-        guide_text.config(state=tk.DISABLED)
+        self._build_config_tab()
+        self._config_built = True
 
-        # Tab 2: Configuration Editor
+    def _build_config_tab(self):
+        """Create the coordinate editor widgets inside the Configuration tab."""
         # Create scrollable frame
-        canvas = tk.Canvas(config_frame := ttk.Frame(notebook), highlightthickness=0)
+        config_frame = self._config_frame
+        canvas = tk.Canvas(config_frame, highlightthickness=0)
         scrollbar = ttk.Scrollbar(config_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
-        
-        notebook.add(config_frame, text="Configuration")
-
-        # Initialize coordinate variables BEFORE creating inputs
-        self.coord_vars = {}
 
         # Table selection
         ttk.Label(scrollable_frame, text="Select Table:").grid(row=0, column=0, sticky=tk.W, pady=(0, 10), padx=10)
@@ -840,21 +1125,10 @@ For more help, see INSTALLATION_GUIDE.md
         table_combo.bind("<<ComboboxSelected>>", self._load_table_config)
 
         # Pick button for table region - Put it OUTSIDE region_frame so it's ALWAYS visible!
-        def _on_pick_table_btn_clicked():
-            """Wrapper to debug button click."""
-            print("DEBUG: Button 'Pick Table Region' clicked!")
-            logger.info("DEBUG: Button 'Pick Table Region' clicked!")
-            try:
-                self._pick_table_region()
-            except Exception as e:
-                print(f"DEBUG: Exception in button handler: {e}")
-                logger.error(f"DEBUG: Exception in button handler: {e}", exc_info=True)
-                raise
-        
         pick_table_btn = ttk.Button(
             scrollable_frame,
             text="📐 Pick Table Region",
-            command=_on_pick_table_btn_clicked,
+            command=self._pick_table_region,
             width=50,
         )
         pick_table_btn.grid(row=1, column=0, columnspan=2, pady=(0, 10), padx=10, sticky=(tk.W, tk.E))
@@ -881,25 +1155,25 @@ For more help, see INSTALLATION_GUIDE.md
         ttk.Button(
             button_pick_frame,
             text="🔵 Pick Blue",
-            command=lambda: self._pick_button("blue"),
+            command=functools.partial(self._pick_button, "blue"),
         ).grid(row=0, column=0, padx=(0, 5))
         
         ttk.Button(
             button_pick_frame,
             text="🔴 Pick Red",
-            command=lambda: self._pick_button("red"),
+            command=functools.partial(self._pick_button, "red"),
         ).grid(row=0, column=1, padx=(0, 5))
         
         ttk.Button(
             button_pick_frame,
             text="✓ Pick Confirm",
-            command=lambda: self._pick_button("confirm"),
+            command=functools.partial(self._pick_button, "confirm"),
         ).grid(row=0, column=2, padx=(0, 5))
         
         ttk.Button(
             button_pick_frame,
             text="✗ Pick Cancel",
-            command=lambda: self._pick_button("cancel"),
+            command=functools.partial(self._pick_button, "cancel"),
         ).grid(row=0, column=3)
 
         # Timer and Score Regions
@@ -910,6 +1184,12 @@ For more help, see INSTALLATION_GUIDE.md
         self._create_coord_inputs(regions_frame, "timer_x", "timer_y", "timer_w", "timer_h", 0)
         self._create_coord_inputs(regions_frame, "blue_score_x", "blue_score_y", "blue_score_w", "blue_score_h", 1)
         self._create_coord_inputs(regions_frame, "red_score_x", "red_score_y", "red_score_w", "red_score_h", 2)
+
+        # Region type -> (x, y, w, h) StringVars, resolved once for _apply_region
+        self._region_keymap = {
+            region_type: tuple(self.coord_vars[key] for key in keys)
+            for region_type, keys in self.REGION_KEYS.items()
+        }
         
         # Pick buttons for regions
         region_pick_frame = ttk.Frame(regions_frame)
@@ -918,19 +1198,19 @@ For more help, see INSTALLATION_GUIDE.md
         ttk.Button(
             region_pick_frame,
             text="⏱️ Pick Timer",
-            command=lambda: self._pick_region("timer"),
+            command=functools.partial(self._pick_region, "timer"),
         ).grid(row=0, column=0, padx=(0, 5))
         
         ttk.Button(
             region_pick_frame,
             text="🔵 Pick Blue Score",
-            command=lambda: self._pick_region("blue_score"),
+            command=functools.partial(self._pick_region, "blue_score"),
         ).grid(row=0, column=1, padx=(0, 5))
         
         ttk.Button(
             region_pick_frame,
             text="🔴 Pick Red Score",
-            command=lambda: self._pick_region("red_score"),
+            command=functools.partial(self._pick_region, "red_score"),
         ).grid(row=0, column=2)
 
         # Action buttons
@@ -958,7 +1238,7 @@ For more help, see INSTALLATION_GUIDE.md
         ttk.Button(
             action_frame,
             text="Close",
-            command=self.window.destroy,
+            command=self._on_close,
         ).grid(row=0, column=3)
 
         self.status_var = tk.StringVar(value="Ready")
@@ -968,32 +1248,87 @@ For more help, see INSTALLATION_GUIDE.md
             foreground="green",
         ).grid(row=6, column=0, columnspan=2, pady=(10, 0), padx=10)
         
-        # Update scroll region when window is resized
-        def update_scroll_region(event=None):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-        scrollable_frame.bind("<Configure>", update_scroll_region)
+        # Update scroll region when window is resized (coalesced, see _schedule_scroll_region)
+        self._config_canvas = canvas
+        self._pending_bbox = False
+        scrollable_frame.bind("<Configure>", self._schedule_scroll_region)
+
+        # Mouse wheel scrolls the form only while the pointer is over it
+        canvas.bind("<Enter>", self._bind_mousewheel)
+        canvas.bind("<Leave>", self._unbind_mousewheel)
+
+    def _schedule_scroll_region(self, event=None):
+        """Coalesce a burst of <Configure> events into one scroll region update."""
+        if self._pending_bbox:
+            return
+        self._pending_bbox = True
+        self.window.after(30, self._update_scroll_region)
+
+    def _update_scroll_region(self):
+        """Recompute the configuration canvas scroll region."""
+        self._pending_bbox = False
+        self._config_canvas.configure(scrollregion=self._config_canvas.bbox("all"))
+
+    def _bind_mousewheel(self, event=None):
+        """Route mouse wheel events to the configuration canvas."""
+        self.window.bind_all("<MouseWheel>", self._on_mousewheel)
+        self.window.bind_all("<Button-4>", self._on_mousewheel)
+        self.window.bind_all("<Button-5>", self._on_mousewheel)
+
+    def _unbind_mousewheel(self, event=None):
+        """Stop routing mouse wheel events to the configuration canvas."""
+        self.window.unbind_all("<MouseWheel>")
+        self.window.unbind_all("<Button-4>")
+        self.window.unbind_all("<Button-5>")
+
+    def _on_mousewheel(self, event):
+        """Scroll the configuration canvas (Windows/macOS delta, X11 buttons)."""
+        if event.num == 4 or event.delta > 0:
+            self._config_canvas.yview_scroll(-1, "units")
+        elif event.num == 5 or event.delta < 0:
+            self._config_canvas.yview_scroll(1, "units")
+
+    def _maybe_load_guide(self, event=None):
+        """Insert the guide text the first time the Guide tab is shown."""
+        if self._guide_loaded:
+            return
+        if self._notebook.select() != str(self._guide_frame):
+            return
+
+        self._guide_text.insert("1.0", _GUIDE_CONTENT)
+        self._guide_text.config(state=tk.DISABLED)
+        self._guide_loaded = True
 
     def _create_coord_inputs(self, parent, label1, label2, label3, label4, row):
         """Create coordinate input fields."""
-        ttk.Label(parent, text=f"{label1}:").grid(row=row, column=0, sticky=tk.W, padx=(0, 5))
-        var1 = tk.StringVar()
-        ttk.Entry(parent, textvariable=var1, width=10).grid(row=row, column=1, sticky=tk.W, padx=(0, 10))
-        self.coord_vars[label1] = var1
-
-        ttk.Label(parent, text=f"{label2}:").grid(row=row, column=2, sticky=tk.W, padx=(0, 5))
-        var2 = tk.StringVar()
-        ttk.Entry(parent, textvariable=var2, width=10).grid(row=row, column=3, sticky=tk.W, padx=(0, 10))
-        self.coord_vars[label2] = var2
-
-        ttk.Label(parent, text=f"{label3}:").grid(row=row, column=4, sticky=tk.W, padx=(0, 5))
-        var3 = tk.StringVar()
-        ttk.Entry(parent, textvariable=var3, width=10).grid(row=row, column=5, sticky=tk.W, padx=(0, 10))
-        self.coord_vars[label3] = var3
-
-        ttk.Label(parent, text=f"{label4}:").grid(row=row, column=6, sticky=tk.W, padx=(0, 5))
-        var4 = tk.StringVar()
-        ttk.Entry(parent, textvariable=var4, width=10).grid(row=row, column=7, sticky=tk.W)
-        self.coord_vars[label4] = var4
+        labels = (label1, label2, label3, label4)
+        for i, label in enumerate(labels):
+            ttk.Label(parent, text=f"{label}:").grid(row=row, column=2 * i, **_LABEL_GRID)
+            var = self._new_coord_var(label)
+            entry_grid = _ENTRY_GRID if i < len(labels) - 1 else _LAST_ENTRY_GRID
+            ttk.Entry(parent, textvariable=var, width=10).grid(row=row, column=2 * i + 1, **entry_grid)
+
+    def _new_coord_var(self, name: str) -> tk.StringVar:
+        """Create a coordinate StringVar that keeps _coord_buf in sync."""
+        var = tk.StringVar()
+        index = _COORD_INDEX[name]
+
+        def on_write(*_):
+            text = var.get()
+            try:
+                self._coord_buf[index] = int(text) if text else 0
+                self._coord_invalid.discard(name)
+            except (ValueError, OverflowError):
+                self._coord_buf[index] = 0
+                self._coord_invalid.add(name)
+
+        var.trace_add("write", on_write)
+        self.coord_vars[name] = var
+        return var
+
+    def _coord_value(self, name: str) -> int:
+        """Get the parsed value of a coordinate field (0 if empty or invalid)."""
+        return self._coord_buf[_COORD_INDEX[name]]
 
     def _load_table_config(self, event=None):
         """Load configuration for selected table."""
@@ -1006,11 +1341,11 @@ For more help, see INSTALLATION_GUIDE.md
         errors = []
 
         # Validate table region
-        try:
-            x = int(self.coord_vars["x"].get())
-            y = int(self.coord_vars["y"].get())
-            w = int(self.coord_vars["width"].get())
-            h = int(self.coord_vars["height"].get())
+        region_keys = ("x", "y", "width", "height")
+        if self._coord_invalid.intersection(region_keys):
+            errors.append("Table region: Invalid numeric values")
+        else:
+            x, y, w, h = (self._coord_value(k) for k in region_keys)
 
             if x < 0 or y < 0 or w <= 0 or h <= 0:
                 errors.append("Table region: All values must be positive")
@@ -1018,8 +1353,6 @@ For more help, see INSTALLATION_GUIDE.md
                 errors.append("Table region: x + width exceeds canvas width (1920)")
             if y + h > 1080:
                 errors.append("Table region: y + height exceeds canvas height (1080)")
-        except ValueError:
-            errors.append("Table region: Invalid numeric values")
 
         if errors:
             messagebox.showerror("Validation Error", "\n".join(errors))
@@ -1032,48 +1365,13 @@ For more help, see INSTALLATION_GUIDE.md
         """Save coordinates for selected table."""
         table_id = self.config_table_var.get()
 
-        coords = {
-            "x": int(self.coord_vars["x"].get() or 0),
-            "y": int(self.coord_vars["y"].get() or 0),
-            "width": int(self.coord_vars["width"].get() or 0),
-            "height": int(self.coord_vars["height"].get() or 0),
-            "buttons": {
-                "blue": {
-                    "x": int(self.coord_vars["blue_x"].get() or 0),
-                    "y": int(self.coord_vars["blue_y"].get() or 0),
-                },
-                "red": {
-                    "x": int(self.coord_vars["red_x"].get() or 0),
-                    "y": int(self.coord_vars["red_y"].get() or 0),
-                },
-                "confirm": {
-                    "x": int(self.coord_vars["confirm_x"].get() or 0),
-                    "y": int(self.coord_vars["confirm_y"].get() or 0),
-                },
-                "cancel": {
-                    "x": int(self.coord_vars["cancel_x"].get() or 0),
-                    "y": int(self.coord_vars["cancel_y"].get() or 0),
-                },
-            },
-            "timer": {
-                "x": int(self.coord_vars["timer_x"].get() or 0),
-                "y": int(self.coord_vars["timer_y"].get() or 0),
-                "width": int(self.coord_vars["timer_w"].get() or 0),
-                "height": int(self.coord_vars["timer_h"].get() or 0),
-            },
-            "blue_score": {
-                "x": int(self.coord_vars["blue_score_x"].get() or 0),
-                "y": int(self.coord_vars["blue_score_y"].get() or 0),
-                "width": int(self.coord_vars["blue_score_w"].get() or 0),
-                "height": int(self.coord_vars["blue_score_h"].get() or 0),
-            },
-            "red_score": {
-                "x": int(self.coord_vars["red_score_x"].get() or 0),
-                "y": int(self.coord_vars["red_score_y"].get() or 0),
-                "width": int(self.coord_vars["red_score_w"].get() or 0),
-                "height": int(self.coord_vars["red_score_h"].get() or 0),
-            },
-        }
+        if self._coord_invalid:
+            fields = ", ".join(sorted(self._coord_invalid, key=_COORD_INDEX.get))
+            messagebox.showerror("Invalid Coordinates", f"Invalid numeric values: {fields}")
+            self.status_var.set("✗ Save failed")
+            return
+
+        coords = _scatter_coords(self._coord_buf)
 
         if self.on_save:
             self.on_save(table_id, coords)
@@ -1083,17 +1381,15 @@ For more help, see INSTALLATION_GUIDE.md
 
     def _load_from_config_file(self):
         """Load coordinates from config file."""
-        import yaml
-        from pathlib import Path
-
-        config_path = Path("config/table_regions.yaml")
-        if not config_path.exists():
+        config_path = self.CONFIG_PATH
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except OSError:
             messagebox.showerror("Error", f"Config file not found: {config_path}")
             return
 
         try:
-            with open(config_path, "r") as f:
-                config = yaml.safe_load(f)
+            config = _load_yaml_cached(str(config_path), mtime_ns)
 
             table_id = self.config_table_var.get()
             table_config = config.get("tables", {}).get(table_id)
@@ -1102,43 +1398,18 @@ For more help, see INSTALLATION_GUIDE.md
                 messagebox.showwarning("Warning", f"No configuration found for Table {table_id}")
                 return
 
-            # Load values into form
-            self.coord_vars["x"].set(str(table_config.get("x", 0)))
-            self.coord_vars["y"].set(str(table_config.get("y", 0)))
-            self.coord_vars["width"].set(str(table_config.get("width", 0)))
-            self.coord_vars["height"].set(str(table_config.get("height", 0)))
-
-            buttons = table_config.get("buttons", {})
-            if buttons:
-                self.coord_vars["blue_x"].set(str(buttons.get("blue", {}).get("x", 0)))
-                self.coord_vars["blue_y"].set(str(buttons.get("blue", {}).get("y", 0)))
-                self.coord_vars["red_x"].set(str(buttons.get("red", {}).get("x", 0)))
-                self.coord_vars["red_y"].set(str(buttons.get("red", {}).get("y", 0)))
-                self.coord_vars["confirm_x"].set(str(buttons.get("confirm", {}).get("x", 0)))
-                self.coord_vars["confirm_y"].set(str(buttons.get("confirm", {}).get("y", 0)))
-                self.coord_vars["cancel_x"].set(str(buttons.get("cancel", {}).get("x", 0)))
-                self.coord_vars["cancel_y"].set(str(buttons.get("cancel", {}).get("y", 0)))
-
-            timer = table_config.get("timer", {})
-            if timer:
-                self.coord_vars["timer_x"].set(str(timer.get("x", 0)))
-                self.coord_vars["timer_y"].set(str(timer.get("y", 0)))
-                self.coord_vars["timer_w"].set(str(timer.get("width", 0)))
-                self.coord_vars["timer_h"].set(str(timer.get("height", 0)))
-
-            blue_score = table_config.get("blue_score", {})
-            if blue_score:
-                self.coord_vars["blue_score_x"].set(str(blue_score.get("x", 0)))
-                self.coord_vars["blue_score_y"].set(str(blue_score.get("y", 0)))
-                self.coord_vars["blue_score_w"].set(str(blue_score.get("width", 0)))
-                self.coord_vars["blue_score_h"].set(str(blue_score.get("height", 0)))
-
-            red_score = table_config.get("red_score", {})
-            if red_score:
-                self.coord_vars["red_score_x"].set(str(red_score.get("x", 0)))
-                self.coord_vars["red_score_y"].set(str(red_score.get("y", 0)))
-                self.coord_vars["red_score_w"].set(str(red_score.get("width", 0)))
-                self.coord_vars["red_score_h"].set(str(red_score.get("height", 0)))
+            # Load values into form. Resulting <Configure> events are
+            # coalesced by _schedule_scroll_region.
+            for name, path in CONFIG_FIELD_MAP:
+                section = table_config
+                if len(path) > 1:
+                    # Sections missing from the file leave the form untouched
+                    section = table_config.get(path[0])
+                    if not section:
+                        continue
+                    for key in path[1:-1]:
+                        section = section.get(key, {})
+                self.coord_vars[name].set(str(section.get(path[-1], 0)))
 
             self.status_var.set("✓ Configuration loaded from file")
             messagebox.showinfo("Success", "Configuration loaded from file")
@@ -1146,17 +1417,97 @@ For more help, see INSTALLATION_GUIDE.md
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load config: {e}")
 
+    def _get_picker_loop_or_error(self) -> Optional[asyncio.AbstractEventLoop]:
+        """
+        Get the browser event loop for running a coordinate picker.
+
+        Called from picker threads. On failure an error dialog is scheduled
+        on the Tk thread and None is returned. The loop is cached after the
+        first successful lookup and re-fetched once it stops running.
+
+        Returns:
+            Browser event loop, or None if the picker cannot run
+        """
+        loop = self._browser_loop
+        if loop is None or loop.is_closed() or not loop.is_running():
+            loop = None
+            if callable(self.get_browser_event_loop):
+                loop = self.get_browser_event_loop()
+                logger.debug("Retrieved browser event loop: %r", loop)
+            else:
+                logger.warning("get_browser_event_loop method not available or not callable")
+            self._browser_loop = loop
+
+        if not loop:
+            logger.error("Browser event loop not available - browser may not be fully initialized")
+            self._ui(
+                messagebox.showerror,
+                "Error",
+                "Browser event loop not available. Please ensure browser is fully opened before using coordinate picker."
+            )
+            return None
+
+        if not self.browser_page:
+            logger.error("Browser page not available")
+            self._ui(
+                messagebox.showwarning,
+                "Browser Not Available",
+                "Browser page not available.\n\n"
+                "Please:\n"
+                "1. Click 'Open Browser' in the main window\n"
+                "2. Navigate to your game page\n"
+                "3. Then try picking coordinates again"
+            )
+            return None
+
+        return loop
+
+    def _ui(self, fn: Callable, *args, **kwargs):
+        """Schedule fn(*args, **kwargs) on the Tk thread (safe to call from worker threads)."""
+        if self._closing.is_set():
+            return
+        self.window.after(0, functools.partial(fn, *args, **kwargs))
+
+    def _wait_for_pick(self, future: concurrent.futures.Future) -> Optional[Dict[str, Any]]:
+        """
+        Wait for a picker coroutine scheduled with run_coroutine_threadsafe.
+
+        Polls in short intervals so closing the window cancels the pick
+        promptly instead of holding the worker for the full timeout.
+
+        Args:
+            future: Future returned by asyncio.run_coroutine_threadsafe
+
+        Returns:
+            Picker result, or None if the window was closed
+
+        Raises:
+            concurrent.futures.TimeoutError: If the pick exceeds PICK_TIMEOUT
+        """
+        deadline = time.monotonic() + self.PICK_TIMEOUT
+        while not self._closing.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                future.cancel()
+                raise concurrent.futures.TimeoutError()
+            done, _ = concurrent.futures.wait((future,), timeout=min(self.PICK_POLL_INTERVAL, remaining))
+            if done:
+                return future.result()
+
+        future.cancel()
+        return None
+
+    def _get_picker(self) -> CoordinatePicker:
+        """Get the coordinate picker for the current browser page, reusing it across picks."""
+        if self._picker is None or self._picker.page is not self.browser_page:
+            self._picker = CoordinatePicker(self.browser_page)
+        return self._picker
+
     def _pick_table_region(self):
         """Pick table region using visual picker."""
-        # DEBUG: Confirm method is being called
-        print("DEBUG: _pick_table_region() called!")
-        logger.info("DEBUG: _pick_table_region() method called")
-        print(f"DEBUG: self.browser_page = {self.browser_page}")
-        print(f"DEBUG: self.browser_page is None? {self.browser_page is None}")
+        logger.debug("_pick_table_region() called, browser_page=%r", self.browser_page)
         
         if not self.browser_page:
-            print("DEBUG: browser_page is None - showing warning")
-            logger.warning("DEBUG: browser_page is None - attempting to show warning dialog")
             logger.warning("Browser page not available for coordinate picking")
             messagebox.showwarning(
                 "Browser Not Available",
@@ -1170,8 +1521,9 @@ For more help, see INSTALLATION_GUIDE.md
 
         logger.info("Browser page available, showing coordinate picker info dialog")
         
-        # Show info message
-        self.window.after(0, lambda: messagebox.showinfo(
+        # Show instructions first; the modal box returns on OK, and only
+        # then is the picker (and its browser overlay) started
+        messagebox.showinfo(
             "Coordinate Picker",
             "Coordinate picker will appear in the browser window.\n\n"
             "Instructions:\n"
@@ -1179,8 +1531,9 @@ For more help, see INSTALLATION_GUIDE.md
             "2. You'll see a green overlay\n"
             "3. Drag to select the table region\n"
             "4. Release mouse to capture coordinates\n\n"
-            "Press ESC to cancel."
-        ))
+            "Press ESC to cancel.",
+            parent=self.window,
+        )
 
         def pick_thread():
             """
@@ -1191,40 +1544,15 @@ For more help, see INSTALLATION_GUIDE.md
             Playwright Page objects.
             """
             logger.info("Coordinate picker thread started")
-            
-            # Get the original event loop instead of creating new one
-            original_loop = None
-            if hasattr(self, 'get_browser_event_loop') and callable(self.get_browser_event_loop):
-                original_loop = self.get_browser_event_loop()
-                logger.debug(f"Retrieved browser event loop: {original_loop}")
-            else:
-                logger.warning("get_browser_event_loop method not available or not callable")
-            
+
+            original_loop = self._get_picker_loop_or_error()
             if not original_loop:
-                logger.error("Browser event loop not available - browser may not be fully initialized")
-                self.window.after(0, lambda: messagebox.showerror(
-                    "Error",
-                    "Browser event loop not available. Please ensure browser is fully opened before using coordinate picker."
-                ))
-                return
-            
-            if not self.browser_page:
-                logger.error("Browser page not available")
-                self.window.after(0, lambda: messagebox.showwarning(
-                    "Browser Not Available",
-                    "Browser page not available.\n\n"
-                    "Please:\n"
-                    "1. Click 'Open Browser' in the main window\n"
-                    "2. Navigate to your game page\n"
-                    "3. Then try picking coordinates again"
-                ))
                 return
-            
+
             try:
                 logger.info("Using original event loop for coordinate picker")
                 
-                # Create picker instance
-                picker = CoordinatePicker(self.browser_page)
+                picker = self._get_picker()
                 
                 # Use run_coroutine_threadsafe to run in original loop
                 logger.info("Calling picker.pick_table_region() via run_coroutine_threadsafe")
@@ -1233,36 +1561,39 @@ For more help, see INSTALLATION_GUIDE.md
                     original_loop
                 )
                 
-                # Wait for result (blocking call, but in separate thread)
-                result = future.result(timeout=60.0)  # 60 second timeout
+                # Wait for result (blocking, but in the picker worker thread)
+                result = self._wait_for_pick(future)
                 
-                logger.info(f"Picker returned result: {result}")
+                logger.info("Picker returned result: %s", result)
                 
                 if result:
-                    self.window.after(0, lambda: self._apply_table_region(result))
+                    self._ui(self._apply_table_region, result)
                 else:
-                    self.window.after(0, lambda: messagebox.showinfo(
+                    self._ui(
+                        messagebox.showinfo,
                         "Cancelled",
                         "Coordinate picking cancelled"
-                    ))
+                    )
                     
-            except asyncio.TimeoutError:
+            except concurrent.futures.TimeoutError:
                 logger.error("Coordinate picking timed out")
-                self.window.after(0, lambda: messagebox.showerror(
+                self._ui(
+                    messagebox.showerror,
                     "Timeout",
                     "Coordinate picking timed out after 60 seconds."
-                ))
+                )
             except Exception as e:
                 import traceback
                 error_msg = f"Failed to pick coordinates:\n{str(e)}\n\n{traceback.format_exc()}"
                 logger.error(error_msg)
-                self.window.after(0, lambda: messagebox.showerror(
+                self._ui(
+                    messagebox.showerror,
                     "Error",
                     f"Failed to pick coordinates:\n{str(e)}\n\n"
                     "Check logs for details. Make sure browser is open and on a valid page."
-                ))
+                )
 
-        threading.Thread(target=pick_thread, daemon=True).start()
+        self._pick_pool.submit(pick_thread)
 
     def _apply_table_region(self, result: Dict[str, int]):
         """Apply picked table region to form."""
@@ -1291,27 +1622,14 @@ For more help, see INSTALLATION_GUIDE.md
             """
             Thread function to run button coordinate picker using the original browser event loop.
             """
-            logger.info(f"Button picker thread started for button type: {button_type}")
-            
-            # Get the original event loop instead of creating new one
-            original_loop = None
-            if hasattr(self, 'get_browser_event_loop') and callable(self.get_browser_event_loop):
-                original_loop = self.get_browser_event_loop()
-                logger.debug(f"Retrieved browser event loop: {original_loop}")
-            else:
-                logger.warning("get_browser_event_loop method not available or not callable")
-            
+            logger.info("Button picker thread started for button type: %s", button_type)
+
+            original_loop = self._get_picker_loop_or_error()
             if not original_loop:
-                logger.error("Browser event loop not available - browser may not be fully initialized")
-                self.window.after(0, lambda: messagebox.showerror(
-                    "Error",
-                    "Browser event loop not available. Please ensure browser is fully opened before using coordinate picker."
-                ))
                 return
-            
+
             try:
-                # Create picker instance
-                picker = CoordinatePicker(self.browser_page)
+                picker = self._get_picker()
                 
                 # Use run_coroutine_threadsafe to run in original loop
                 logger.info("Calling picker.pick_button_position() via run_coroutine_threadsafe")
@@ -1320,43 +1638,46 @@ For more help, see INSTALLATION_GUIDE.md
                     original_loop
                 )
                 
-                # Wait for result (blocking call, but in separate thread)
-                result = future.result(timeout=60.0)  # 60 second timeout
+                # Wait for result (blocking, but in the picker worker thread)
+                result = self._wait_for_pick(future)
                 
-                logger.info(f"Button picker returned result: {result}")
+                logger.info("Button picker returned result: %s", result)
                 
                 if result:
-                    self.window.after(0, lambda: self._apply_button_position(button_type, result))
+                    self._ui(self._apply_button_position, button_type, result)
                 else:
-                    self.window.after(0, lambda: messagebox.showinfo(
+                    self._ui(
+                        messagebox.showinfo,
                         "Cancelled",
                         "Coordinate picking cancelled"
-                    ))
+                    )
                     
-            except asyncio.TimeoutError:
+            except concurrent.futures.TimeoutError:
                 logger.error("Button coordinate picking timed out")
-                self.window.after(0, lambda: messagebox.showerror(
+                self._ui(
+                    messagebox.showerror,
                     "Timeout",
                     "Coordinate picking timed out after 60 seconds."
-                ))
+                )
             except Exception as e:
                 import traceback
                 error_msg = f"Failed to pick button coordinates: {str(e)}\n\n{traceback.format_exc()}"
                 logger.error(error_msg)
-                self.window.after(0, lambda: messagebox.showerror(
+                self._ui(
+                    messagebox.showerror,
                     "Error",
                     f"Failed to pick coordinates: {str(e)}\n\n"
                     "Check logs for details. Make sure browser is open and on a valid page."
-                ))
+                )
 
-        threading.Thread(target=pick_thread, daemon=True).start()
+        self._pick_pool.submit(pick_thread)
 
     def _apply_button_position(self, button_type: str, result: Dict[str, int]):
         """Apply picked button position to form."""
-        x_key = f"{button_type}_x"
-        y_key = f"{button_type}_y"
+        keys = self.BUTTON_KEYS.get(button_type)
         
-        if x_key in self.coord_vars and y_key in self.coord_vars:
+        if keys:
+            x_key, y_key = keys
             self.coord_vars[x_key].set(str(result.get("x", 0)))
             self.coord_vars[y_key].set(str(result.get("y", 0)))
             self.status_var.set(f"✓ {button_type.capitalize()} button captured")
@@ -1378,12 +1699,7 @@ For more help, see INSTALLATION_GUIDE.md
             )
             return
 
-        mode_map = {
-            "timer": "timer",
-            "blue_score": "score",
-            "red_score": "score",
-        }
-        mode = mode_map.get(region_type, "score")
+        mode = self.REGION_MODES.get(region_type, "score")
 
         def pick_thread():
             """
@@ -1393,41 +1709,16 @@ For more help, see INSTALLATION_GUIDE.md
             event loop instead of creating a new one, which prevents deadlocks with
             Playwright Page objects.
             """
-            logger.info(f"Region picker thread started for region type: {region_type}")
-            
-            # Get the original event loop instead of creating new one
-            original_loop = None
-            if hasattr(self, 'get_browser_event_loop') and callable(self.get_browser_event_loop):
-                original_loop = self.get_browser_event_loop()
-                logger.debug(f"Retrieved browser event loop: {original_loop}")
-            else:
-                logger.warning("get_browser_event_loop method not available or not callable")
-            
+            logger.info("Region picker thread started for region type: %s", region_type)
+
+            original_loop = self._get_picker_loop_or_error()
             if not original_loop:
-                logger.error("Browser event loop not available - browser may not be fully initialized")
-                self.window.after(0, lambda: messagebox.showerror(
-                    "Error",
-                    "Browser event loop not available. Please ensure browser is fully opened before using coordinate picker."
-                ))
                 return
-            
-            if not self.browser_page:
-                logger.error("Browser page not available")
-                self.window.after(0, lambda: messagebox.showwarning(
-                    "Browser Not Available",
-                    "Browser page not available.\n\n"
-                    "Please:\n"
-                    "1. Click 'Open Browser' in the main window\n"
-                    "2. Navigate to your game page\n"
-                    "3. Then try picking coordinates again"
-                ))
-                return
-            
+
             try:
-                logger.info(f"Using original event loop for region picker (mode: {mode})")
+                logger.info("Using original event loop for region picker (mode: %s)", mode)
                 
-                # Create picker instance
-                picker = CoordinatePicker(self.browser_page)
+                picker = self._get_picker()
                 
                 # Use run_coroutine_threadsafe to run in original loop
                 if mode == "timer":
@@ -1443,51 +1734,52 @@ For more help, see INSTALLATION_GUIDE.md
                         original_loop
                     )
                 
-                # Wait for result (blocking call, but in separate thread)
-                result = future.result(timeout=60.0)  # 60 second timeout
+                # Wait for result (blocking, but in the picker worker thread)
+                result = self._wait_for_pick(future)
                 
-                logger.info(f"Region picker returned result: {result}")
+                logger.info("Region picker returned result: %s", result)
                 
                 if result:
-                    self.window.after(0, lambda: self._apply_region(region_type, result))
+                    self._ui(self._apply_region, region_type, result)
                 else:
-                    self.window.after(0, lambda: messagebox.showinfo(
+                    self._ui(
+                        messagebox.showinfo,
                         "Cancelled",
                         "Coordinate picking cancelled"
-                    ))
+                    )
                     
-            except asyncio.TimeoutError:
+            except concurrent.futures.TimeoutError:
                 logger.error("Region coordinate picking timed out")
-                self.window.after(0, lambda: messagebox.showerror(
+                self._ui(
+                    messagebox.showerror,
                     "Timeout",
                     "Coordinate picking timed out after 60 seconds."
-                ))
+                )
             except Exception as e:
                 import traceback
                 error_msg = f"Failed to pick region coordinates: {str(e)}\n\n{traceback.format_exc()}"
                 logger.error(error_msg)
-                self.window.after(0, lambda: messagebox.showerror(
+                self._ui(
+                    messagebox.showerror,
                     "Error",
                     f"Failed to pick coordinates: {str(e)}\n\n"
                     "Check logs for details. Make sure browser is open and on a valid page."
-                ))
+                )
 
-        threading.Thread(target=pick_thread, daemon=True).start()
+        self._pick_pool.submit(pick_thread)
 
     def _apply_region(self, region_type: str, result: Dict[str, int]):
         """Apply picked region to form."""
-        x_key = f"{region_type}_x"
-        y_key = f"{region_type}_y"
-        w_key = f"{region_type}_w"
-        h_key = f"{region_type}_h"
+        region_vars = self._region_keymap.get(region_type)
         
-        if x_key in self.coord_vars and y_key in self.coord_vars:
-            self.coord_vars[x_key].set(str(result.get("x", 0)))
-            self.coord_vars[y_key].set(str(result.get("y", 0)))
-            if w_key in self.coord_vars and h_key in self.coord_vars:
-                self.coord_vars[w_key].set(str(result.get("width", 0)))
-                self.coord_vars[h_key].set(str(result.get("height", 0)))
-            self.status_var.set(f"✓ {region_type.replace('_', ' ').title()} region captured")
-            messagebox.showinfo("Success", f"{region_type.replace('_', ' ').title()} region captured!")
+        if region_vars:
+            x_var, y_var, w_var, h_var = region_vars
+            x_var.set(str(result.get("x", 0)))
+            y_var.set(str(result.get("y", 0)))
+            w_var.set(str(result.get("width", 0)))
+            h_var.set(str(result.get("height", 0)))
+            title = self.REGION_TITLES[region_type]
+            self.status_var.set(f"✓ {title} region captured")
+            messagebox.showinfo("Success", f"{title} region captured!")
         else:
             messagebox.showerror("Error", f"Unknown region type: {region_type}")
@@ -5,7 +5,10 @@ Handles the 17px canvas transform offset and coordinate conversions
 for accurate click execution.
 """
 
-from typing import Dict, Tuple, Optional
+from array import array
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple, Optional, Union
 from dataclasses import dataclass
 
 
@@ -13,48 +16,104 @@ from dataclasses import dataclass
 CANVAS_TRANSFORM_OFFSET_X = 17
 CANVAS_TRANSFORM_OFFSET_Y = 0
 
+# Region fields in constructor order, read from a region dict in one call
+_REGION_ITEMS = itemgetter("x", "y", "width", "height")
 
-@dataclass
+
+def _slots_getstate(self) -> Tuple:
+    """Get every slot value of a frozen slotted dataclass, for copy/pickle."""
+    return tuple(getattr(self, name) for name in self.__slots__)
+
+
+def _slots_setstate(self, state: Tuple) -> None:
+    """Restore slot values saved by _slots_getstate, bypassing frozen."""
+    for name, value in zip(self.__slots__, state):
+        object.__setattr__(self, name, value)
+
+
+@dataclass(frozen=True)
 class Point:
     """Represents a 2D point."""
 
+    __slots__ = ("x", "y")
+
     x: int
     y: int
 
+    __getstate__ = _slots_getstate
+    __setstate__ = _slots_setstate
+
 
-@dataclass
+@dataclass(frozen=True)
 class Region:
-    """Represents a rectangular region."""
+    """Represents a rectangular region.
+
+    Regions are immutable, so the edges and center are computed once
+    in ``__post_init__`` rather than on every access.
+    """
+
+    __slots__ = ("x", "y", "width", "height", "_right", "_bottom", "_center")
 
     x: int
     y: int
     width: int
     height: int
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_right", self.x + self.width)
+        object.__setattr__(self, "_bottom", self.y + self.height)
+        object.__setattr__(
+            self,
+            "_center",
+            Point(x=self.x + self.width // 2, y=self.y + self.height // 2),
+        )
+
+    __getstate__ = _slots_getstate
+    __setstate__ = _slots_setstate
+
     @property
     def right(self) -> int:
         """Get right edge x coordinate."""
-        return self.x + self.width
+        return self._right
 
     @property
     def bottom(self) -> int:
         """Get bottom edge y coordinate."""
-        return self.y + self.height
+        return self._bottom
 
     @property
     def center(self) -> Point:
         """Get center point of region."""
-        return Point(
-            x=self.x + self.width // 2,
-            y=self.y + self.height // 2,
-        )
+        return self._center
 
     def contains(self, point: Point) -> bool:
         """Check if point is inside region."""
-        return (
-            self.x <= point.x < self.right
-            and self.y <= point.y < self.bottom
-        )
+        return self.x <= point.x < self._right and self.y <= point.y < self._bottom
+
+    def contains_batch(self, points: Sequence[Tuple[int, int]]):
+        """
+        Check containment for several points at once.
+
+        A NumPy ``(N, 2)`` array of ``[x, y]`` rows is tested with vectorised
+        column comparisons; any other sequence of ``(x, y)`` pairs is tested
+        in a single comprehension.
+
+        Args:
+            points: Point (x, y) pairs
+
+        Returns:
+            Boolean array for array input, otherwise a list of bools
+        """
+        x, y, right, bottom = self.x, self.y, self._right, self._bottom
+        if hasattr(points, "shape"):
+            xs = points[:, 0]
+            ys = points[:, 1]
+            return (xs >= x) & (xs < right) & (ys >= y) & (ys < bottom)
+
+        inside: List[bool] = [
+            x <= px < right and y <= py < bottom for px, py in points
+        ]
+        return inside
 
     def to_dict(self) -> Dict[str, int]:
         """Convert to dictionary."""
@@ -68,11 +127,93 @@ class Region:
     @classmethod
     def from_dict(cls, data: Dict[str, int]) -> "Region":
         """Create Region from dictionary."""
+        return cls(*_REGION_ITEMS(data))
+
+
+class RegionArray:
+    """
+    Column-wise store for many regions.
+
+    Keeps x, y, width and height in four packed int32 ``array`` columns
+    instead of one dict per region. NumPy can view a column without
+    copying via ``numpy.frombuffer(column, dtype=numpy.int32)``.
+    """
+
+    __slots__ = ("xs", "ys", "widths", "heights")
+
+    def __init__(
+        self,
+        xs: Iterable[int] = (),
+        ys: Iterable[int] = (),
+        widths: Iterable[int] = (),
+        heights: Iterable[int] = (),
+    ):
+        """
+        Initialize region columns.
+
+        Args:
+            xs: X coordinates (left edges)
+            ys: Y coordinates (top edges)
+            widths: Region widths
+            heights: Region heights
+
+        Raises:
+            ValueError: If the columns differ in length
+        """
+        self.xs = array("i", xs)
+        self.ys = array("i", ys)
+        self.widths = array("i", widths)
+        self.heights = array("i", heights)
+        if not len(self.xs) == len(self.ys) == len(self.widths) == len(self.heights):
+            raise ValueError(
+                f"Region columns differ in length: {len(self.xs)}, {len(self.ys)}, "
+                f"{len(self.widths)}, {len(self.heights)}"
+            )
+
+    @classmethod
+    def from_dicts(cls, regions: Sequence[Dict[str, int]]) -> "RegionArray":
+        """Create RegionArray from region dictionaries."""
         return cls(
-            x=data["x"],
-            y=data["y"],
-            width=data["width"],
-            height=data["height"],
+            [r["x"] for r in regions],
+            [r["y"] for r in regions],
+            [r["width"] for r in regions],
+            [r["height"] for r in regions],
+        )
+
+    def to_dicts(self) -> List[Dict[str, int]]:
+        """Convert to a list of region dictionaries."""
+        return [
+            {"x": x, "y": y, "width": w, "height": h}
+            for x, y, w, h in zip(self.xs, self.ys, self.widths, self.heights)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def __getitem__(self, index: int) -> Region:
+        return Region(
+            x=self.xs[index],
+            y=self.ys[index],
+            width=self.widths[index],
+            height=self.heights[index],
+        )
+
+    def offset(self, dx: int, dy: int) -> "RegionArray":
+        """
+        Get a copy with every region moved by (dx, dy).
+
+        Args:
+            dx: X offset added to every region
+            dy: Y offset added to every region
+
+        Returns:
+            New RegionArray with the same sizes
+        """
+        return RegionArray(
+            [x + dx for x in self.xs],
+            [y + dy for y in self.ys],
+            self.widths,
+            self.heights,
         )
 
 
@@ -137,11 +278,47 @@ class CoordinateUtils:
 
         return absolute_x, absolute_y
 
+    def calculate_absolute_coordinates_batch(
+        self,
+        canvas_box: Dict[str, int],
+        table_region: Dict[str, int],
+        buttons_xy: Sequence[Tuple[int, int]],
+    ):
+        """
+        Calculate absolute click coordinates for several buttons at once.
+
+        The canvas/table/offset base is resolved once and added to every
+        button. A NumPy ``(N, 2)`` array is offset with one vectorised add
+        per column and returned as a new array of the same dtype; any other
+        sequence of ``(x, y)`` pairs returns a list of tuples.
+
+        Args:
+            canvas_box: Canvas element bounding box
+            table_region: Table region coordinates
+            buttons_xy: Button (x, y) pairs relative to table region
+
+        Returns:
+            Absolute (x, y) coordinates, one per button
+        """
+        base_x = canvas_box["x"] + table_region["x"] + self.offset_x
+        base_y = canvas_box["y"] + table_region["y"] + self.offset_y
+
+        if hasattr(buttons_xy, "shape"):
+            coords_array = buttons_xy.copy()
+            coords_array[:, 0] += base_x
+            coords_array[:, 1] += base_y
+            return coords_array
+
+        coords: List[Tuple[int, int]] = [
+            (base_x + bx, base_y + by) for bx, by in buttons_xy
+        ]
+        return coords
+
     def get_click_coordinates(
         self,
         canvas_box: Dict[str, int],
         table_region: Dict[str, int],
-        button_coords: Dict[str, int],
+        button_coords: Union[Dict[str, int], Tuple[int, int]],
     ) -> Tuple[int, int]:
         """
         Get click coordinates for a button.
@@ -149,16 +326,21 @@ class CoordinateUtils:
         Args:
             canvas_box: Canvas element bounding box
             table_region: Table region coordinates
-            button_coords: Button coordinates {'x', 'y'} relative to table
+            button_coords: Button coordinates relative to table, either
+                {'x', 'y'} or an (x, y) tuple from create_button_xy
 
         Returns:
             Tuple of (absolute_x, absolute_y) for mouse click
         """
+        if isinstance(button_coords, dict):
+            button_x, button_y = button_coords["x"], button_coords["y"]
+        else:
+            button_x, button_y = button_coords
         return self.calculate_absolute_coordinates(
             canvas_box=canvas_box,
             table_region=table_region,
-            button_x=button_coords["x"],
-            button_y=button_coords["y"],
+            button_x=button_x,
+            button_y=button_y,
         )
 
     def get_region_screenshot_coords(
@@ -183,6 +365,25 @@ class CoordinateUtils:
             "height": table_region["height"],
         }
 
+    def get_region_screenshot_coords_batch(
+        self,
+        canvas_box: Dict[str, int],
+        table_regions: RegionArray,
+    ) -> RegionArray:
+        """
+        Get screenshot regions for several tables at once.
+
+        Same as get_region_screenshot_coords, applied column-wise.
+
+        Args:
+            canvas_box: Canvas element bounding box
+            table_regions: Table region coordinates, one row per table
+
+        Returns:
+            RegionArray of screenshot region coordinates
+        """
+        return table_regions.offset(canvas_box["x"], canvas_box["y"])
+
     def get_subregion_coords(
         self,
         table_region_image_width: int,
@@ -202,24 +403,76 @@ class CoordinateUtils:
         Returns:
             Crop box coordinates for PIL Image.crop()
         """
-        # Validate subregion is within bounds
-        if subregion["x"] + subregion["width"] > table_region_image_width:
-            raise ValueError(
-                f"Subregion exceeds image width: "
-                f"{subregion['x']} + {subregion['width']} > {table_region_image_width}"
+        x = subregion["x"]
+        y = subregion["y"]
+        width = subregion["width"]
+        height = subregion["height"]
+        right = x + width
+        lower = y + height
+
+        # Validate subregion is within bounds; one test on the in-bounds path
+        if right > table_region_image_width or lower > table_region_image_height:
+            raise ValueError("Subregion " + _subregion_bounds_error(
+                x, y, width, height, table_region_image_width, table_region_image_height
+            ))
+
+        return {
+            "left": x,
+            "upper": y,
+            "right": right,
+            "lower": lower,
+        }
+
+    def get_subregion_coords_batch(
+        self,
+        table_region_image_width: int,
+        table_region_image_height: int,
+        subregions: Sequence[Tuple[int, int, int, int]],
+    ):
+        """
+        Get crop boxes for several subregions of a table region image.
+
+        A NumPy ``(N, 4)`` array of ``[x, y, w, h]`` rows is converted with
+        vectorised column adds and bounds-checked with one combined mask,
+        returning an ``(N, 4)`` array of ``[left, upper, right, lower]``.
+        Any other sequence returns a list of crop-box tuples.
+
+        Args:
+            table_region_image_width: Width of table region screenshot
+            table_region_image_height: Height of table region screenshot
+            subregions: Subregion (x, y, width, height) rows within table
+
+        Returns:
+            Crop boxes for PIL Image.crop(), one per subregion
+
+        Raises:
+            ValueError: If any subregion exceeds the image bounds; the message
+                names the first offending row
+        """
+        image_w = table_region_image_width
+        image_h = table_region_image_height
+
+        if hasattr(subregions, "shape"):
+            boxes = subregions.copy()
+            boxes[:, 2] += subregions[:, 0]
+            boxes[:, 3] += subregions[:, 1]
+            out_of_bounds = (boxes[:, 2] > image_w) | (boxes[:, 3] > image_h)
+            bad = int(out_of_bounds.argmax()) if out_of_bounds.any() else -1
+        else:
+            boxes = [(x, y, x + w, y + h) for x, y, w, h in subregions]
+            bad = next(
+                (i for i, b in enumerate(boxes) if b[2] > image_w or b[3] > image_h),
+                -1,
             )
-        if subregion["y"] + subregion["height"] > table_region_image_height:
+
+        if bad >= 0:
+            x, y, w, h = (int(v) for v in subregions[bad])
             raise ValueError(
-                f"Subregion exceeds image height: "
-                f"{subregion['y']} + {subregion['height']} > {table_region_image_height}"
+                f"Subregion {bad} "
+                + _subregion_bounds_error(x, y, w, h, image_w, image_h)
             )
 
-        return {
-            "left": subregion["x"],
-            "upper": subregion["y"],
-            "right": subregion["x"] + subregion["width"],
-            "lower": subregion["y"] + subregion["height"],
-        }
+        return boxes
 
     def validate_canvas_position(
         self,
@@ -241,16 +494,65 @@ class CoordinateUtils:
             Tuple of (is_valid, error_message or None)
         """
         x_drift = abs(original_box["x"] - current_box["x"])
-        y_drift = abs(original_box["y"] - current_box["y"])
-
         if x_drift > drift_threshold:
             return False, f"Canvas X position drifted by {x_drift}px (threshold: {drift_threshold}px)"
 
+        y_drift = abs(original_box["y"] - current_box["y"])
         if y_drift > drift_threshold:
             return False, f"Canvas Y position drifted by {y_drift}px (threshold: {drift_threshold}px)"
 
         return True, None
 
+    def validate_canvas_position_batch(
+        self,
+        original_box: Dict[str, int],
+        current_boxes: Sequence[Dict[str, int]],
+        drift_threshold: int = 5,
+    ):
+        """
+        Validate a series of canvas position samples against one original.
+
+        A NumPy ``(N, 2)`` or wider array of ``[x, y, ...]`` rows is checked
+        with vectorised column differences; any other sequence of box
+        dictionaries is checked in a single comprehension.
+
+        Args:
+            original_box: Original canvas bounding box
+            current_boxes: Canvas bounding box samples, e.g. one per check
+            drift_threshold: Maximum allowed drift in pixels
+
+        Returns:
+            Boolean array for array input, otherwise a list of bools;
+            True where the sample is within the threshold on both axes
+        """
+        ox = original_box["x"]
+        oy = original_box["y"]
+        if hasattr(current_boxes, "shape"):
+            return (
+                (abs(current_boxes[:, 0] - ox) <= drift_threshold)
+                & (abs(current_boxes[:, 1] - oy) <= drift_threshold)
+            )
+
+        valid: List[bool] = [
+            abs(box["x"] - ox) <= drift_threshold and abs(box["y"] - oy) <= drift_threshold
+            for box in current_boxes
+        ]
+        return valid
+
+
+def _subregion_bounds_error(
+    x: int,
+    y: int,
+    width: int,
+    height: int,
+    image_width: int,
+    image_height: int,
+) -> str:
+    """Describe which image edge an out-of-bounds subregion crosses."""
+    if x + width > image_width:
+        return f"exceeds image width: {x} + {width} > {image_width}"
+    return f"exceeds image height: {y} + {height} > {image_height}"
+
 
 def create_button_coordinates(
     blue_x: int,
@@ -280,3 +582,36 @@ def create_button_coordinates(
         "confirm": {"x": confirm_x, "y": confirm_y},
         "cancel": {"x": cancel_x, "y": cancel_y},
     }
+
+
+def create_button_xy(
+    blue_x: int,
+    blue_y: int,
+    red_x: int,
+    red_y: int,
+    confirm_x: int,
+    confirm_y: int,
+    cancel_x: int,
+    cancel_y: int,
+) -> Mapping[str, Tuple[int, int]]:
+    """
+    Create read-only button coordinates as (x, y) tuples.
+
+    Compact form of create_button_coordinates: one mapping and four tuples
+    instead of five dicts. get_click_coordinates accepts either form.
+
+    Args:
+        blue_x, blue_y: Blue team button coordinates
+        red_x, red_y: Red team button coordinates
+        confirm_x, confirm_y: Confirm (✓) button coordinates
+        cancel_x, cancel_y: Cancel (✗) button coordinates
+
+    Returns:
+        Read-only mapping of button name to (x, y)
+    """
+    return MappingProxyType({
+        "blue": (blue_x, blue_y),
+        "red": (red_x, red_y),
+        "confirm": (confirm_x, confirm_y),
+        "cancel": (cancel_x, cancel_y),
+    })
@@ -13,122 +13,181 @@ from .logger import get_logger
 
 logger = get_logger("env_manager")
 
+# KEY=VALUE with optional surrounding quotes and trailing comment;
+# groups 2/3/4 hold the double-quoted, single-quoted and bare value.
+# '#' only starts a comment after whitespace, so URL fragments such as
+# https://host/#/lobby survive unquoted.
+_ENV_RE = re.compile(
+    r"""^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\n]*?))(?:\s+#.*)?\s*$"""
+)
+
+_ENV_HEADER = (
+    "# Mini-Game Automation Configuration\n"
+    "# Auto-generated - Edit via UI or manually\n\n"
+)
+
+
+def _quote(value: str) -> str:
+    """Quote a value that would otherwise be split or cut off by the parser."""
+    if " " in value or "#" in value or "=" in value:
+        return f'"{value}"'
+    return value
+
 
 class EnvManager:
     """Manages .env file for application settings."""
 
     ENV_FILE = ".env"
 
-    @classmethod
-    def load_env(cls, env_file: Optional[str] = None) -> Dict[str, str]:
+    def __init__(self, env_file: Optional[str] = None):
         """
-        Load environment variables from .env file.
+        Initialize manager for one .env file.
 
         Args:
             env_file: Path to .env file (default: .env in current directory)
+        """
+        self._path = Path(env_file or self.ENV_FILE).resolve()
+        # Parsed file contents, reused until the file's st_mtime_ns changes
+        self._cached: Optional[Dict[str, str]] = None
+        self._cached_mtime: int = -1
+
+    def _refresh(self) -> Dict[str, str]:
+        """
+        Re-read the .env file if it changed since the last load.
 
         Returns:
-            Dictionary of environment variables
+            Cached file variables (not a copy)
         """
-        env_file = Path(env_file or cls.ENV_FILE)
-        env_vars = {}
+        try:
+            mtime_ns = self._path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = -1
 
-        if not env_file.exists():
-            logger.debug(f".env file not found: {env_file}")
-            return env_vars
+        if self._cached is not None and self._cached_mtime == mtime_ns:
+            return self._cached
 
-        try:
-            with open(env_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
+        env_vars = {}
+        if mtime_ns == -1:
+            logger.debug(f".env file not found: {self._path}")
+        else:
+            try:
+                # One read and a C-level split instead of per-line text I/O
+                with open(self._path, "rb") as f:
+                    text = f.read().decode("utf-8", errors="replace")
+
+                for line in text.splitlines():
                     # Skip empty lines and comments
-                    if not line or line.startswith("#"):
+                    if not line or line[0] == "#":
                         continue
 
-                    # Parse KEY=VALUE format
-                    if "=" in line:
-                        key, value = line.split("=", 1)
-                        key = key.strip()
-                        value = value.strip().strip('"').strip("'")
-                        env_vars[key] = value
+                    m = _ENV_RE.match(line)
+                    if m:
+                        env_vars[m.group(1)] = m.group(2) or m.group(3) or m.group(4) or ""
 
-            logger.debug(f"Loaded {len(env_vars)} variables from {env_file}")
-            return env_vars
+                logger.debug(f"Loaded {len(env_vars)} variables from {self._path}")
 
-        except Exception as e:
-            logger.error(f"Failed to load .env file: {e}")
-            return env_vars
+            except Exception as e:
+                logger.error(f"Failed to load .env file: {e}")
 
-    @classmethod
-    def get(cls, key: str, default: Optional[str] = None, env_file: Optional[str] = None) -> Optional[str]:
+        self._cached = env_vars
+        self._cached_mtime = mtime_ns
+        return env_vars
+
+    def load_env(self) -> Dict[str, str]:
         """
-        Get an environment variable from .env file or system environment.
+        Load environment variables from .env file.
+
+        Parsed contents are cached and reused until the file's
+        modification time changes.
+
+        Returns:
+            Dictionary of environment variables
+        """
+        return dict(self._refresh())
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Get an environment variable from system environment or .env file.
+
+        A non-empty system variable takes precedence over the .env file.
+        The environment is read on every call; only the file is cached.
 
         Args:
             key: Environment variable key
             default: Default value if not found
-            env_file: Path to .env file
 
         Returns:
             Value of the environment variable or default
         """
-        # First check system environment
-        value = os.getenv(key)
+        value = os.environ.get(key)
         if value:
             return value
+        return self._refresh().get(key, default)
 
-        # Then check .env file
-        env_vars = cls.load_env(env_file)
-        return env_vars.get(key, default)
-
-    @classmethod
-    def set(cls, key: str, value: str, env_file: Optional[str] = None) -> bool:
+    def set(self, key: str, value: str) -> bool:
         """
         Set an environment variable in .env file.
 
         Args:
             key: Environment variable key
             value: Value to set
-            env_file: Path to .env file
 
         Returns:
             True if saved successfully, False otherwise
         """
-        env_file = Path(env_file or cls.ENV_FILE)
-
         try:
-            # Load existing variables
-            env_vars = cls.load_env(env_file) if env_file.exists() else {}
+            # Load existing variables (empty if the file does not exist yet)
+            env_vars = self.load_env()
 
             # Update the variable
             env_vars[key] = value
 
-            # Write back to file
-            with open(env_file, "w", encoding="utf-8") as f:
-                # Write header comment
-                f.write("# Mini-Game Automation Configuration\n")
-                f.write("# Auto-generated - Edit via UI or manually\n\n")
+            # Write to a temp file in one go, then swap it in atomically
+            buf = [_ENV_HEADER]
+            buf.extend(f"{k}={_quote(v)}\n" for k, v in env_vars.items())
 
-                # Write variables
-                for k, v in env_vars.items():
-                    # Escape special characters in value
-                    if " " in v or "#" in v or "=" in v:
-                        v = f'"{v}"'
-                    f.write(f"{k}={v}\n")
+            tmp_file = self._path.with_name(self._path.name + ".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                f.write("".join(buf))
+            os.replace(tmp_file, self._path)
 
-            logger.info(f"Saved {key} to {env_file}")
+            logger.info(f"Saved {key} to {self._path}")
             return True
 
         except Exception as e:
             logger.error(f"Failed to save {key} to .env file: {e}")
             return False
 
+        finally:
+            self._cached = None
+
+    @classmethod
+    def _default(cls) -> "EnvManager":
+        """
+        Get the shared manager for the default .env file.
+
+        The path is resolved against the current directory on every call,
+        and a manager is created lazily the first time each path is used.
+
+        Returns:
+            Manager for ENV_FILE in the current directory
+        """
+        path = Path(cls.ENV_FILE).resolve()
+        manager = _defaults.get(path)
+        if manager is None:
+            manager = _defaults.setdefault(path, cls(str(path)))
+        return manager
+
     @classmethod
     def load_game_url(cls) -> Optional[str]:
         """Load GAME_URL from .env file or environment."""
-        return cls.get("GAME_URL")
+        return cls._default().get("GAME_URL")
 
     @classmethod
     def save_game_url(cls, url: str) -> bool:
         """Save GAME_URL to .env file."""
-        return cls.set("GAME_URL", url)
+        return cls._default().set("GAME_URL", url)
+
+
+# Shared managers for the default .env file, keyed by resolved path
+_defaults: Dict[Path, EnvManager] = {}
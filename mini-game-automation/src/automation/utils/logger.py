@@ -7,7 +7,7 @@ following the format: [LEVEL] [TIMESTAMP] [MODULE] [TABLE_ID] Message
 
 import logging
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -18,7 +18,12 @@ TIMESTAMP_FORMAT = "%Y-%m-%d_%H-%M-%S"
 
 
 class TableContextFilter(logging.Filter):
-    """Filter that adds table_id and timestamp to log records."""
+    """
+    Filter that adds table_id and timestamp to log records.
+
+    Needed by handlers that format with a plain logging.Formatter(LOG_FORMAT);
+    TableFormatter fills both fields itself.
+    """
 
     def __init__(self, default_table_id: str = "-"):
         super().__init__()
@@ -29,10 +34,43 @@ class TableContextFilter(logging.Filter):
         if not hasattr(record, "table_id"):
             record.table_id = self.default_table_id
         if not hasattr(record, "timestamp"):
-            record.timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
+            record.timestamp = time.strftime(TIMESTAMP_FORMAT, time.localtime(record.created))
         return True
 
 
+class TableFormatter(logging.Formatter):
+    """
+    Formatter producing LOG_FORMAT output.
+
+    Builds the line with an f-string instead of %-substituting LOG_FORMAT
+    against the record dict, and stamps TIMESTAMP_FORMAT at emit time.
+    """
+
+    def __init__(self):
+        super().__init__(LOG_FORMAT)
+        # TIMESTAMP_FORMAT has second resolution, so format once per second
+        self._last_sec = -1
+        self._last_str = ""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format record as [LEVEL] [TIMESTAMP] [MODULE] [TABLE_ID] Message."""
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_str = time.strftime(TIMESTAMP_FORMAT, time.localtime(sec))
+            self._last_sec = sec
+
+        table_id = getattr(record, "table_id", "-")
+        s = f"[{record.levelname}] [{self._last_str}] [{record.module}] [{table_id}] {record.getMessage()}"
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            s = f"{s}\n{record.exc_text}"
+        if record.stack_info:
+            s = f"{s}\n{self.formatStack(record.stack_info)}"
+        return s
+
+
 class TableLoggerAdapter(logging.LoggerAdapter):
     """Logger adapter that automatically includes table_id in messages."""
 
@@ -42,10 +80,12 @@ class TableLoggerAdapter(logging.LoggerAdapter):
 
     def process(self, msg: str, kwargs: dict) -> tuple:
         """Add table_id to extra dict."""
-        extra = kwargs.get("extra", {})
-        extra["table_id"] = str(self.table_id)
-        extra["timestamp"] = datetime.now().strftime(TIMESTAMP_FORMAT)
-        kwargs["extra"] = extra
+        extra = kwargs.get("extra")
+        if extra is None:
+            # Records only read extra, so the shared dict is safe to reuse
+            kwargs["extra"] = self.extra
+        else:
+            kwargs["extra"] = {**extra, **self.extra}
         return msg, kwargs
 
 
@@ -69,18 +109,16 @@ def setup_logging(
     # Clear existing handlers
     root_logger.handlers.clear()
 
-    # Create formatter
-    formatter = logging.Formatter(LOG_FORMAT)
-
-    # Add table context filter
-    context_filter = TableContextFilter()
+    # Create formatter. It defaults table_id itself, so no TableContextFilter
+    # is needed: a filter on this logger would never see records propagated
+    # from automation.* children, and one per handler runs once per handler.
+    formatter = TableFormatter()
 
     # Console handler
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(getattr(logging, log_level.upper()))
         console_handler.setFormatter(formatter)
-        console_handler.addFilter(context_filter)
         root_logger.addHandler(console_handler)
 
     # File handler
@@ -91,7 +129,6 @@ def setup_logging(
         file_handler = logging.FileHandler(log_file, encoding="utf-8")
         file_handler.setLevel(logging.DEBUG)  # Always log everything to file
         file_handler.setFormatter(formatter)
-        file_handler.addFilter(context_filter)
         root_logger.addHandler(file_handler)
 
 
@@ -131,9 +168,11 @@ def log_with_table(
         table_id: Table ID for context
         **kwargs: Additional context to include
     """
+    if not logger.isEnabledFor(level):
+        return
+
     extra = {
         "table_id": str(table_id),
-        "timestamp": datetime.now().strftime(TIMESTAMP_FORMAT),
         **kwargs,
     }
     logger.log(level, message, extra=extra)
@@ -158,9 +197,11 @@ def log_error_with_screenshot(
         error_type: Type of error for categorization
         **context: Additional context information
     """
+    if not logger.isEnabledFor(logging.ERROR):
+        return
+
     extra = {
         "table_id": str(table_id),
-        "timestamp": datetime.now().strftime(TIMESTAMP_FORMAT),
         "error_type": error_type,
         "screenshot_path": str(screenshot_path) if screenshot_path else None,
         **context,
@@ -4,8 +4,11 @@ Resource monitoring utilities for CPU and memory usage.
 Provides monitoring for auto-throttling based on CPU usage.
 """
 
+import sys
+import threading
+import time
 import psutil
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
 
 
@@ -42,6 +45,20 @@ class ResourceMonitor:
         self.cpu_throttle_threshold = cpu_throttle_threshold
         self.sample_interval = sample_interval
         self._last_cpu_percent = 0.0
+        # Consumers polling within one sample interval share a snapshot
+        self._cache_ttl = sample_interval
+        self._cache: Optional[Tuple[float, ResourceUsage]] = None
+        # On Linux, read aggregate CPU times straight from /proc/stat. The
+        # file is opened per sample so no handle is held, and the previous
+        # sample is swapped under a lock since the UI and scheduler threads
+        # share one monitor.
+        self._proc_stat_path: Optional[str] = "/proc/stat" if sys.platform == "linux" else None
+        self._prev_cpu_times: Optional[Tuple[int, int]] = None
+        self._cpu_times_lock = threading.Lock()
+        # Memory moves slowly; sample it on a coarser timer than CPU
+        self._mem_cache_ttl = 1.0
+        self._mem_cache_ts = 0.0
+        self._mem_cache = None
 
     def get_cpu_percent(self) -> float:
         """
@@ -50,12 +67,56 @@ class ResourceMonitor:
         Returns:
             CPU usage percentage (0-100)
         """
-        # Use interval=None for non-blocking call
-        # This returns the CPU percent since last call
-        cpu_percent = psutil.cpu_percent(interval=None)
+        cpu_percent = None
+        if self._proc_stat_path is not None:
+            cpu_percent = self._read_proc_stat_percent()
+        if cpu_percent is None:
+            # Use interval=None for non-blocking call
+            # This returns the CPU percent since last call
+            cpu_percent = psutil.cpu_percent(interval=None)
         self._last_cpu_percent = cpu_percent
         return cpu_percent
 
+    def _read_proc_stat_percent(self) -> Optional[float]:
+        """
+        Compute CPU percent since the last call from /proc/stat.
+
+        Returns:
+            CPU usage percentage, or None if /proc/stat could not be read
+        """
+        try:
+            with open(self._proc_stat_path, "rb") as f:
+                fields = f.readline().split()
+            # cpu user nice system idle iowait irq softirq steal ...
+            if fields[0] != b"cpu":
+                raise ValueError(f"unexpected first line: {fields[:1]}")
+            times = [int(v) for v in fields[1:9]]
+        except (OSError, ValueError, IndexError):
+            self._proc_stat_path = None
+            return None
+
+        total = sum(times)
+        idle = times[3] + times[4]
+        with self._cpu_times_lock:
+            prev = self._prev_cpu_times
+            self._prev_cpu_times = (total, idle)
+
+        # Like psutil, the first call has no baseline to compare against
+        if prev is None or total <= prev[0]:
+            return 0.0
+
+        total_delta = total - prev[0]
+        busy_delta = total_delta - (idle - prev[1])
+        return round(100.0 * busy_delta / total_delta, 1)
+
+    def _virtual_memory(self):
+        """Return psutil.virtual_memory(), re-sampled at most once per second."""
+        now = time.monotonic()
+        if self._mem_cache is None or now - self._mem_cache_ts >= self._mem_cache_ttl:
+            self._mem_cache = psutil.virtual_memory()
+            self._mem_cache_ts = now
+        return self._mem_cache
+
     def get_memory_info(self) -> Dict[str, float]:
         """
         Get current memory usage information.
@@ -63,7 +124,7 @@ class ResourceMonitor:
         Returns:
             Dictionary with memory usage stats
         """
-        memory = psutil.virtual_memory()
+        memory = self._virtual_memory()
         return {
             "percent": memory.percent,
             "used_mb": memory.used / (1024 * 1024),
@@ -75,18 +136,27 @@ class ResourceMonitor:
         """
         Get current resource usage snapshot.
 
+        Snapshots are reused for up to ``sample_interval`` seconds so that
+        several consumers polling together only hit psutil once.
+
         Returns:
             ResourceUsage dataclass with CPU and memory info
         """
+        now = time.monotonic()
+        if self._cache is not None and now - self._cache[0] < self._cache_ttl:
+            return self._cache[1]
+
         cpu_percent = self.get_cpu_percent()
-        memory = psutil.virtual_memory()
+        memory = self._virtual_memory()
 
-        return ResourceUsage(
+        usage = ResourceUsage(
             cpu_percent=cpu_percent,
             memory_percent=memory.percent,
             memory_used_mb=memory.used / (1024 * 1024),
             memory_available_mb=memory.available / (1024 * 1024),
         )
+        self._cache = (now, usage)
+        return usage
 
     def should_throttle(self) -> bool:
         """
@@ -95,7 +165,11 @@ class ResourceMonitor:
         Returns:
             True if CPU usage exceeds threshold (80%)
         """
-        cpu_percent = self.get_cpu_percent()
+        # Hot path: CPU only, no memory sampling
+        return self._throttle_from(self.get_cpu_percent())
+
+    def _throttle_from(self, cpu_percent: float) -> bool:
+        """Return whether the given CPU percentage exceeds the threshold."""
         return cpu_percent > self.cpu_throttle_threshold
 
     def get_throttle_factor(self) -> float:
@@ -110,8 +184,11 @@ class ResourceMonitor:
         Returns:
             Throttle factor multiplier
         """
-        cpu_percent = self._last_cpu_percent
+        # Hot path: reuse the last CPU sample instead of sampling again
+        return self._factor_from(self._last_cpu_percent)
 
+    def _factor_from(self, cpu_percent: float) -> float:
+        """Map a CPU percentage to its throttle factor."""
         if cpu_percent <= self.cpu_throttle_threshold:
             return 1.0
         elif cpu_percent <= 90:
@@ -140,7 +217,7 @@ class ResourceMonitor:
             Status string like "CPU: 45% | Memory: 62%"
         """
         usage = self.get_resource_usage()
-        throttle_status = " [THROTTLED]" if self.should_throttle() else ""
+        throttle_status = " [THROTTLED]" if self._throttle_from(usage.cpu_percent) else ""
         return (
             f"CPU: {usage.cpu_percent:.1f}%{throttle_status} | "
             f"Memory: {usage.memory_percent:.1f}%"
@@ -159,6 +236,6 @@ class ResourceMonitor:
             "memory_percent": usage.memory_percent,
             "memory_used_mb": usage.memory_used_mb,
             "memory_available_mb": usage.memory_available_mb,
-            "is_throttled": self.should_throttle(),
-            "throttle_factor": self.get_throttle_factor(),
+            "is_throttled": self._throttle_from(usage.cpu_percent),
+            "throttle_factor": self._factor_from(usage.cpu_percent),
         }
@@ -5,16 +5,77 @@ Provides validation for user-defined patterns and table region coordinates.
 """
 
 import re
-from typing import Optional, Tuple, Dict, Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Tuple, Dict, Any, List, Sequence, Union
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 # Pattern validation regex from architecture specification
 PATTERN_REGEX = r"^[BP]{3}-[BP](;[BP]{3}-[BP])*$"
 
+# Byte classes for matching PATTERN_REGEX without the regex engine:
+# B/P -> 1, '-' -> 2, ';' -> 3, anything else -> 0
+_PATTERN_TABLE = bytearray(256)
+_PATTERN_TABLE[ord("B")] = _PATTERN_TABLE[ord("P")] = 1
+_PATTERN_TABLE[ord("-")] = 2
+_PATTERN_TABLE[ord(";")] = 3
+_PATTERN_TABLE = bytes(_PATTERN_TABLE)
+_PATTERN_HEAD = b"\x01\x01\x01\x02\x01"  # "BBP-P"
+_PATTERN_UNIT = b"\x03" + _PATTERN_HEAD  # ";BBP-P"
+
+# Keys every region dictionary must provide
+_REGION_KEYS = frozenset(("x", "y", "width", "height"))
+
+
+def _matches(pattern_string: str, regex_pattern: str) -> bool:
+    """Check a stripped pattern string against the grammar."""
+    if regex_pattern != PATTERN_REGEX:
+        return bool(re.match(regex_pattern, pattern_string))
+
+    data = pattern_string.encode("utf-8")
+    n, rem = divmod(len(data) - 5, 6)
+    if n < 0 or rem:
+        return False
+    return data.translate(_PATTERN_TABLE) == _PATTERN_HEAD + _PATTERN_UNIT * n
+
+
+@lru_cache(maxsize=1024)
+def _validate_cached(pattern_string: str, regex_pattern: str) -> Tuple[bool, Optional[str]]:
+    """Validate a pattern string, memoized per (pattern, grammar)."""
+    pattern_string = pattern_string.strip()
+
+    if not pattern_string:
+        return False, "Pattern string cannot be empty or whitespace only"
+
+    if not _matches(pattern_string, regex_pattern):
+        return False, (
+            f"Invalid pattern format. Expected format: [BP]{{3}}-[BP] "
+            f"(e.g., 'BBP-P;BPB-B'). Got: '{pattern_string}'"
+        )
+
+    return True, None
+
+
+@lru_cache(maxsize=1024)
+def _parse_cached(pattern_string: str, regex_pattern: str) -> Tuple[Tuple[str, str], ...]:
+    """Split a valid, stripped pattern string into (history, decision) pairs."""
+    if regex_pattern == PATTERN_REGEX:
+        # Fixed width: pattern i is "HHH-D" starting at 6*i
+        n = (len(pattern_string) + 1) // 6
+        return tuple(
+            (pattern_string[6 * i:6 * i + 3], pattern_string[6 * i + 4])
+            for i in range(n)
+        )
+    return tuple(tuple(pattern.split("-")) for pattern in pattern_string.split(";"))
+
 
 class PatternFormatValidator:
     """Validator for pattern format strings."""
 
+    __slots__ = ("regex_pattern", "_compiled_regex")
+
     def __init__(self, regex_pattern: str = PATTERN_REGEX):
         """
         Initialize pattern validator.
@@ -38,12 +99,15 @@ class PatternFormatValidator:
         if not pattern_string or not isinstance(pattern_string, str):
             return False
 
-        return bool(self._compiled_regex.match(pattern_string.strip()))
+        return _validate_cached(pattern_string, self.regex_pattern)[0]
 
     def validate(self, pattern_string: str) -> Tuple[bool, Optional[str]]:
         """
         Validate a pattern string and return detailed error message.
 
+        Results are memoized per pattern string, since the same handful of
+        patterns is re-validated on every config reload.
+
         Args:
             pattern_string: Pattern string to validate
 
@@ -56,18 +120,7 @@ class PatternFormatValidator:
         if not isinstance(pattern_string, str):
             return False, f"Pattern must be a string, got {type(pattern_string).__name__}"
 
-        pattern_string = pattern_string.strip()
-
-        if not pattern_string:
-            return False, "Pattern string cannot be empty or whitespace only"
-
-        if not self._compiled_regex.match(pattern_string):
-            return False, (
-                f"Invalid pattern format. Expected format: [BP]{{3}}-[BP] "
-                f"(e.g., 'BBP-P;BPB-B'). Got: '{pattern_string}'"
-            )
-
-        return True, None
+        return _validate_cached(pattern_string, self.regex_pattern)
 
     def parse_patterns(self, pattern_string: str) -> list:
         """
@@ -86,20 +139,18 @@ class PatternFormatValidator:
         if not is_valid:
             raise ValueError(error)
 
-        patterns = []
-        for pattern in pattern_string.strip().split(";"):
-            history, decision = pattern.split("-")
-            patterns.append({
-                "history": history,
-                "decision": decision,
-            })
-
-        return patterns
+        # Fresh dicts each call so callers may mutate the result
+        return [
+            {"history": history, "decision": decision}
+            for history, decision in _parse_cached(pattern_string.strip(), self.regex_pattern)
+        ]
 
 
 class CoordinateValidator:
     """Validator for table region coordinates."""
 
+    __slots__ = ("max_width", "max_height")
+
     def __init__(
         self,
         max_width: int = 1920,
@@ -134,8 +185,15 @@ class CoordinateValidator:
         Returns:
             True if valid, False otherwise
         """
-        is_valid, _ = self.validate_region(x, y, width, height)
-        return is_valid
+        # Same checks as validate_region, without building error messages
+        return (
+            x >= 0
+            and y >= 0
+            and width > 0
+            and height > 0
+            and x + width <= self.max_width
+            and y + height <= self.max_height
+        )
 
     def validate_region(
         self,
@@ -188,10 +246,10 @@ class CoordinateValidator:
         Returns:
             Tuple of (is_valid, error_message or None)
         """
-        required_keys = {"x", "y", "width", "height"}
-        missing_keys = required_keys - set(region.keys())
-
-        if missing_keys:
+        # Four membership tests cover the usual complete dict; only build
+        # the missing-key set when something is absent
+        if not all(k in region for k in _REGION_KEYS):
+            missing_keys = set(_REGION_KEYS.difference(region))
             return False, f"Missing required keys: {missing_keys}"
 
         return self.validate_region(
@@ -211,19 +269,16 @@ class CoordinateValidator:
         Check if coordinates have drifted beyond threshold.
 
         Args:
-            original: Original coordinates dict
-            current: Current coordinates dict
+            original: Original coordinates dict with 'x' and 'y'
+            current: Current coordinates dict with 'x' and 'y'
             threshold: Maximum allowed drift in pixels
 
         Returns:
             Tuple of (has_drift, max_drift_amount)
         """
-        max_drift = 0
-
-        for key in ["x", "y"]:
-            if key in original and key in current:
-                drift = abs(original[key] - current[key])
-                max_drift = max(max_drift, drift)
+        dx = abs(original.get("x", 0) - current.get("x", 0))
+        dy = abs(original.get("y", 0) - current.get("y", 0))
+        max_drift = dx if dx > dy else dy
 
         return max_drift > threshold, max_drift
 
@@ -231,6 +286,8 @@ class CoordinateValidator:
 class TimerValidator:
     """Validator for timer values."""
 
+    __slots__ = ("click_threshold", "max_timer")
+
     def __init__(
         self,
         click_threshold: int = 6,
@@ -261,6 +318,25 @@ class TimerValidator:
         """
         return timer_value > self.click_threshold
 
+    def is_clickable_batch(
+        self,
+        timer_values: Union[Sequence[int], "np.ndarray"],
+    ) -> Union[List[bool], "np.ndarray"]:
+        """
+        Check clickability for several timers at once (e.g. one per table).
+
+        Args:
+            timer_values: Timer values; a NumPy array is compared in one
+                vectorised operation
+
+        Returns:
+            Boolean array for array input, otherwise a list of bools
+        """
+        threshold = self.click_threshold
+        if hasattr(timer_values, "shape"):
+            return timer_values > threshold
+        return [value > threshold for value in timer_values]
+
     def is_countdown_phase(self, timer_value: int) -> bool:
         """
         Check if timer is in countdown phase (not clickable).
@@ -310,3 +386,34 @@ class TimerValidator:
             and current_timer > reset_threshold
             and current_timer > previous_timer
         )
+
+    def detect_timer_reset_batch(
+        self,
+        previous_timers: Union[Sequence[int], "np.ndarray"],
+        current_timers: Union[Sequence[int], "np.ndarray"],
+        reset_threshold: int = 10,
+    ) -> Union[List[bool], "np.ndarray"]:
+        """
+        Detect timer resets for several tables at once.
+
+        Args:
+            previous_timers: Previous timer values, one per table
+            current_timers: Current timer values, one per table
+            reset_threshold: Minimum jump to consider as reset
+
+        Returns:
+            Boolean array for NumPy input, otherwise a list of bools
+        """
+        threshold = self.click_threshold
+        if hasattr(current_timers, "shape"):
+            return (
+                (previous_timers <= threshold)
+                & (current_timers > reset_threshold)
+                & (current_timers > previous_timers)
+            )
+
+        resets: List[bool] = [
+            prev <= threshold and curr > reset_threshold and curr > prev
+            for prev, curr in zip(previous_timers, current_timers)
+        ]
+        return resets
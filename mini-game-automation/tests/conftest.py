@@ -5,102 +5,144 @@ This file contains fixtures used across multiple test modules.
 """
 
 import pytest
-from pathlib import Path
+from types import MappingProxyType
 from PIL import Image
-import tempfile
-import shutil
 
 
-@pytest.fixture
-def temp_session_dir():
-    """Create a temporary session directory for testing."""
-    temp_dir = tempfile.mkdtemp(prefix="test_session_")
-    yield Path(temp_dir)
-    shutil.rmtree(temp_dir, ignore_errors=True)
+def pytest_configure(config):
+    """Register markers used by the suite."""
+    # Provided by pytest-xdist when installed; registered here so runs
+    # without it don't warn about an unknown marker
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run the marked tests on one xdist worker"
+    )
+
+
+# Shared read-only sample data. The session-scoped fixtures below hand out
+# these same objects, so tests must copy them before mutating.
+_SAMPLE_TABLE_REGION = {
+    "x": 100,
+    "y": 200,
+    "width": 300,
+    "height": 250,
+}
+
+_SAMPLE_ROUND_HISTORY = ["B", "B", "P"]
+
+_SAMPLE_TABLE_STATE = {
+    "table_id": 1,
+    "status": "active",
+    "learning_phase": False,
+    "rounds_watched": 5,
+    "round_history": ["B", "B", "P"],
+    "current_timer": 12,
+    "blue_score": 3,
+    "red_score": 2,
+    "previous_blue_score": 3,
+    "previous_red_score": 1,
+    "patterns": "BBP-P;BPB-B",
+}
+
+_SAMPLE_ROUND_DATA = {
+    "round_number": 1,
+    "timestamp": "2026-01-06_14-30-00",
+    "timer_start": 15,
+    "blue_score": 1,
+    "red_score": 0,
+    "winner": "P",
+    "decision_made": "blue",
+    "pattern_matched": "BBP-P",
+    "result": "correct",
+}
+
+_MOCK_CANVAS_BOX = {
+    "x": 0,
+    "y": 0,
+    "width": 1920,
+    "height": 1080,
+}
+
+_SAMPLE_BUTTON_COORDS = {
+    "blue": {"x": 10, "y": 20},
+    "red": {"x": 30, "y": 40},
+    "confirm": {"x": 50, "y": 60},
+    "cancel": {"x": 70, "y": 80},
+}
+
+# add_table() keyword arguments for one table. Read-only views, so a test
+# (or the code under test) writing to them fails loudly.
+_TABLE_CONFIG = MappingProxyType({
+    "table_region": MappingProxyType({"x": 100, "y": 200, "width": 300, "height": 250}),
+    "button_coords": MappingProxyType({
+        "blue": MappingProxyType({"x": 10, "y": 20}),
+        "red": MappingProxyType({"x": 30, "y": 40}),
+        "confirm": MappingProxyType({"x": 50, "y": 60}),
+        "cancel": MappingProxyType({"x": 70, "y": 80}),
+    }),
+    "timer_region": MappingProxyType({"x": 5, "y": 5, "width": 50, "height": 30}),
+    "blue_score_region": MappingProxyType({"x": 10, "y": 10, "width": 30, "height": 20}),
+    "red_score_region": MappingProxyType({"x": 40, "y": 10, "width": 30, "height": 20}),
+})
+
+# Blank 100x100 RGB image, allocated once at import
+_MOCK_SCREENSHOT = Image.new("RGB", (100, 100), color=(255, 255, 255))
 
 
 @pytest.fixture
+def temp_session_dir(tmp_path):
+    """Temporary session directory for testing (pytest cleans it up)."""
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
 def sample_table_region():
     """Sample table region coordinates for testing."""
-    return {
-        "x": 100,
-        "y": 200,
-        "width": 300,
-        "height": 250,
-    }
+    return _SAMPLE_TABLE_REGION
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_patterns():
     """Sample pattern string for testing."""
     return "BBP-P;BPB-B;BBB-P;PPP-B"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_round_history():
     """Sample round history for testing."""
-    return ["B", "B", "P"]
+    return _SAMPLE_ROUND_HISTORY
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_screenshot():
-    """Create a mock screenshot image for testing."""
-    # Create a simple test image (100x100 RGB)
-    img = Image.new("RGB", (100, 100), color=(255, 255, 255))
-    return img
+    """Mock screenshot image for testing (shared; do not draw on it)."""
+    return _MOCK_SCREENSHOT
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_table_state():
     """Sample table state for testing."""
-    return {
-        "table_id": 1,
-        "status": "active",
-        "learning_phase": False,
-        "rounds_watched": 5,
-        "round_history": ["B", "B", "P"],
-        "current_timer": 12,
-        "blue_score": 3,
-        "red_score": 2,
-        "previous_blue_score": 3,
-        "previous_red_score": 1,
-        "patterns": "BBP-P;BPB-B",
-    }
+    return _SAMPLE_TABLE_STATE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_round_data():
     """Sample round data for testing JSON persistence."""
-    return {
-        "round_number": 1,
-        "timestamp": "2026-01-06_14-30-00",
-        "timer_start": 15,
-        "blue_score": 1,
-        "red_score": 0,
-        "winner": "P",
-        "decision_made": "blue",
-        "pattern_matched": "BBP-P",
-        "result": "correct",
-    }
+    return _SAMPLE_ROUND_DATA
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_canvas_box():
     """Mock canvas bounding box for coordinate testing."""
-    return {
-        "x": 0,
-        "y": 0,
-        "width": 1920,
-        "height": 1080,
-    }
+    return _MOCK_CANVAS_BOX
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_button_coords():
     """Sample button coordinates for testing."""
-    return {
-        "blue": {"x": 10, "y": 20},
-        "red": {"x": 30, "y": 40},
-        "confirm": {"x": 50, "y": 60},
-        "cancel": {"x": 70, "y": 80},
-    }
+    return _SAMPLE_BUTTON_COORDS
+
+
+@pytest.fixture(scope="session")
+def table_config():
+    """Read-only add_table() region and button arguments for testing."""
+    return _TABLE_CONFIG
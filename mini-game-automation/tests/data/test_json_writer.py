@@ -9,7 +9,7 @@ import json
 import threading
 import time
 from pathlib import Path
-from src.automation.data.json_writer import JSONWriter
+from src.automation.data.json_writer import JSONWriter, journal_path
 
 
 class TestJSONWriter:
@@ -147,6 +147,46 @@ class TestJSONWriter:
         assert loaded["statistics"]["correct_decisions"] == 1
         assert loaded["statistics"]["accuracy"] == 50.0
 
+    def test_append_round_journals_until_compacted(self, temp_session_dir):
+        """Test rounds go to the journal and compact folds them back."""
+        writer = JSONWriter()
+        filepath = temp_session_dir / "table_1.json"
+        writer.write(filepath, {"table_id": 1, "rounds": [], "statistics": {}})
+
+        writer.append_round(filepath, {"result": "correct", "decision_made": "blue"}, table_id=1)
+        writer.append_round(filepath, {"result": "incorrect", "decision_made": "red"}, table_id=1)
+
+        with open(filepath) as f:
+            assert json.load(f)["rounds"] == []
+        assert journal_path(filepath).exists()
+        assert len(writer.read(filepath)["rounds"]) == 2
+
+        assert writer.compact(filepath, table_id=1) is True
+        assert not journal_path(filepath).exists()
+        with open(filepath) as f:
+            loaded = json.load(f)
+        assert len(loaded["rounds"]) == 2
+        assert loaded["statistics"]["accuracy"] == 50.0
+
+    def test_append_round_commits_through_journal_only(self, temp_session_dir):
+        """Test append_round leaves the table file alone and stats follow the journal."""
+        writer = JSONWriter()
+        filepath = temp_session_dir / "table_1.json"
+        writer.write(filepath, {
+            "table_id": 1,
+            "rounds": [{"result": "correct", "decision_made": "blue"}],
+            "statistics": {"total_rounds": 1, "correct_decisions": 1, "accuracy": 100.0},
+        })
+        before = filepath.read_bytes()
+
+        writer.append_round(filepath, {"result": "incorrect", "decision_made": "red"}, table_id=1)
+        writer.append_round(filepath, {"result": None, "decision_made": None}, table_id=1)
+
+        assert filepath.read_bytes() == before
+        assert writer.read(filepath)["statistics"] == {
+            "total_rounds": 3, "correct_decisions": 1, "accuracy": 50.0,
+        }
+
     def test_update_patterns(self, temp_session_dir):
         """Test updating patterns."""
         writer = JSONWriter()
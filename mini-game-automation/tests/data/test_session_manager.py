@@ -99,10 +99,12 @@ class TestSessionManager:
         manager.register_table(2)
         manager.register_table(3)
         
-        assert len(manager._active_tables) == 3
-        assert 1 in manager._active_tables
-        assert 2 in manager._active_tables
-        assert 3 in manager._active_tables
+        assert manager.active_tables == [1, 2, 3]
+        assert manager.is_table_active(1)
+        assert manager.is_table_active(2)
+        assert manager.is_table_active(3)
+        assert not manager.is_table_active(4)
+        assert not manager.is_table_active(-1)
 
     def test_unregister_table(self, temp_session_dir):
         """Test unregistering a table."""
@@ -110,10 +112,11 @@ class TestSessionManager:
         manager.create_session()
         
         manager.register_table(1)
-        assert 1 in manager._active_tables
+        assert manager.is_table_active(1)
         
         manager.unregister_table(1)
-        assert 1 not in manager._active_tables
+        assert not manager.is_table_active(1)
+        assert manager.active_tables == []
 
     def test_end_session(self, temp_session_dir):
         """Test ending a session."""
@@ -57,26 +57,11 @@ class TestMultiTableManager:
         assert len(manager._tables) == 0
         assert manager._is_running is False
 
-    def test_add_table(self, manager):
+    def test_add_table(self, manager, table_config):
         """Test adding a table."""
-        table_region = {"x": 100, "y": 200, "width": 300, "height": 250}
-        button_coords = {
-            "blue": {"x": 10, "y": 20},
-            "red": {"x": 30, "y": 40},
-            "confirm": {"x": 50, "y": 60},
-            "cancel": {"x": 70, "y": 80},
-        }
-        timer_region = {"x": 5, "y": 5, "width": 50, "height": 30}
-        blue_score = {"x": 10, "y": 10, "width": 30, "height": 20}
-        red_score = {"x": 40, "y": 10, "width": 30, "height": 20}
-        
         result = manager.add_table(
             table_id=1,
-            table_region=table_region,
-            button_coords=button_coords,
-            timer_region=timer_region,
-            blue_score_region=blue_score,
-            red_score_region=red_score,
+            **table_config,
             patterns="BBP-P",
         )
         
@@ -85,85 +70,44 @@ class TestMultiTableManager:
         assert 1 in manager._table_configs
         assert 1 in manager._table_locks
 
-    def test_add_table_max_limit(self, manager):
+    def test_add_table_max_limit(self, manager, table_config):
         """Test adding tables up to MAX_TABLES limit."""
-        table_region = {"x": 100, "y": 200, "width": 300, "height": 250}
-        button_coords = {"blue": {"x": 10, "y": 20}, "red": {"x": 30, "y": 40},
-                        "confirm": {"x": 50, "y": 60}, "cancel": {"x": 70, "y": 80}}
-        timer_region = {"x": 5, "y": 5, "width": 50, "height": 30}
-        blue_score = {"x": 10, "y": 10, "width": 30, "height": 20}
-        red_score = {"x": 40, "y": 10, "width": 30, "height": 20}
-        
         # Add MAX_TABLES tables
         for i in range(1, MAX_TABLES + 1):
             result = manager.add_table(
                 table_id=i,
-                table_region=table_region,
-                button_coords=button_coords,
-                timer_region=timer_region,
-                blue_score_region=blue_score,
-                red_score_region=red_score,
+                **table_config,
             )
             assert result is True
         
         # Try to add one more (should fail)
         result = manager.add_table(
             table_id=MAX_TABLES + 1,
-            table_region=table_region,
-            button_coords=button_coords,
-            timer_region=timer_region,
-            blue_score_region=blue_score,
-            red_score_region=red_score,
+            **table_config,
         )
         assert result is False
 
-    def test_add_duplicate_table(self, manager):
+    def test_add_duplicate_table(self, manager, table_config):
         """Test adding duplicate table returns False."""
-        table_region = {"x": 100, "y": 200, "width": 300, "height": 250}
-        button_coords = {"blue": {"x": 10, "y": 20}, "red": {"x": 30, "y": 40},
-                        "confirm": {"x": 50, "y": 60}, "cancel": {"x": 70, "y": 80}}
-        timer_region = {"x": 5, "y": 5, "width": 50, "height": 30}
-        blue_score = {"x": 10, "y": 10, "width": 30, "height": 20}
-        red_score = {"x": 40, "y": 10, "width": 30, "height": 20}
-        
         # Add table once
         result1 = manager.add_table(
             table_id=1,
-            table_region=table_region,
-            button_coords=button_coords,
-            timer_region=timer_region,
-            blue_score_region=blue_score,
-            red_score_region=red_score,
+            **table_config,
         )
         assert result1 is True
         
         # Try to add again
         result2 = manager.add_table(
             table_id=1,
-            table_region=table_region,
-            button_coords=button_coords,
-            timer_region=timer_region,
-            blue_score_region=blue_score,
-            red_score_region=red_score,
+            **table_config,
         )
         assert result2 is False
 
-    def test_remove_table(self, manager):
+    def test_remove_table(self, manager, table_config):
         """Test removing a table."""
-        table_region = {"x": 100, "y": 200, "width": 300, "height": 250}
-        button_coords = {"blue": {"x": 10, "y": 20}, "red": {"x": 30, "y": 40},
-                        "confirm": {"x": 50, "y": 60}, "cancel": {"x": 70, "y": 80}}
-        timer_region = {"x": 5, "y": 5, "width": 50, "height": 30}
-        blue_score = {"x": 10, "y": 10, "width": 30, "height": 20}
-        red_score = {"x": 40, "y": 10, "width": 30, "height": 20}
-        
         manager.add_table(
             table_id=1,
-            table_region=table_region,
-            button_coords=button_coords,
-            timer_region=timer_region,
-            blue_score_region=blue_score,
-            red_score_region=red_score,
+            **table_config,
         )
         
         result = manager.remove_table(1)
@@ -175,22 +119,11 @@ class TestMultiTableManager:
         result = manager.remove_table(999)
         assert result is False
 
-    def test_set_patterns(self, manager):
+    def test_set_patterns(self, manager, table_config):
         """Test setting patterns for a table."""
-        table_region = {"x": 100, "y": 200, "width": 300, "height": 250}
-        button_coords = {"blue": {"x": 10, "y": 20}, "red": {"x": 30, "y": 40},
-                        "confirm": {"x": 50, "y": 60}, "cancel": {"x": 70, "y": 80}}
-        timer_region = {"x": 5, "y": 5, "width": 50, "height": 30}
-        blue_score = {"x": 10, "y": 10, "width": 30, "height": 20}
-        red_score = {"x": 40, "y": 10, "width": 30, "height": 20}
-        
         manager.add_table(
             table_id=1,
-            table_region=table_region,
-            button_coords=button_coords,
-            timer_region=timer_region,
-            blue_score_region=blue_score,
-            red_score_region=red_score,
+            **table_config,
         )
         
         result = manager.set_patterns(1, "BBP-P;BPB-B")
@@ -199,22 +132,54 @@ class TestMultiTableManager:
         tracker = manager._tables[1]
         assert tracker.state.patterns == "BBP-P;BPB-B"
 
-    def test_get_table_status(self, manager):
+    def test_set_patterns_does_not_wait_for_table_lock(self, manager, table_config):
+        """Test the UI-thread pattern update isn't blocked by table processing."""
+        manager.cache_manager = MagicMock()
+        manager.add_table(table_id=1, **table_config)
+        results = []
+
+        with manager._table_locks[1]:
+            t = threading.Thread(target=lambda: results.append(manager.set_patterns(1, "BBP-P")))
+            t.start()
+            t.join(timeout=2)
+
+        assert results == [True]
+
+    @pytest.mark.asyncio
+    async def test_process_table_clicks_without_table_lock(self, manager, table_config):
+        """Test the click awaits run after the table lock is released."""
+        from unittest.mock import AsyncMock
+
+        manager.cache_manager = MagicMock()
+        manager.add_table(table_id=1, **table_config)
+        lock = manager._table_locks[1]
+        tracker = MagicMock()
+        tracker.detect_new_round.return_value = False
+        tracker.should_make_decision.return_value = True
+        tracker.get_decision.return_value = "blue"
+        manager._tables[1] = tracker
+
+        manager.screenshot_capture.capture_region = AsyncMock(return_value=object())
+        manager.image_extractor = MagicMock()
+        manager.image_extractor.extract_game_state.return_value = Mock(
+            timer=12, blue_score=0, red_score=0
+        )
+        lock_held_during_click = []
+        manager.browser_manager.get_canvas_box_with_retry = AsyncMock(
+            return_value={"x": 0, "y": 0, "width": 800, "height": 600}
+        )
+        manager.click_executor.execute_two_phase_click = AsyncMock(
+            side_effect=lambda **kwargs: lock_held_during_click.append(lock.locked())
+        )
+
+        assert await manager.process_table(1) is True
+        assert lock_held_during_click == [False]
+
+    def test_get_table_status(self, manager, table_config):
         """Test getting table status."""
-        table_region = {"x": 100, "y": 200, "width": 300, "height": 250}
-        button_coords = {"blue": {"x": 10, "y": 20}, "red": {"x": 30, "y": 40},
-                        "confirm": {"x": 50, "y": 60}, "cancel": {"x": 70, "y": 80}}
-        timer_region = {"x": 5, "y": 5, "width": 50, "height": 30}
-        blue_score = {"x": 10, "y": 10, "width": 30, "height": 20}
-        red_score = {"x": 40, "y": 10, "width": 30, "height": 20}
-        
         manager.add_table(
             table_id=1,
-            table_region=table_region,
-            button_coords=button_coords,
-            timer_region=timer_region,
-            blue_score_region=blue_score,
-            red_score_region=red_score,
+            **table_config,
         )
         
         status = manager.get_table_status(1)
@@ -222,33 +187,34 @@ class TestMultiTableManager:
         assert "table_id" in status
         assert "status" in status
 
-    def test_get_all_table_statuses(self, manager):
+    def test_get_all_table_statuses(self, manager, table_config):
         """Test getting all table statuses."""
-        table_region = {"x": 100, "y": 200, "width": 300, "height": 250}
-        button_coords = {"blue": {"x": 10, "y": 20}, "red": {"x": 30, "y": 40},
-                        "confirm": {"x": 50, "y": 60}, "cancel": {"x": 70, "y": 80}}
-        timer_region = {"x": 5, "y": 5, "width": 50, "height": 30}
-        blue_score = {"x": 10, "y": 10, "width": 30, "height": 20}
-        red_score = {"x": 40, "y": 10, "width": 30, "height": 20}
-        
         manager.add_table(
             table_id=1,
-            table_region=table_region,
-            button_coords=button_coords,
-            timer_region=timer_region,
-            blue_score_region=blue_score,
-            red_score_region=red_score,
+            **table_config,
         )
         manager.add_table(
             table_id=2,
-            table_region=table_region,
-            button_coords=button_coords,
-            timer_region=timer_region,
-            blue_score_region=blue_score,
-            red_score_region=red_score,
+            **table_config,
         )
         
         statuses = manager.get_all_table_statuses()
         assert len(statuses) == 2
         assert 1 in statuses
         assert 2 in statuses
+
+    def test_status_json_reused_until_status_changes(self, manager):
+        """Test encoded statuses are cached until a tracker publishes."""
+        import json
+        from src.automation.orchestration.table_tracker import TableTracker
+
+        manager._tables[1] = TableTracker(table_id=1)
+
+        first = manager.get_all_table_statuses_json()
+        assert manager.get_all_table_statuses_json() is first
+        assert json.loads(first)["1"]["table_id"] == 1
+
+        manager._tables[1].update_timer(12)
+        second = manager.get_all_table_statuses_json()
+        assert second is not first
+        assert json.loads(second)["1"]["timer"] == 12
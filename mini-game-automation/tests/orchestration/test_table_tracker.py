@@ -61,6 +61,17 @@ class TestTableTracker:
         assert len(tracker.state.round_history) == 3
         assert tracker.state.round_history == ["P", "B", "P"]
 
+    def test_add_round_normalizes_winner(self):
+        """Test lowercase winners are stored uppercase and others rejected."""
+        tracker = TableTracker(table_id=1)
+
+        assert tracker.add_round("p") == "P"
+        assert tracker.state.round_history == ["P"]
+
+        with pytest.raises(ValueError):
+            tracker.add_round("X")
+        assert tracker.state.rounds_watched == 1
+
     def test_learning_phase_completion(self):
         """Test learning phase completes after 3 rounds."""
         tracker = TableTracker(table_id=1)
@@ -226,3 +237,19 @@ class TestTableTracker:
         assert state_dict["table_id"] == 1
         assert "status" in state_dict
         assert "round_history" in state_dict
+
+    def test_status_snapshot_reused_until_change(self):
+        """Test the status snapshot is only rebuilt after a state change."""
+        tracker = TableTracker(table_id=1)
+
+        snapshot = tracker.get_status_snapshot()
+        assert tracker.get_status_snapshot() is snapshot
+        assert snapshot["timer"] is None
+
+        tracker.update_timer(12)
+        updated = tracker.get_status_snapshot()
+        assert updated is not snapshot
+        assert updated["timer"] == 12
+
+        tracker.pause()
+        assert tracker.get_status_snapshot()["status"] == TableStatus.PAUSED.value
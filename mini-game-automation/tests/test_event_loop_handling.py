@@ -7,25 +7,37 @@ to ensure Playwright Page objects work correctly across threads.
 
 import pytest
 import asyncio
+import concurrent.futures
 import threading
-import time
 from unittest.mock import MagicMock, AsyncMock, patch, call
 from typing import Optional
 
 from src.automation.main import AutomationApp
 
 
+@pytest.fixture(scope="class")
+def shared_app():
+    """AutomationApp constructed once per test class."""
+    return AutomationApp()
+
+
+@pytest.fixture
+def app(shared_app):
+    """Shared AutomationApp, with the per-test loop and UI state reset."""
+    yield shared_app
+    shared_app.browser_event_loop = None
+    shared_app.ui_window = None
+
+
 class TestEventLoopStorage:
     """Test event loop storage in AutomationApp."""
 
-    def test_browser_event_loop_initialized_as_none(self):
+    def test_browser_event_loop_initialized_as_none(self, app):
         """Test that browser_event_loop is initialized as None."""
-        app = AutomationApp()
         assert app.browser_event_loop is None
 
-    def test_browser_event_loop_type_hint(self):
+    def test_browser_event_loop_type_hint(self, app):
         """Test that browser_event_loop has correct type."""
-        app = AutomationApp()
         # Should accept None or AbstractEventLoop
         assert app.browser_event_loop is None or isinstance(app.browser_event_loop, asyncio.AbstractEventLoop)
 
@@ -33,8 +45,7 @@ class TestEventLoopStorage:
 class TestEventLoopLifecycle:
     """Test event loop lifecycle management."""
 
-    @pytest.mark.asyncio
-    async def test_event_loop_stored_when_browser_opens(self):
+    def test_event_loop_stored_when_browser_opens(self):
         """Test that event loop is stored when browser opens."""
         app = AutomationApp()
         
@@ -51,22 +62,25 @@ class TestEventLoopLifecycle:
             app._open_browser_only = mock_open_browser
             
             # Create a thread that will set up the event loop
-            loop_created = threading.Event()
             loop_stored = threading.Event()
+            cleanup_gate = threading.Event()
+            done = threading.Event()
             
             def open_thread():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                app.browser_event_loop = loop
-                loop_stored.set()
-                
-                # Wait a bit to verify loop is stored
-                time.sleep(0.1)
-                loop_created.set()
-                
-                # Clean up
-                loop.close()
-                app.browser_event_loop = None
+                try:
+                    loop = asyncio.new_event_loop()
+                    asyncio.set_event_loop(loop)
+                    app.browser_event_loop = loop
+                    loop_stored.set()
+                    
+                    # Hold the loop until the main thread has checked it
+                    cleanup_gate.wait(timeout=2.0)
+                    
+                    # Clean up
+                    loop.close()
+                    app.browser_event_loop = None
+                finally:
+                    done.set()
             
             thread = threading.Thread(target=open_thread, daemon=True)
             thread.start()
@@ -78,13 +92,16 @@ class TestEventLoopLifecycle:
             assert app.browser_event_loop is not None
             assert isinstance(app.browser_event_loop, asyncio.AbstractEventLoop)
             
-            # Wait for cleanup
-            thread.join(timeout=2.0)
+            # Let the thread clean up
+            cleanup_gate.set()
+            assert done.wait(timeout=1.0)
+            thread.join(0.1)
             assert app.browser_event_loop is None
 
     def test_event_loop_cleaned_up_on_error(self):
         """Test that event loop is cleaned up even on error."""
         app = AutomationApp()
+        done = threading.Event()
         
         def open_thread_with_error():
             loop = asyncio.new_event_loop()
@@ -96,117 +113,72 @@ class TestEventLoopLifecycle:
             finally:
                 loop.close()
                 app.browser_event_loop = None
+                done.set()
         
         thread = threading.Thread(target=open_thread_with_error, daemon=True)
         thread.start()
-        thread.join(timeout=1.0)
+        assert done.wait(timeout=1.0)
+        thread.join(0.1)
         
         # Verify cleanup happened
         assert app.browser_event_loop is None
 
 
+@pytest.fixture(scope="class")
+def bg_loop():
+    """Event loop running in a background thread, shared by a test class."""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="bg-asyncio", daemon=True)
+    thread.start()
+    yield loop
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=2.0)
+    loop.close()
+
+
 class TestRunCoroutineThreadsafe:
     """Test run_coroutine_threadsafe usage."""
 
-    def test_run_coroutine_threadsafe_with_stored_loop(self):
+    def test_run_coroutine_threadsafe_with_stored_loop(self, bg_loop):
         """Test that run_coroutine_threadsafe works with stored loop."""
         app = AutomationApp()
-        
-        # Create and store an event loop
-        loop = asyncio.new_event_loop()
-        app.browser_event_loop = loop
-        
-        result_container = {'value': None}
+        app.browser_event_loop = bg_loop
         
         async def test_coroutine():
             await asyncio.sleep(0.01)
-            result_container['value'] = 'success'
             return 'success'
         
-        def thread_function():
-            asyncio.set_event_loop(loop)
-            
-            # Keep loop running
-            async def keepalive():
-                while True:
-                    await asyncio.sleep(0.1)
-            
-            loop.create_task(keepalive())
-            
-            # Run coroutine using run_coroutine_threadsafe
-            future = asyncio.run_coroutine_threadsafe(test_coroutine(), loop)
-            result = future.result(timeout=1.0)
-            
-            result_container['value'] = result
-            loop.stop()
-        
-        thread = threading.Thread(target=thread_function, daemon=True)
-        thread.start()
-        
-        # Run the loop in main thread
-        try:
-            loop.run_forever()
-        except:
-            pass
+        # Run coroutine on the stored loop from this (non-loop) thread
+        future = asyncio.run_coroutine_threadsafe(test_coroutine(), app.browser_event_loop)
+        assert future.result(timeout=1.0) == 'success'
         
-        thread.join(timeout=2.0)
-        
-        # Verify result
-        assert result_container['value'] == 'success'
-        
-        # Cleanup
-        loop.close()
         app.browser_event_loop = None
 
-    def test_run_coroutine_threadsafe_timeout(self):
+    def test_run_coroutine_threadsafe_timeout(self, bg_loop):
         """Test run_coroutine_threadsafe timeout handling."""
         app = AutomationApp()
-        
-        loop = asyncio.new_event_loop()
-        app.browser_event_loop = loop
+        app.browser_event_loop = bg_loop
         
         async def slow_coroutine():
-            await asyncio.sleep(2.0)
+            await asyncio.sleep(0.5)
             return 'too slow'
         
-        def thread_function():
-            asyncio.set_event_loop(loop)
-            
-            async def keepalive():
-                while True:
-                    await asyncio.sleep(0.1)
-            
-            loop.create_task(keepalive())
-            
-            future = asyncio.run_coroutine_threadsafe(slow_coroutine(), loop)
-            
-            with pytest.raises(Exception):  # TimeoutError or similar
-                future.result(timeout=0.1)
-            
-            loop.stop()
-        
-        thread = threading.Thread(target=thread_function, daemon=True)
-        thread.start()
+        future = asyncio.run_coroutine_threadsafe(slow_coroutine(), app.browser_event_loop)
         
-        try:
-            loop.run_forever()
-        except:
-            pass
+        with pytest.raises(concurrent.futures.TimeoutError):
+            future.result(timeout=0.1)
         
-        thread.join(timeout=3.0)
+        # Don't leave the slow coroutine pending on the shared loop
+        future.cancel()
         
-        # Cleanup
-        loop.close()
         app.browser_event_loop = None
 
 
 class TestGetBrowserEventLoop:
     """Test get_browser_event_loop method."""
 
-    def test_get_browser_event_loop_returns_stored_loop(self):
+    def test_get_browser_event_loop_returns_stored_loop(self, app):
         """Test that get_browser_event_loop returns stored loop."""
-        app = AutomationApp()
-        
         # Create UI window mock
         mock_ui_window = MagicMock()
         app.ui_window = mock_ui_window
@@ -224,12 +196,9 @@ class TestGetBrowserEventLoop:
         
         # Cleanup
         loop.close()
-        app.browser_event_loop = None
 
-    def test_get_browser_event_loop_returns_none_when_not_set(self):
+    def test_get_browser_event_loop_returns_none_when_not_set(self, app):
         """Test that get_browser_event_loop returns None when not set."""
-        app = AutomationApp()
-        
         mock_ui_window = MagicMock()
         app.ui_window = mock_ui_window
         app.ui_window.get_browser_event_loop = lambda: app.browser_event_loop
@@ -8,11 +8,58 @@ and coordinate capture functionality.
 import pytest
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 
 from src.automation.ui.coordinate_picker import CoordinatePicker
 
 
+# page.evaluate results leading up to waitForResult in a normal pick:
+# body_exists check, script injection, picker_exists check,
+# overlay_visible check, setMode call
+PICKER_INIT_PREFIX = (True, 'Picker initialized successfully', True, True, None)
+
+# Read-only waitForResult payloads; the picker hands them back unchanged
+_TABLE_RESULT = MappingProxyType({'x': 100, 'y': 200, 'width': 300, 'height': 250})
+_NEXT_TABLE_RESULT = MappingProxyType({'x': 200, 'y': 300, 'width': 400, 'height': 350})
+_BUTTON_RESULT = MappingProxyType({'x': 150, 'y': 250})
+_REGION_RESULT = MappingProxyType({'x': 50, 'y': 50, 'width': 100, 'height': 50})
+
+_PICKER_SCRIPT = CoordinatePicker.PICKER_SCRIPT
+# Overlay creation and mode setting markers the injected script must contain
+_REQUIRED_SUBSTRINGS = (
+    '__coordinatePickerOverlay',
+    'document.createElement',
+    'position: fixed',
+    'setMode',
+    'table',
+    'button',
+)
+
+
+def _scripted_evaluate(results):
+    """Build a page.evaluate stand-in returning (or raising) results in order."""
+    cursor = iter(results)
+
+    async def _evaluate(*args, **kwargs):
+        value = next(cursor)
+        if isinstance(value, BaseException):
+            raise value
+        return value
+
+    return _evaluate
+
+
+@pytest.fixture
+def picker_page():
+    """Mock Playwright page; tests set evaluate as needed."""
+    # Only wait_for_load_state and evaluate are awaited by the picker
+    page = MagicMock()
+    page.wait_for_load_state = AsyncMock()
+    page.evaluate = AsyncMock()
+    return page
+
+
 class TestCoordinatePickerInitialization:
     """Test CoordinatePicker initialization."""
 
@@ -38,92 +85,42 @@ class TestCoordinatePickerInitialization:
 class TestCoordinatePickerScriptInjection:
     """Test JavaScript script injection."""
 
-    @pytest.mark.asyncio
-    async def test_picker_script_exists(self):
+    def test_picker_script_exists(self):
         """Test that PICKER_SCRIPT is defined."""
         assert hasattr(CoordinatePicker, 'PICKER_SCRIPT')
         assert isinstance(CoordinatePicker.PICKER_SCRIPT, str)
         assert len(CoordinatePicker.PICKER_SCRIPT) > 0
 
-    @pytest.mark.asyncio
-    async def test_picker_script_contains_overlay_creation(self):
-        """Test that script creates overlay element."""
-        script = CoordinatePicker.PICKER_SCRIPT
-        assert '__coordinatePickerOverlay' in script
-        assert 'document.createElement' in script
-        assert 'position: fixed' in script
-
-    @pytest.mark.asyncio
-    async def test_picker_script_contains_mode_setting(self):
-        """Test that script supports mode setting."""
-        script = CoordinatePicker.PICKER_SCRIPT
-        assert 'setMode' in script
-        assert 'table' in script
-        assert 'button' in script
+    @pytest.mark.parametrize("marker", _REQUIRED_SUBSTRINGS)
+    def test_picker_script_contains(self, marker):
+        """Test that script creates the overlay and supports mode setting."""
+        assert marker in _PICKER_SCRIPT
 
 
 class TestCoordinatePickerTableRegion:
     """Test table region picking functionality."""
 
-    @pytest.mark.asyncio
-    async def test_pick_table_region_success(self):
-        """Test successful table region picking."""
-        mock_page = AsyncMock()
-        mock_page.wait_for_load_state = AsyncMock()
-        mock_page.evaluate = AsyncMock(side_effect=[
-            True,  # body_exists check
-            'Picker initialized successfully',  # script injection
-            True,  # picker_exists check
-            True,  # overlay_visible check
-            None,  # setMode call
-            {'x': 100, 'y': 200, 'width': 300, 'height': 250}  # waitForResult
-        ])
-        
-        picker = CoordinatePicker(mock_page)
-        result = await picker.pick_table_region()
-        
-        assert result is not None
-        assert result['x'] == 100
-        assert result['y'] == 200
-        assert result['width'] == 300
-        assert result['height'] == 250
-        assert picker.is_active is False
-
-    @pytest.mark.asyncio
-    async def test_pick_table_region_cancelled(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_pick_table_region_cancelled(self, picker_page):
         """Test cancelled table region picking."""
-        mock_page = AsyncMock()
-        mock_page.wait_for_load_state = AsyncMock()
-        mock_page.evaluate = AsyncMock(side_effect=[
-            True,  # body_exists check
-            'Picker initialized successfully',  # script injection
-            True,  # picker_exists check
-            True,  # overlay_visible check
-            None,  # setMode call
-            None  # waitForResult (cancelled)
-        ])
+        picker_page.evaluate = _scripted_evaluate(PICKER_INIT_PREFIX + (
+            None,  # waitForResult (cancelled)
+        ))
         
-        picker = CoordinatePicker(mock_page)
+        picker = CoordinatePicker(picker_page)
         result = await picker.pick_table_region()
         
         assert result is None
         assert picker.is_active is False
 
-    @pytest.mark.asyncio
-    async def test_pick_table_region_timeout(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_pick_table_region_timeout(self, picker_page):
         """Test table region picking timeout."""
-        mock_page = AsyncMock()
-        mock_page.wait_for_load_state = AsyncMock()
-        mock_page.evaluate = AsyncMock(side_effect=[
-            True,  # body_exists check
-            'Picker initialized successfully',  # script injection
-            True,  # picker_exists check
-            True,  # overlay_visible check
-            None,  # setMode call
-            asyncio.TimeoutError()  # waitForResult timeout
-        ])
+        picker_page.evaluate = _scripted_evaluate(PICKER_INIT_PREFIX + (
+            asyncio.TimeoutError(),  # waitForResult timeout
+        ))
         
-        picker = CoordinatePicker(mock_page)
+        picker = CoordinatePicker(picker_page)
         
         with patch('asyncio.wait_for', side_effect=asyncio.TimeoutError()):
             result = await picker.pick_table_region()
@@ -131,14 +128,12 @@ class TestCoordinatePickerTableRegion:
         assert result is None
         assert picker.is_active is False
 
-    @pytest.mark.asyncio
-    async def test_pick_table_region_no_body(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_pick_table_region_no_body(self, picker_page):
         """Test picking when page body doesn't exist."""
-        mock_page = AsyncMock()
-        mock_page.wait_for_load_state = AsyncMock()
-        mock_page.evaluate = AsyncMock(return_value=False)  # body_exists = False
+        picker_page.evaluate = AsyncMock(return_value=False)  # body_exists = False
         
-        picker = CoordinatePicker(mock_page)
+        picker = CoordinatePicker(picker_page)
         
         # The exception is caught and handled, returning None
         result = await picker.pick_table_region()
@@ -146,19 +141,17 @@ class TestCoordinatePickerTableRegion:
         assert result is None
         assert picker.is_active is False
 
-    @pytest.mark.asyncio
-    async def test_pick_table_region_picker_not_created(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_pick_table_region_picker_not_created(self, picker_page):
         """Test when picker script fails to create picker."""
-        mock_page = AsyncMock()
-        mock_page.wait_for_load_state = AsyncMock()
-        mock_page.evaluate = AsyncMock(side_effect=[
+        picker_page.evaluate = _scripted_evaluate([
             True,  # body_exists check
             'Picker initialized successfully',  # script injection
             False,  # picker_exists check fails
             None  # stop_picking cleanup call
         ])
         
-        picker = CoordinatePicker(mock_page)
+        picker = CoordinatePicker(picker_page)
         
         # The exception is caught and handled, returning None
         result = await picker.pick_table_region()
@@ -167,40 +160,13 @@ class TestCoordinatePickerTableRegion:
         assert picker.is_active is False
 
 
-class TestCoordinatePickerButtonPosition:
-    """Test button position picking functionality."""
-
-    @pytest.mark.asyncio
-    async def test_pick_button_position_success(self):
-        """Test successful button position picking."""
-        mock_page = AsyncMock()
-        mock_page.wait_for_load_state = AsyncMock()
-        mock_page.evaluate = AsyncMock(side_effect=[
-            True,  # body_exists check
-            'Picker initialized successfully',  # script injection
-            True,  # picker_exists check
-            True,  # overlay_visible check
-            None,  # setMode call
-            {'x': 150, 'y': 250}  # waitForResult
-        ])
-        
-        picker = CoordinatePicker(mock_page)
-        result = await picker.pick_button_position()
-        
-        assert result is not None
-        assert result['x'] == 150
-        assert result['y'] == 250
-        assert 'width' not in result
-        assert 'height' not in result
-
-
 class TestCoordinatePickerStopPicking:
     """Test stop picking functionality."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_stop_picking_when_active(self):
         """Test stopping picker when active."""
-        mock_page = AsyncMock()
+        mock_page = MagicMock()
         mock_page.evaluate = AsyncMock()
         
         picker = CoordinatePicker(mock_page)
@@ -212,10 +178,10 @@ class TestCoordinatePickerStopPicking:
         assert 'destroy' in mock_page.evaluate.call_args[0][0]
         assert picker.is_active is False
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_stop_picking_when_inactive(self):
         """Test stopping picker when not active."""
-        mock_page = AsyncMock()
+        mock_page = MagicMock()
         mock_page.evaluate = AsyncMock()
         
         picker = CoordinatePicker(mock_page)
@@ -227,10 +193,10 @@ class TestCoordinatePickerStopPicking:
         mock_page.evaluate.assert_not_called()
         assert picker.is_active is False
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_stop_picking_handles_exception(self):
         """Test stop picking handles exceptions gracefully."""
-        mock_page = AsyncMock()
+        mock_page = MagicMock()
         mock_page.evaluate = AsyncMock(side_effect=Exception("Page closed"))
         
         picker = CoordinatePicker(mock_page)
@@ -245,36 +211,28 @@ class TestCoordinatePickerStopPicking:
 class TestCoordinatePickerConcurrency:
     """Test concurrent picker usage."""
 
-    @pytest.mark.asyncio
-    async def test_multiple_picks_sequential(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_multiple_picks_sequential(self, picker_page):
         """Test multiple sequential picks."""
-        mock_page = AsyncMock()
-        mock_page.wait_for_load_state = AsyncMock()
-        mock_page.evaluate = AsyncMock(side_effect=[
-            # First pick
-            True, 'Picker initialized', True, True, None, {'x': 100, 'y': 200, 'width': 300, 'height': 250},
-            # Second pick
-            True, 'Picker initialized', True, True, None, {'x': 200, 'y': 300, 'width': 400, 'height': 350},
-        ])
+        picker_page.evaluate = _scripted_evaluate(
+            PICKER_INIT_PREFIX + (_TABLE_RESULT,)
+            + PICKER_INIT_PREFIX + (_NEXT_TABLE_RESULT,)
+        )
         
-        picker = CoordinatePicker(mock_page)
+        picker = CoordinatePicker(picker_page)
         
         result1 = await picker.pick_table_region()
         result2 = await picker.pick_table_region()
         
-        assert result1['x'] == 100
-        assert result2['x'] == 200
+        assert result1 is _TABLE_RESULT
+        assert result2 is _NEXT_TABLE_RESULT
 
-    @pytest.mark.asyncio
-    async def test_picker_stops_previous_when_active(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_picker_stops_previous_when_active(self, picker_page):
         """Test that picker stops previous instance when starting new one."""
-        mock_page = AsyncMock()
-        mock_page.wait_for_load_state = AsyncMock()
-        mock_page.evaluate = AsyncMock(side_effect=[
-            True, 'Picker initialized', True, True, None, {'x': 100, 'y': 200, 'width': 300, 'height': 250}
-        ])
+        picker_page.evaluate = _scripted_evaluate(PICKER_INIT_PREFIX + (_TABLE_RESULT,))
         
-        picker = CoordinatePicker(mock_page)
+        picker = CoordinatePicker(picker_page)
         picker.is_active = True
         
         # Should call stop_picking first
@@ -284,38 +242,27 @@ class TestCoordinatePickerConcurrency:
 
 
 class TestCoordinatePickerModes:
-    """Test different picker modes."""
-
-    @pytest.mark.asyncio
-    async def test_pick_timer_region(self):
-        """Test timer region picking."""
-        mock_page = AsyncMock()
-        mock_page.wait_for_load_state = AsyncMock()
-        mock_page.evaluate = AsyncMock(side_effect=[
-            True, 'Picker initialized', True, True, None, {'x': 50, 'y': 50, 'width': 100, 'height': 50}
-        ])
-        
-        picker = CoordinatePicker(mock_page)
-        result = await picker.pick_timer_region()
-        
-        assert result is not None
-        # Verify setMode was called with 'timer'
-        calls = [call[0][0] for call in mock_page.evaluate.call_args_list if 'setMode' in str(call)]
-        assert any('timer' in str(call) for call in calls)
-
-    @pytest.mark.asyncio
-    async def test_pick_score_region(self):
-        """Test score region picking."""
-        mock_page = AsyncMock()
-        mock_page.wait_for_load_state = AsyncMock()
-        mock_page.evaluate = AsyncMock(side_effect=[
-            True, 'Picker initialized', True, True, None, {'x': 50, 'y': 50, 'width': 100, 'height': 50}
-        ])
-        
-        picker = CoordinatePicker(mock_page)
-        result = await picker.pick_score_region()
-        
-        assert result is not None
-        # Verify setMode was called with 'score'
-        calls = [call[0][0] for call in mock_page.evaluate.call_args_list if 'setMode' in str(call)]
-        assert any('score' in str(call) for call in calls)
+    """Test the picker in each mode."""
+
+    @pytest.mark.parametrize("method_name,mode,expected", [
+        ("pick_table_region", "table", _TABLE_RESULT),
+        ("pick_button_position", "button", _BUTTON_RESULT),
+        ("pick_timer_region", "timer", _REGION_RESULT),
+        ("pick_score_region", "score", _REGION_RESULT),
+    ])
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_pick_region(self, picker_page, method_name, mode, expected):
+        """Test successful picking returns the picked coordinates."""
+        picker_page.evaluate = AsyncMock(side_effect=PICKER_INIT_PREFIX + (expected,))
+        
+        picker = CoordinatePicker(picker_page)
+        result = await getattr(picker, method_name)()
+        
+        assert result is expected
+        assert picker.is_active is False
+        # Verify setMode was called with this mode
+        mode_arg = f"'{mode}'"
+        assert any(
+            'setMode' in s and mode_arg in s
+            for s in (str(c) for c in picker_page.evaluate.call_args_list)
+        )
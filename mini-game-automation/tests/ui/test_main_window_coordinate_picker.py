@@ -8,33 +8,51 @@ including event loop handling and UI callbacks.
 import pytest
 import asyncio
 import threading
-from unittest.mock import MagicMock, AsyncMock, patch, call
+from contextlib import ExitStack
+from unittest.mock import Mock, MagicMock, AsyncMock, patch, call
 from tkinter import Tk
 
 from src.automation.ui.main_window import TableConfigWindow
 from src.automation.ui.coordinate_picker import CoordinatePicker
 
+# Tk is not safe to share across workers; keep this module on one xdist worker
+pytestmark = pytest.mark.xdist_group(name="tk")
 
-class TestTableConfigWindowCoordinatePickerIntegration:
-    """Test TableConfigWindow coordinate picker integration."""
 
-    @pytest.fixture
-    def mock_parent(self):
-        """Create a mock parent window."""
-        parent = MagicMock()
-        return parent
+@pytest.fixture(scope="module")
+def tk_root():
+    """Create one hidden Tk root shared by every window in this module."""
+    root = Tk()
+    root.withdraw()
+    yield root
+    root.destroy()
+
+
+@pytest.fixture
+def mock_browser_page():
+    """Create a mock browser page."""
+    page = AsyncMock()
+    page.url = "https://example.com"
+    return page
+
 
-    @pytest.fixture
-    def mock_browser_page(self):
-        """Create a mock browser page."""
-        page = AsyncMock()
-        page.url = "https://example.com"
-        return page
+@pytest.fixture
+def window(tk_root):
+    """Create a TableConfigWindow on the shared root with a mocked toplevel."""
+    w = TableConfigWindow(tk_root, browser_page=MagicMock())
+    toplevel = w.window
+    w.window = MagicMock()
+    w.window.after = MagicMock()
+    yield w
+    w._pick_pool.shutdown(wait=False)
+    toplevel.destroy()
+
+
+class TestTableConfigWindowCoordinatePickerIntegration:
+    """Test TableConfigWindow coordinate picker integration."""
 
-    def test_get_browser_event_loop_method_exists(self, mock_parent):
+    def test_get_browser_event_loop_method_exists(self, window):
         """Test that get_browser_event_loop method is set."""
-        window = TableConfigWindow(mock_parent, browser_page=MagicMock())
-        
         # Simulate setting the method (as done in main.py)
         mock_loop = MagicMock()
         window.get_browser_event_loop = lambda: mock_loop
@@ -42,11 +60,9 @@ class TestTableConfigWindowCoordinatePickerIntegration:
         assert callable(window.get_browser_event_loop)
         assert window.get_browser_event_loop() == mock_loop
 
-    def test_pick_table_region_without_browser_page(self, mock_parent):
+    def test_pick_table_region_without_browser_page(self, window):
         """Test pick_table_region when browser page is not available."""
-        window = TableConfigWindow(mock_parent, browser_page=None)
-        window.window = MagicMock()
-        window.window.after = MagicMock()
+        window.browser_page = None
         
         # Mock messagebox
         with patch('src.automation.ui.main_window.messagebox') as mock_msgbox:
@@ -55,32 +71,25 @@ class TestTableConfigWindowCoordinatePickerIntegration:
             # Should show warning
             window.window.after.assert_called()
 
-    def test_pick_table_region_without_event_loop(self, mock_parent, mock_browser_page):
+    def test_pick_table_region_without_event_loop(self, window, mock_browser_page):
         """Test pick_table_region when event loop is not available."""
-        window = TableConfigWindow(mock_parent, browser_page=mock_browser_page)
-        window.window = MagicMock()
-        window.window.after = MagicMock()
+        window.browser_page = mock_browser_page
         
         # Don't set get_browser_event_loop
         window.get_browser_event_loop = None
         
         with patch('src.automation.ui.main_window.messagebox') as mock_msgbox:
             window._pick_table_region()
+            window._pick_pool.shutdown(wait=True)
             
-            # Should schedule error message
+            # Instructions shown before the pick, then error message scheduled
+            mock_msgbox.showinfo.assert_called_once()
             window.window.after.assert_called()
 
-    def test_apply_table_region(self, mock_parent):
+    def test_apply_table_region(self, window):
         """Test applying picked table region to form."""
-        window = TableConfigWindow(mock_parent, browser_page=MagicMock())
-        
         # Create mock coordinate variables
-        window.coord_vars = {
-            'x': MagicMock(),
-            'y': MagicMock(),
-            'width': MagicMock(),
-            'height': MagicMock()
-        }
+        window.coord_vars = {k: Mock(spec=['set']) for k in ('x', 'y', 'width', 'height')}
         window.status_var = MagicMock()
         
         result = {'x': 100, 'y': 200, 'width': 300, 'height': 250}
@@ -95,11 +104,9 @@ class TestTableConfigWindowCoordinatePickerIntegration:
             window.coord_vars['height'].set.assert_called_once_with('250')
             window.status_var.set.assert_called_once_with('✓ Table region captured')
 
-    def test_pick_button_without_browser_page(self, mock_parent):
+    def test_pick_button_without_browser_page(self, window):
         """Test pick_button when browser page is not available."""
-        window = TableConfigWindow(mock_parent, browser_page=None)
-        window.window = MagicMock()
-        window.window.after = MagicMock()
+        window.browser_page = None
         
         with patch('src.automation.ui.main_window.messagebox') as mock_msgbox:
             window._pick_button('start')
@@ -107,11 +114,9 @@ class TestTableConfigWindowCoordinatePickerIntegration:
             # Should show warning
             window.window.after.assert_called()
 
-    def test_pick_button_without_event_loop(self, mock_parent, mock_browser_page):
+    def test_pick_button_without_event_loop(self, window, mock_browser_page):
         """Test pick_button when event loop is not available."""
-        window = TableConfigWindow(mock_parent, browser_page=mock_browser_page)
-        window.window = MagicMock()
-        window.window.after = MagicMock()
+        window.browser_page = mock_browser_page
         window.get_browser_event_loop = None
         
         with patch('src.automation.ui.main_window.messagebox') as mock_msgbox:
@@ -124,18 +129,16 @@ class TestTableConfigWindowCoordinatePickerIntegration:
 class TestTableConfigWindowErrorHandling:
     """Test error handling in TableConfigWindow coordinate picker."""
 
-    def test_pick_table_region_exception_handling(self, mock_parent):
+    def test_pick_table_region_exception_handling(self, window):
         """Test exception handling in pick_table_region."""
-        window = TableConfigWindow(mock_parent, browser_page=MagicMock())
-        window.window = MagicMock()
-        window.window.after = MagicMock()
-        
         loop = MagicMock()
         window.get_browser_event_loop = lambda: loop
         
-        with patch('src.automation.ui.main_window.CoordinatePicker', side_effect=Exception("Test error")):
-            with patch('src.automation.ui.main_window.messagebox') as mock_msgbox:
-                window._pick_table_region()
-                
-                # Should schedule error message
-                window.window.after.assert_called()
+        with ExitStack() as stack:
+            stack.enter_context(patch('src.automation.ui.main_window.CoordinatePicker', side_effect=Exception("Test error")))
+            stack.enter_context(patch('src.automation.ui.main_window.messagebox'))
+            window._pick_table_region()
+            window._pick_pool.shutdown(wait=True)
+            
+            # Should schedule error message
+            window.window.after.assert_called()
@@ -0,0 +1,58 @@
+"""
+Unit tests for the MainWindow start confirmation flow.
+
+The window is built without Tk: widgets are mocks and _confirm records
+the callbacks instead of opening a dialog.
+"""
+
+import tkinter as tk
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.automation.ui.main_window import MainWindow
+
+
+@pytest.fixture
+def window():
+    """Create a MainWindow with mocked widgets and a recording _confirm."""
+    w = MainWindow.__new__(MainWindow)
+    w.browser_opened = True
+    w.is_running = False
+    w.on_start = MagicMock()
+    w.log = MagicMock()
+    for name in ("start_button", "stop_button", "open_browser_button", "configure_tables_button"):
+        setattr(w, name, MagicMock())
+    w.confirms = []
+    w._confirm = lambda title, message, on_yes, on_no=None: w.confirms.append((on_yes, on_no))
+    return w
+
+
+class TestStartConfirmation:
+    """Test the start button while the confirm dialog is open."""
+
+    def test_start_disabled_while_confirming(self, window):
+        """Test clicking Start disables it until the dialog is answered."""
+        window._on_start_clicked()
+
+        window.start_button.config.assert_called_with(state=tk.DISABLED)
+        assert len(window.confirms) == 1
+
+    def test_no_restores_start(self, window):
+        """Test answering No re-enables Start."""
+        window._on_start_clicked()
+        _, on_no = window.confirms[0]
+        on_no()
+
+        window.start_button.config.assert_called_with(state=tk.NORMAL)
+        window.on_start.assert_not_called()
+
+    def test_start_automation_runs_once(self, window):
+        """Test two Yes answers start automation only once."""
+        window._on_start_clicked()
+        window._on_start_clicked()
+        for on_yes, _ in window.confirms:
+            on_yes()
+
+        window.on_start.assert_called_once()
+        assert window.is_running is True
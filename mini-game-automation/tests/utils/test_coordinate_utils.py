@@ -4,15 +4,29 @@ Unit tests for CoordinateUtils (Epic 1).
 Tests coordinate calculations and canvas offset handling.
 """
 
+import copy
+import pickle
+
 import pytest
 from src.automation.utils.coordinate_utils import (
     CoordinateUtils,
     Point,
     Region,
+    RegionArray,
     create_button_coordinates,
+    create_button_xy,
     CANVAS_TRANSFORM_OFFSET_X,
 )
 
+# Shared sample region; Region is immutable so tests can reuse it
+REGION = Region(x=100, y=200, width=300, height=250)
+
+
+@pytest.fixture(scope="module")
+def utils():
+    """Default CoordinateUtils shared by the module; its methods don't mutate it."""
+    return CoordinateUtils()
+
 
 class TestPoint:
     """Test Point dataclass."""
@@ -35,95 +49,127 @@ class TestRegion:
         assert region.width == 300
         assert region.height == 250
 
-    def test_region_right(self):
-        """Test right edge calculation."""
-        region = Region(x=100, y=200, width=300, height=250)
-        assert region.right == 400
-
-    def test_region_bottom(self):
-        """Test bottom edge calculation."""
-        region = Region(x=100, y=200, width=300, height=250)
-        assert region.bottom == 450
-
-    def test_region_center(self):
-        """Test center point calculation."""
-        region = Region(x=100, y=200, width=300, height=250)
-        center = region.center
-        assert center.x == 250  # 100 + 300/2
-        assert center.y == 325  # 200 + 250/2
+    @pytest.mark.parametrize("attr,expected", [
+        ("right", 400),
+        ("bottom", 450),
+        ("center", Point(250, 325)),  # (100 + 300/2, 200 + 250/2)
+    ])
+    def test_region_scalar_props(self, attr, expected):
+        """Test edge and center calculation."""
+        assert getattr(REGION, attr) == expected
 
     def test_region_contains(self):
         """Test point containment check."""
-        region = Region(x=100, y=200, width=300, height=250)
-        
         # Point inside
-        assert region.contains(Point(200, 300)) is True
+        assert REGION.contains(Point(200, 300)) is True
         
         # Point outside
-        assert region.contains(Point(50, 100)) is False
-        assert region.contains(Point(500, 300)) is False
+        assert REGION.contains(Point(50, 100)) is False
+        assert REGION.contains(Point(500, 300)) is False
         
         # Point on edge (should be inside)
-        assert region.contains(Point(100, 200)) is True
-        assert region.contains(Point(399, 449)) is True
+        assert REGION.contains(Point(100, 200)) is True
+        assert REGION.contains(Point(399, 449)) is True
+
+    def test_region_contains_batch(self):
+        """Test batched containment matches contains()."""
+        points = [(200, 300), (50, 100), (500, 300), (100, 200), (399, 449), (400, 449)]
+
+        assert REGION.contains_batch(points) == [
+            REGION.contains(Point(px, py)) for px, py in points
+        ]
+
+    def test_region_contains_batch_numpy(self):
+        """Test batched containment on an (N, 2) array."""
+        np = pytest.importorskip("numpy")
+
+        points = np.array([[200, 300], [50, 100], [100, 200], [400, 449]], dtype=np.int32)
+
+        assert REGION.contains_batch(points).tolist() == [True, False, True, False]
 
     def test_region_to_dict(self):
         """Test region to dictionary conversion."""
-        region = Region(x=100, y=200, width=300, height=250)
-        data = region.to_dict()
+        data = REGION.to_dict()
         assert data == {"x": 100, "y": 200, "width": 300, "height": 250}
 
     def test_region_from_dict(self):
         """Test creating region from dictionary."""
         data = {"x": 100, "y": 200, "width": 300, "height": 250}
-        region = Region.from_dict(data)
-        assert region.x == 100
-        assert region.y == 200
-        assert region.width == 300
-        assert region.height == 250
+        assert Region.from_dict(data) == REGION
+
+    def test_region_is_immutable(self):
+        """Test that cached edges cannot go stale through mutation."""
+        region = Region(x=100, y=200, width=300, height=250)
+        with pytest.raises(AttributeError):
+            region.x = 0
+        assert region.right == 400
+
+    @pytest.mark.parametrize("clone", [
+        copy.copy,
+        copy.deepcopy,
+        lambda obj: pickle.loads(pickle.dumps(obj)),
+    ], ids=["copy", "deepcopy", "pickle"])
+    def test_region_copy_and_pickle(self, clone):
+        """Test copies restore every slot, including the cached edges."""
+        region = clone(REGION)
+
+        assert region == REGION
+        assert (region.right, region.bottom, region.center) == (400, 450, Point(250, 325))
+        assert clone(Point(1, 2)) == Point(1, 2)
+        with pytest.raises(AttributeError):
+            region.x = 0
 
 
 class TestCoordinateUtils:
     """Test CoordinateUtils class."""
 
-    def test_calculate_absolute_coordinates(self):
-        """Test absolute coordinate calculation."""
-        utils = CoordinateUtils()
-        
-        canvas_box = {"x": 0, "y": 0, "width": 1920, "height": 1080}
+    @pytest.mark.parametrize("canvas_box,table_region,button,expected", [
+        # 0 + 100 + 50 + 17, 0 + 200 + 30 + 0
+        ({"x": 0, "y": 0, "width": 1920, "height": 1080},
+         {"x": 100, "y": 200, "width": 300, "height": 250}, (50, 30), (167, 230)),
+        # Only the 17px canvas offset
+        ({"x": 0, "y": 0, "width": 1920, "height": 1080},
+         {"x": 0, "y": 0, "width": 300, "height": 250}, (0, 0), (CANVAS_TRANSFORM_OFFSET_X, 0)),
+        # 10 + 100 + 50 + 17, 20 + 200 + 30
+        ({"x": 10, "y": 20, "width": 1920, "height": 1080},
+         {"x": 100, "y": 200, "width": 300, "height": 250}, (50, 30), (177, 250)),
+    ])
+    def test_calculate_absolute_coordinates(self, utils, canvas_box, table_region, button, expected):
+        """Test absolute coordinate calculation, including the canvas offset."""
+        assert utils.calculate_absolute_coordinates(
+            canvas_box, table_region, *button
+        ) == expected
+
+    def test_calculate_absolute_coordinates_batch(self, utils):
+        """Test batch calculation matches per-button calculation."""
+        canvas_box = {"x": 10, "y": 20, "width": 1920, "height": 1080}
         table_region = {"x": 100, "y": 200, "width": 300, "height": 250}
-        button_x = 50
-        button_y = 30
-        
-        abs_x, abs_y = utils.calculate_absolute_coordinates(
-            canvas_box, table_region, button_x, button_y
-        )
-        
-        # Expected: 0 + 100 + 50 + 17 = 167
-        assert abs_x == 167
-        # Expected: 0 + 200 + 30 + 0 = 230
-        assert abs_y == 230
-
-    def test_canvas_offset_applied(self):
-        """Test that canvas offset (17px) is applied."""
-        utils = CoordinateUtils()
-        
-        canvas_box = {"x": 0, "y": 0, "width": 1920, "height": 1080}
-        table_region = {"x": 0, "y": 0, "width": 300, "height": 250}
-        button_x = 0
-        button_y = 0
-        
-        abs_x, abs_y = utils.calculate_absolute_coordinates(
-            canvas_box, table_region, button_x, button_y
+        buttons = [(50, 30), (150, 30), (0, 0)]
+
+        expected = [
+            utils.calculate_absolute_coordinates(canvas_box, table_region, x, y)
+            for x, y in buttons
+        ]
+        assert utils.calculate_absolute_coordinates_batch(
+            canvas_box, table_region, buttons
+        ) == expected
+
+    def test_calculate_absolute_coordinates_batch_numpy(self, utils):
+        """Test batch calculation on an (N, 2) array keeps the dtype."""
+        np = pytest.importorskip("numpy")
+
+        canvas_box = {"x": 10, "y": 20, "width": 1920, "height": 1080}
+        table_region = {"x": 100, "y": 200, "width": 300, "height": 250}
+        buttons = np.array([[50, 30], [150, 30]], dtype=np.int32)
+
+        result = utils.calculate_absolute_coordinates_batch(
+            canvas_box, table_region, buttons
         )
-        
-        assert abs_x == CANVAS_TRANSFORM_OFFSET_X  # 17
-        assert abs_y == 0
+        assert result.dtype == np.int32
+        assert result.tolist() == [[177, 250], [277, 250]]
 
-    def test_get_click_coordinates(self):
+    def test_get_click_coordinates(self, utils):
         """Test getting click coordinates from button coords dict."""
-        utils = CoordinateUtils()
-        
         canvas_box = {"x": 10, "y": 20, "width": 1920, "height": 1080}
         table_region = {"x": 100, "y": 200, "width": 300, "height": 250}
         button_coords = {"x": 50, "y": 30}
@@ -135,10 +181,8 @@ class TestCoordinateUtils:
         assert abs_x == 177  # 10 + 100 + 50 + 17
         assert abs_y == 250  # 20 + 200 + 30
 
-    def test_get_region_screenshot_coords(self):
+    def test_get_region_screenshot_coords(self, utils):
         """Test getting screenshot coordinates for region."""
-        utils = CoordinateUtils()
-        
         canvas_box = {"x": 10, "y": 20, "width": 1920, "height": 1080}
         table_region = {"x": 100, "y": 200, "width": 300, "height": 250}
         
@@ -149,10 +193,38 @@ class TestCoordinateUtils:
         assert coords["width"] == 300
         assert coords["height"] == 250
 
-    def test_get_subregion_coords(self):
+    def test_region_array_soa(self, utils):
+        """Test RegionArray round-trips dicts and offsets column-wise."""
+        canvas_box = {"x": 50, "y": 100, "width": 800, "height": 600}
+        tables = [
+            {"x": 100, "y": 200, "width": 300, "height": 250},
+            {"x": 450, "y": 200, "width": 300, "height": 250},
+        ]
+
+        regions = RegionArray.from_dicts(tables)
+        assert len(regions) == 2
+        assert regions.to_dicts() == tables
+        assert regions[1] == Region(450, 200, 300, 250)
+
+        shots = utils.get_region_screenshot_coords_batch(canvas_box, regions)
+        assert shots.to_dicts() == [
+            utils.get_region_screenshot_coords(canvas_box, table) for table in tables
+        ]
+        assert regions.to_dicts() == tables
+
+        with pytest.raises(ValueError):
+            RegionArray([1, 2], [1], [1], [1])
+
+    def test_region_array_numpy_view(self):
+        """Test RegionArray columns can be viewed as NumPy arrays."""
+        np = pytest.importorskip("numpy")
+        regions = RegionArray([100, 450], [200, 200], [300, 300], [250, 250])
+
+        xs = np.frombuffer(regions.xs, dtype=np.int32)
+        assert xs.tolist() == [100, 450]
+
+    def test_get_subregion_coords(self, utils):
         """Test getting subregion coordinates."""
-        utils = CoordinateUtils()
-        
         subregion = {"x": 50, "y": 30, "width": 100, "height": 80}
         
         coords = utils.get_subregion_coords(300, 250, subregion)
@@ -162,10 +234,8 @@ class TestCoordinateUtils:
         assert coords["right"] == 150  # 50 + 100
         assert coords["lower"] == 110  # 30 + 80
 
-    def test_get_subregion_coords_raises_on_invalid(self):
+    def test_get_subregion_coords_raises_on_invalid(self, utils):
         """Test subregion validation raises ValueError."""
-        utils = CoordinateUtils()
-        
         # Subregion exceeds width
         with pytest.raises(ValueError):
             utils.get_subregion_coords(
@@ -178,10 +248,38 @@ class TestCoordinateUtils:
                 300, 250, {"x": 0, "y": 200, "width": 100, "height": 100}
             )
 
-    def test_validate_canvas_position_no_drift(self):
+    def test_get_subregion_coords_batch(self, utils):
+        """Test batched crop boxes and bounds check."""
+        boxes = utils.get_subregion_coords_batch(
+            300, 250, [(50, 30, 100, 80), (0, 0, 300, 250)]
+        )
+        assert boxes == [(50, 30, 150, 110), (0, 0, 300, 250)]
+
+        with pytest.raises(ValueError):
+            utils.get_subregion_coords_batch(300, 250, [(250, 0, 100, 50)])
+
+        with pytest.raises(ValueError, match="Subregion 1 exceeds image height"):
+            utils.get_subregion_coords_batch(
+                300, 250, [(0, 0, 10, 10), (0, 200, 100, 100)]
+            )
+
+    def test_get_subregion_coords_batch_numpy(self, utils):
+        """Test batched crop boxes on an (N, 4) array."""
+        np = pytest.importorskip("numpy")
+
+        subs = np.array([[50, 30, 100, 80], [10, 20, 30, 40]], dtype=np.int32)
+        boxes = utils.get_subregion_coords_batch(300, 250, subs)
+
+        assert boxes.tolist() == [[50, 30, 150, 110], [10, 20, 40, 60]]
+        assert subs.tolist() == [[50, 30, 100, 80], [10, 20, 30, 40]]
+
+        with pytest.raises(ValueError):
+            utils.get_subregion_coords_batch(
+                300, 250, np.array([[0, 200, 100, 100]], dtype=np.int32)
+            )
+
+    def test_validate_canvas_position_no_drift(self, utils):
         """Test canvas position validation with no drift."""
-        utils = CoordinateUtils()
-        
         original_box = {"x": 0, "y": 0, "width": 1920, "height": 1080}
         current_box = {"x": 0, "y": 0, "width": 1920, "height": 1080}
         
@@ -189,10 +287,8 @@ class TestCoordinateUtils:
         assert is_valid is True
         assert error is None
 
-    def test_validate_canvas_position_with_drift(self):
+    def test_validate_canvas_position_with_drift(self, utils):
         """Test canvas position validation detects drift."""
-        utils = CoordinateUtils()
-        
         original_box = {"x": 0, "y": 0, "width": 1920, "height": 1080}
         current_box = {"x": 10, "y": 0, "width": 1920, "height": 1080}  # 10px X drift
         
@@ -203,6 +299,30 @@ class TestCoordinateUtils:
         assert error is not None
         assert "drifted" in error.lower()
 
+    def test_validate_canvas_position_batch(self, utils):
+        """Test batched drift checks match validate_canvas_position."""
+        original = {"x": 100, "y": 200, "width": 1920, "height": 1080}
+        samples = [
+            {"x": 100, "y": 200, "width": 1920, "height": 1080},
+            {"x": 105, "y": 195, "width": 1920, "height": 1080},
+            {"x": 110, "y": 200, "width": 1920, "height": 1080},
+            {"x": 100, "y": 194, "width": 1920, "height": 1080},
+        ]
+
+        assert utils.validate_canvas_position_batch(original, samples) == [
+            utils.validate_canvas_position(original, box)[0] for box in samples
+        ]
+
+    def test_validate_canvas_position_batch_numpy(self, utils):
+        """Test batched drift checks on an (N, 2) array."""
+        np = pytest.importorskip("numpy")
+        original = {"x": 100, "y": 200, "width": 1920, "height": 1080}
+
+        samples = np.array([[100, 200], [105, 195], [110, 200], [100, 194]], dtype=np.int32)
+        valid = utils.validate_canvas_position_batch(original, samples)
+
+        assert valid.tolist() == [True, True, False, False]
+
     def test_custom_offset(self):
         """Test using custom offset values."""
         utils = CoordinateUtils(offset_x=20, offset_y=5)
@@ -234,3 +354,26 @@ class TestCreateButtonCoordinates:
         assert coords["red"] == {"x": 30, "y": 40}
         assert coords["confirm"] == {"x": 50, "y": 60}
         assert coords["cancel"] == {"x": 70, "y": 80}
+
+    def test_create_button_coordinates_tuple(self, utils):
+        """Test the compact (x, y) tuple form and its click coordinates."""
+        coords = create_button_xy(
+            blue_x=10, blue_y=20,
+            red_x=30, red_y=40,
+            confirm_x=50, confirm_y=60,
+            cancel_x=70, cancel_y=80,
+        )
+        nested = create_button_coordinates(10, 20, 30, 40, 50, 60, 70, 80)
+
+        assert dict(coords) == {
+            "blue": (10, 20), "red": (30, 40), "confirm": (50, 60), "cancel": (70, 80),
+        }
+        with pytest.raises(TypeError):
+            coords["blue"] = (0, 0)
+
+        canvas_box = {"x": 10, "y": 20, "width": 1920, "height": 1080}
+        table_region = {"x": 100, "y": 200, "width": 300, "height": 250}
+        for name, xy in coords.items():
+            assert utils.get_click_coordinates(canvas_box, table_region, xy) == (
+                utils.get_click_coordinates(canvas_box, table_region, nested[name])
+            )
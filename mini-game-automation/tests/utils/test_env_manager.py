@@ -0,0 +1,104 @@
+"""
+Unit tests for EnvManager.
+
+Tests .env parsing, saving and the GAME_URL helpers.
+"""
+
+import os
+
+import pytest
+from unittest.mock import patch
+
+from src.automation.utils.env_manager import EnvManager
+
+
+class TestEnvParsing:
+    """Test parsing of .env lines."""
+
+    @pytest.mark.parametrize("line,expected", [
+        ("GAME_URL=https://game.example.com/#/lobby", "https://game.example.com/#/lobby"),
+        ('GAME_URL="https://game.example.com/#/lobby"', "https://game.example.com/#/lobby"),
+        ("GAME_URL='https://game.example.com/ lobby'", "https://game.example.com/ lobby"),
+        ("GAME_URL=https://game.example.com/  # main table", "https://game.example.com/"),
+        ('GAME_URL="https://game.example.com/" # main table', "https://game.example.com/"),
+        ("  GAME_URL = https://game.example.com/  ", "https://game.example.com/"),
+        ("GAME_URL=", ""),
+    ])
+    def test_parse_value(self, tmp_path, line, expected):
+        """Test bare, quoted and commented values."""
+        env_file = tmp_path / ".env"
+        env_file.write_text(f"# comment\n{line}\n", encoding="utf-8")
+
+        assert EnvManager(str(env_file)).load_env() == {"GAME_URL": expected}
+
+
+class TestEnvSaving:
+    """Test saving values and the GAME_URL helpers."""
+
+    @pytest.fixture(autouse=True)
+    def _no_system_game_url(self, monkeypatch):
+        """Keep a GAME_URL from the real environment out of these tests."""
+        monkeypatch.delenv("GAME_URL", raising=False)
+
+    def test_game_url_round_trip(self, tmp_path, monkeypatch):
+        """Test save_game_url then load_game_url in the current directory."""
+        monkeypatch.chdir(tmp_path)
+        url = "https://game.example.com/#/lobby"
+
+        assert EnvManager.save_game_url(url) is True
+        assert EnvManager.load_game_url() == url
+        assert (tmp_path / ".env").exists()
+
+    def test_game_url_follows_current_directory(self, tmp_path, monkeypatch):
+        """Test the default .env is resolved per call, not at import."""
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+
+        monkeypatch.chdir(first)
+        EnvManager.save_game_url("https://one.example.com/")
+        monkeypatch.chdir(second)
+        assert EnvManager.load_game_url() is None
+        EnvManager.save_game_url("https://two.example.com/")
+
+        assert EnvManager(str(first / ".env")).get("GAME_URL") == "https://one.example.com/"
+        assert EnvManager(str(second / ".env")).get("GAME_URL") == "https://two.example.com/"
+
+    def test_get_reads_environment_live(self, tmp_path, monkeypatch):
+        """Test environment changes after the first get() are seen."""
+        monkeypatch.chdir(tmp_path)
+        assert EnvManager.load_game_url() is None
+
+        monkeypatch.setenv("GAME_URL", "https://env.example.com/")
+        assert EnvManager.load_game_url() == "https://env.example.com/"
+
+        monkeypatch.delenv("GAME_URL")
+        EnvManager.save_game_url("https://file.example.com/")
+        assert EnvManager.load_game_url() == "https://file.example.com/"
+
+    def test_set_replaces_file_atomically(self, tmp_path):
+        """Test set() writes a temp file and swaps it in with os.replace."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("OTHER=1\n", encoding="utf-8")
+        manager = EnvManager(str(env_file))
+
+        with patch("src.automation.utils.env_manager.os.replace", wraps=os.replace) as mock_replace:
+            assert manager.set("GAME_URL", "https://game.example.com/") is True
+
+        tmp_file, target = mock_replace.call_args[0]
+        assert str(tmp_file) == str(env_file) + ".tmp"
+        assert str(target) == str(env_file)
+        assert not os.path.exists(tmp_file)
+        assert manager.load_env() == {"OTHER": "1", "GAME_URL": "https://game.example.com/"}
+
+    def test_failed_replace_keeps_original(self, tmp_path):
+        """Test the existing .env is untouched if the swap fails."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("OTHER=1\n", encoding="utf-8")
+        manager = EnvManager(str(env_file))
+
+        with patch("src.automation.utils.env_manager.os.replace", side_effect=OSError("disk full")):
+            assert manager.set("GAME_URL", "https://game.example.com/") is False
+
+        assert env_file.read_text(encoding="utf-8") == "OTHER=1\n"
@@ -0,0 +1,60 @@
+"""
+Unit tests for logging setup.
+
+Tests that both formatting paths produce the LOG_FORMAT layout.
+"""
+
+import io
+import logging
+import re
+
+import pytest
+from src.automation.utils.logger import (
+    LOG_FORMAT,
+    TableContextFilter,
+    TableFormatter,
+    get_logger,
+)
+
+# [LEVEL] [YYYY-mm-dd_HH-MM-SS] [MODULE] [TABLE_ID] Message
+LINE_RE = re.compile(r"^\[INFO\] \[\d{4}-\d\d-\d\d_\d\d-\d\d-\d\d\] \[test_logger\] \[(.+?)\] hello$")
+
+
+@pytest.fixture
+def capture():
+    """Attach a StringIO handler to a throwaway logger; yields (logger, handler, stream)."""
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    logger = logging.getLogger("automation.test_logger")
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    yield logger, handler, stream
+    logger.removeHandler(handler)
+
+
+class TestFormatting:
+    """Test LOG_FORMAT output."""
+
+    def test_table_formatter(self, capture):
+        """Test TableFormatter defaults table_id and stamps the time."""
+        logger, handler, stream = capture
+        handler.setFormatter(TableFormatter())
+
+        logger.info("hello")
+
+        assert LINE_RE.match(stream.getvalue().rstrip("\n")).group(1) == "-"
+
+    def test_plain_formatter_with_filter(self, capture, monkeypatch):
+        """Test a plain Formatter(LOG_FORMAT) works with TableContextFilter."""
+        logger, handler, stream = capture
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        handler.addFilter(TableContextFilter())
+        errors = []
+        monkeypatch.setattr(handler, "handleError", errors.append)
+
+        logger.info("hello")
+        get_logger("test_logger", table_id=3).info("hello")
+
+        assert errors == []
+        lines = stream.getvalue().splitlines()
+        assert [LINE_RE.match(line).group(1) for line in lines] == ["-", "3"]
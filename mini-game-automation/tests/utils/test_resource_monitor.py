@@ -0,0 +1,65 @@
+"""
+Unit tests for ResourceMonitor.
+
+Tests CPU-based throttling decisions and status reporting.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.automation.utils.resource_monitor import ResourceMonitor
+
+
+class TestThrottleFactor:
+    """Test throttle factor calculation."""
+
+    @pytest.mark.parametrize("cpu_percent,expected", [
+        (50.0, 1.0),
+        (80.0, 1.0),
+        (85.0, 1.5),
+        (95.0, 2.0),
+    ])
+    def test_throttle_factor_uses_last_sample(self, cpu_percent, expected):
+        """Test the factor comes from the last CPU sample without re-sampling."""
+        monitor = ResourceMonitor()
+        monitor._last_cpu_percent = cpu_percent
+
+        with patch.object(monitor, "get_cpu_percent") as mock_cpu, \
+                patch("src.automation.utils.resource_monitor.psutil") as mock_psutil:
+            assert monitor.get_throttle_factor() == expected
+            assert monitor.get_adjusted_interval(200) == int(200 * expected)
+
+        mock_cpu.assert_not_called()
+        mock_psutil.virtual_memory.assert_not_called()
+
+
+class TestProcStatCpuPercent:
+    """Test CPU percentage computed from /proc/stat samples."""
+
+    def test_percent_from_two_samples(self, tmp_path):
+        """Test the busy share of the delta between two fixed samples."""
+        stat = tmp_path / "stat"
+        monitor = ResourceMonitor()
+        monitor._proc_stat_path = str(stat)
+
+        # user nice system idle iowait irq softirq steal
+        stat.write_text("cpu  100 0 50 800 50 0 0 0 0 0\ncpu0 1 2 3 4 5 6 7 8\n")
+        assert monitor.get_cpu_percent() == 0.0
+
+        # +300 total ticks, +100 idle/iowait -> 200 busy = 66.7%
+        stat.write_text("cpu  250 0 100 880 70 0 0 0 0 0\ncpu0 1 2 3 4 5 6 7 8\n")
+        assert monitor.get_cpu_percent() == 66.7
+        assert monitor._last_cpu_percent == 66.7
+
+    def test_unreadable_stat_falls_back_to_psutil(self, tmp_path):
+        """Test a malformed file disables the fast path in favour of psutil."""
+        stat = tmp_path / "stat"
+        stat.write_text("intr 1 2 3\n")
+        monitor = ResourceMonitor()
+        monitor._proc_stat_path = str(stat)
+
+        with patch("src.automation.utils.resource_monitor.psutil") as mock_psutil:
+            mock_psutil.cpu_percent.return_value = 12.5
+            assert monitor.get_cpu_percent() == 12.5
+
+        assert monitor._proc_stat_path is None
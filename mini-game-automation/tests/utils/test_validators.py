@@ -0,0 +1,81 @@
+"""
+Unit tests for TimerValidator batch checks.
+
+Tests the list and NumPy paths against the scalar methods.
+"""
+
+import pytest
+from src.automation.utils.validators import TimerValidator
+
+# Default click threshold is 6: 6 is the last countdown value, 7 the first clickable
+TIMERS = [0, 5, 6, 7, 15, 25]
+PREVIOUS = [6, 6, 7, 5, 0, 6]
+CURRENT = [25, 10, 25, 15, 11, 5]
+
+
+@pytest.fixture(scope="module")
+def validator():
+    """Default TimerValidator shared by the module; it holds no state."""
+    return TimerValidator()
+
+
+class TestIsClickableBatch:
+    """Test is_clickable_batch."""
+
+    def test_list(self, validator):
+        """Test list input matches is_clickable per value."""
+        result = validator.is_clickable_batch(TIMERS)
+        assert result == [False, False, False, True, True, True]
+        assert result == [validator.is_clickable(t) for t in TIMERS]
+
+    def test_threshold_not_clickable(self, validator):
+        """Test a timer equal to the threshold is not clickable."""
+        assert validator.is_clickable_batch([6]) == [False]
+
+    def test_empty(self, validator):
+        """Test empty input gives an empty list."""
+        assert validator.is_clickable_batch([]) == []
+
+    def test_numpy(self, validator):
+        """Test array input is compared in one vectorised operation."""
+        np = pytest.importorskip("numpy")
+        result = validator.is_clickable_batch(np.array(TIMERS))
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == validator.is_clickable_batch(TIMERS)
+
+
+class TestDetectTimerResetBatch:
+    """Test detect_timer_reset_batch."""
+
+    def test_list(self, validator):
+        """Test list input matches detect_timer_reset per pair."""
+        result = validator.detect_timer_reset_batch(PREVIOUS, CURRENT)
+        assert result == [True, False, False, True, True, False]
+        assert result == [
+            validator.detect_timer_reset(p, c) for p, c in zip(PREVIOUS, CURRENT)
+        ]
+
+    @pytest.mark.parametrize("prev,expected", [
+        (6, True),   # prev == threshold still counts as the countdown phase
+        (7, False),  # prev above threshold is not a reset
+    ])
+    def test_previous_threshold_boundary(self, validator, prev, expected):
+        """Test the prev <= threshold boundary."""
+        assert validator.detect_timer_reset_batch([prev], [25]) == [expected]
+
+    def test_reset_threshold_boundary(self, validator):
+        """Test current must be strictly above reset_threshold."""
+        assert validator.detect_timer_reset_batch([0, 0], [10, 11]) == [False, True]
+
+    def test_numpy(self, validator):
+        """Test array input matches the list path."""
+        np = pytest.importorskip("numpy")
+        result = validator.detect_timer_reset_batch(np.array(PREVIOUS), np.array(CURRENT))
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == validator.detect_timer_reset_batch(PREVIOUS, CURRENT)
+
+    def test_numpy_previous_threshold_boundary(self, validator):
+        """Test the prev <= threshold boundary on the array path."""
+        np = pytest.importorskip("numpy")
+        result = validator.detect_timer_reset_batch(np.array([6, 7]), np.array([25, 25]))
+        assert result.tolist() == [True, False]